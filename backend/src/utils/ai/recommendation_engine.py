@@ -11,58 +11,156 @@ Features:
 - Skill-based matching with weighted scoring
 - Learning from saved jobs and applications
 
-No external APIs required - pure Python implementation.
+No external APIs required - pure Python implementation. NumPy, when
+installed, is used for vectorized catalog scoring, and orjson, when
+installed, for faster JSON input and output.
 """
 
+import bisect
+import hashlib
+import heapq
 import json
+import mmap
+import multiprocessing
+import os
+import random
 import sys
+import time
 import math
 import re
-from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+import struct
+import zlib
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Dict, Iterator, List, Tuple, Optional
 import argparse
+from array import array
+from datetime import datetime
+
+# Optional vectorized scoring
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional sparse matrix products for text similarity
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+# Optional fast JSON encoding/decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data):
+    """Decode JSON from str or bytes, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Encode obj as a JSON string, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj)
+
+
+def iter_jsonl(path: str) -> Iterator[Dict]:
+    """Objects from a JSON Lines file (stdin if path is '-'), decoded one line at a time."""
+    stream = sys.stdin.buffer if path == '-' else open(path, 'rb')
+    try:
+        for line in stream:
+            if line.strip():
+                yield json_loads(line)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+# Lowercase alphabetic words, matched against lowercased text
+TOKEN_PATTERN = re.compile(r'\b[a-z]+\b')
+
+STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
+    'that', 'this', 'these', 'those', 'it', 'its', 'we', 'you', 'they',
+    'what', 'which', 'who', 'whom', 'whose', 'where', 'when', 'why', 'how',
+    'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other', 'some',
+    'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too',
+    'very', 'just', 'also', 'now', 'here', 'there', 'then', 'about', 'above',
+    'after', 'again', 'against', 'any', 'because', 'before', 'below',
+    'between', 'down', 'during', 'if', 'into', 'through', 'under', 'until',
+    'up', 'while', 'our', 'your', 'their', 'my', 'experience', 'work',
+    'working', 'job', 'team', 'company', 'ability', 'strong', 'looking',
+    'required', 'requirements', 'preferred', 'including', 'etc', 'years'
+})
 
 
 class TextProcessor:
     """Process and vectorize text for similarity calculations."""
 
-    def __init__(self):
-        self.stop_words = {
-            'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
-            'that', 'this', 'these', 'those', 'it', 'its', 'we', 'you', 'they',
-            'what', 'which', 'who', 'whom', 'whose', 'where', 'when', 'why', 'how',
-            'all', 'each', 'every', 'both', 'few', 'more', 'most', 'other', 'some',
-            'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too',
-            'very', 'just', 'also', 'now', 'here', 'there', 'then', 'about', 'above',
-            'after', 'again', 'against', 'any', 'because', 'before', 'below',
-            'between', 'down', 'during', 'if', 'into', 'through', 'under', 'until',
-            'up', 'while', 'our', 'your', 'their', 'my', 'experience', 'work',
-            'working', 'job', 'team', 'company', 'ability', 'strong', 'looking',
-            'required', 'requirements', 'preferred', 'including', 'etc', 'years'
-        }
+    def __init__(self, cache_size: int = 4096):
+        self.stop_words = STOP_WORDS
+        # text hash -> term frequencies, least recently used first
+        self.cache_size = cache_size
+        self._tf_cache: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def iter_tokens(self, text: str) -> Iterator[str]:
+        """Yield the terms of text, skipping stop words and short words."""
+        if not text:
+            return
+        stop_words = self.stop_words
+        for match in TOKEN_PATTERN.finditer(text.lower()):
+            word = match.group()
+            if len(word) > 2 and word not in stop_words:
+                yield word
 
     def tokenize(self, text: str) -> List[str]:
         """Tokenize text into words."""
-        if not text:
-            return []
-        # Convert to lowercase and split on non-alphanumeric characters
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        # Remove stop words and short words
-        return [w for w in words if w not in self.stop_words and len(w) > 2]
+        return list(self.iter_tokens(text))
 
-    def compute_tf(self, tokens: List[str]) -> Dict[str, float]:
-        """Compute term frequency."""
-        tf = defaultdict(int)
-        for token in tokens:
-            tf[token] += 1
+    @staticmethod
+    def _normalize_counts(counts: Counter) -> Dict[str, float]:
         # Normalize by total tokens
-        total = len(tokens)
+        total = sum(counts.values())
         if total == 0:
             return {}
-        return {k: v / total for k, v in tf.items()}
+        return {k: v / total for k, v in counts.items()}
+
+    def compute_tf(self, tokens: List[str]) -> Dict[str, float]:
+        """Compute term frequency."""
+        return self._normalize_counts(Counter(tokens))
+
+    def text_tf(self, text: str, digest: Optional[str] = None) -> Dict[str, float]:
+        """
+        Term frequencies of text, cached by text hash so unchanged texts are
+        tokenized once. The returned dict is shared and must not be mutated.
+        """
+        if digest is None:
+            digest = self.text_hash(text)
+        cache = self._tf_cache
+        tf = cache.get(digest)
+        if tf is not None:
+            cache.move_to_end(digest)
+            return tf
+        tf = self._normalize_counts(Counter(self.iter_tokens(text)))
+        if self.cache_size > 0:
+            cache[digest] = tf
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return tf
 
     def compute_idf(self, documents: List[List[str]]) -> Dict[str, float]:
         """Compute inverse document frequency."""
@@ -121,17 +219,23 @@ class SkillMatcher:
         user_normalized = set(self.normalize_skill(s) for s in user_skills)
         job_normalized = set(self.normalize_skill(s) for s in job_skills)
 
+        return self.match_normalized(user_normalized, self.categories_for(user_normalized), job_normalized)
+
+    def categories_for(self, normalized_skills) -> set:
+        """Categories covered by a set of normalized skills."""
+        return {self.skill_to_category[s] for s in normalized_skills if s in self.skill_to_category}
+
+    def match_normalized(self, user_normalized: set, user_categories: set, job_normalized) -> Tuple[float, List[str], List[str]]:
+        """
+        Skill match on pre-normalized skill sets.
+        Returns (score, matching_skills, related_skills)
+        """
         # Direct matches
         direct_matches = user_normalized & job_normalized
         matching_skills = list(direct_matches)
 
         # Find related skills (same category)
         related_skills = []
-        user_categories = set()
-        for skill in user_normalized:
-            if skill in self.skill_to_category:
-                user_categories.add(self.skill_to_category[skill])
-
         for job_skill in job_normalized - direct_matches:
             if job_skill in self.skill_to_category:
                 if self.skill_to_category[job_skill] in user_categories:
@@ -151,12 +255,1780 @@ class SkillMatcher:
         return final_score, matching_skills, related_skills
 
 
+def parse_salary(value) -> Optional[float]:
+    """Parse a salary bound, treating missing/zero/invalid values as None."""
+    if not value:
+        return None
+    try:
+        return float(value) or None
+    except (TypeError, ValueError):
+        return None
+
+
+class JobRecord:
+    """
+    Scoring features of one job, resolved once from its raw dict.
+
+    The snake_case/camelCase key fallbacks, lowercasing and salary parsing
+    happen here, so scorers read plain attributes. Strings are interned:
+    the many jobs sharing a type, location, level or skill share one string
+    object, and comparing them is mostly an identity check.
+    """
+
+    __slots__ = ('id', 'job', 'skills_lower', 'skills_lower_set', 'skills_normalized',
+                 'job_type', 'location', 'experience_level', 'salary_min', 'salary_max',
+                 'has_created_at', 'seq')
+
+    def __init__(self, job: Dict, skill_matcher: SkillMatcher):
+        skills = job.get('skills_required', []) or job.get('skillsRequired', []) or []
+        self.id = job.get('id')
+        self.job = job
+        self.skills_lower = tuple(sys.intern(s.lower()) for s in skills)
+        self.skills_lower_set = frozenset(self.skills_lower)
+        skills_normalized = frozenset(sys.intern(skill_matcher.normalize_skill(s)) for s in skills)
+        # Most skills normalize to their lowercase form
+        if skills_normalized == self.skills_lower_set:
+            skills_normalized = self.skills_lower_set
+        self.skills_normalized = skills_normalized
+        self.job_type = sys.intern((job.get('job_type') or job.get('jobType') or '').lower())
+        self.location = sys.intern((job.get('location') or '').lower())
+        self.experience_level = sys.intern((job.get('experience_level') or job.get('experienceLevel') or '').lower())
+        self.salary_min = parse_salary(job.get('salary_min') or job.get('salaryMin'))
+        self.salary_max = parse_salary(job.get('salary_max') or job.get('salaryMax'))
+        self.has_created_at = bool(job.get('created_at') or job.get('createdAt'))
+        # Catalog position, assigned by JobCatalog
+        self.seq = None
+
+    def __repr__(self) -> str:
+        return f'JobRecord(id={self.id!r})'
+
+
+class JobCatalog:
+    """
+    Resident job catalog.
+
+    Holds every job once, keyed by id, as a JobRecord with the features the
+    scorers need (normalized skills, lowercased type/location/level and
+    parsed salary), computed at insert time rather than on every request.
+
+    Also maintains inverted indexes from each of those features to job ids,
+    used to restrict scoring to jobs that can reach the recommendation
+    threshold.
+    """
+
+    # Inverted index fields, see _index_keys()
+    INDEX_FIELDS = ('skills', 'categories', 'skills_lower', 'job_types', 'locations', 'experience_levels', 'remote')
+
+    def __init__(self, skill_matcher: Optional[SkillMatcher] = None):
+        self.skill_matcher = skill_matcher or SkillMatcher()
+        self.entries: Dict = {}
+        self.postings: Dict[str, Dict] = {field: defaultdict(set) for field in self.INDEX_FIELDS}
+        # (job_type, location) -> [(seq, job id), ...] in catalog order
+        self.groups: Dict = defaultdict(list)
+        self._next_seq = 0
+        # Bumped on every change so derived structures know when to rebuild
+        self.version = 0
+        # Derived indexes kept up to date incrementally; each implements
+        # job_upserted(entry, old), job_removed(entry) and catalog_loaded()
+        self.listeners: List = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, job_id) -> bool:
+        return job_id in self.entries
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def get(self, job_id) -> Optional[JobRecord]:
+        return self.entries.get(job_id)
+
+    def build_entry(self, job: Dict) -> JobRecord:
+        """Precompute scoring features for a single job."""
+        return JobRecord(job, self.skill_matcher)
+
+    def upsert_job(self, job: Dict) -> JobRecord:
+        """Insert a job or replace the existing job with the same id."""
+        entry, old = self._insert(job)
+        for listener in self.listeners:
+            listener.job_upserted(entry, old)
+        return entry
+
+    def _insert(self, job: Dict) -> Tuple[JobRecord, Optional[JobRecord]]:
+        return self._insert_record(self.build_entry(job))
+
+    def _insert_record(self, entry: JobRecord) -> Tuple[JobRecord, Optional[JobRecord]]:
+        job_id = entry.id
+        old = self.entries.get(job_id)
+        if old is not None:
+            self._unindex(old)
+            # Replacing keeps the original position, like dict assignment
+            entry.seq = old.seq
+        else:
+            entry.seq = self._next_seq
+            self._next_seq += 1
+        self.entries[job_id] = entry
+        self._index(entry)
+        self.version += 1
+        return entry, old
+
+    def remove_job(self, job_id) -> bool:
+        """Remove a job; returns False if it was not in the catalog."""
+        entry = self.entries.pop(job_id, None)
+        if entry is None:
+            return False
+        self._unindex(entry)
+        self.version += 1
+        for listener in self.listeners:
+            listener.job_removed(entry)
+        return True
+
+    def load(self, jobs: List[Dict]):
+        """Replace the catalog contents with the given jobs."""
+        self.load_records(self.build_entry(job) for job in jobs)
+
+    def load_records(self, records: Iterator[JobRecord]):
+        """Replace the catalog contents with already built records, e.g. from a CatalogSnapshot."""
+        self.entries = {}
+        self.postings = {field: defaultdict(set) for field in self.INDEX_FIELDS}
+        self.groups = defaultdict(list)
+        self._next_seq = 0
+        self.version += 1
+        for entry in records:
+            self._insert_record(entry)
+        for listener in self.listeners:
+            listener.catalog_loaded()
+
+    def _index_keys(self, entry: JobRecord):
+        """Yield (field, key) pairs under which an entry is indexed."""
+        skill_to_category = self.skill_matcher.skill_to_category
+        for skill in entry.skills_normalized:
+            yield 'skills', skill
+            if skill in skill_to_category:
+                yield 'categories', skill_to_category[skill]
+        for skill in entry.skills_lower_set:
+            yield 'skills_lower', skill
+        for field, key in (('job_types', entry.job_type),
+                           ('locations', entry.location),
+                           ('experience_levels', entry.experience_level)):
+            if key:
+                yield field, key
+        if 'remote' in entry.location:
+            yield 'remote', 'remote'
+
+    def _index(self, entry: JobRecord):
+        for field, key in self._index_keys(entry):
+            self.postings[field][key].add(entry.id)
+        bisect.insort(self.groups[self.group_key(entry)], (entry.seq, entry.id))
+
+    def _unindex(self, entry: JobRecord):
+        for field, key in self._index_keys(entry):
+            ids = self.postings[field].get(key)
+            if ids is not None:
+                ids.discard(entry.id)
+                if not ids:
+                    del self.postings[field][key]
+        key = self.group_key(entry)
+        group = self.groups[key]
+        position = bisect.bisect_left(group, (entry.seq,))
+        if position < len(group) and group[position][1] == entry.id:
+            del group[position]
+        if not group:
+            del self.groups[key]
+
+    @staticmethod
+    def group_key(entry: JobRecord) -> Tuple[str, str]:
+        """Jobs with equal type and location are similar without sharing skills."""
+        return entry.job_type, entry.location
+
+    def first_in_group(self, entry: JobRecord, limit: Optional[int], exclude=()) -> List[Tuple[int, object]]:
+        """
+        (seq, id) of the earliest jobs sharing entry's type and location.
+
+        Skips the entry itself and any id in exclude; returns at most limit
+        jobs (all of them if limit is None).
+        """
+        found = []
+        for seq, job_id in self.groups.get(self.group_key(entry), ()):
+            if limit is not None and len(found) >= limit:
+                break
+            if job_id == entry.id or job_id in exclude:
+                continue
+            found.append((seq, job_id))
+        return found
+
+    def candidates(self, user_normalized: set, user_categories: set,
+                   user_interests: Optional[Dict], extra_ids=()) -> List[JobRecord]:
+        """
+        Entries sharing at least one scoring feature with the user.
+
+        A job outside this set has zero skill and interest scores, so its
+        total is bounded by recency + salary (18 points) and can never pass
+        the recommendation threshold. Entries are returned in catalog order.
+        """
+        postings = self.postings
+        ids = set()
+        for skill in user_normalized:
+            ids.update(postings['skills'].get(skill, ()))
+        for category in user_categories:
+            ids.update(postings['categories'].get(category, ()))
+
+        if user_interests:
+            for field, interest_key in (('skills_lower', 'skills'),
+                                        ('job_types', 'job_types'),
+                                        ('locations', 'locations'),
+                                        ('experience_levels', 'experience_levels')):
+                field_postings = postings[field]
+                for key in user_interests.get(interest_key) or {}:
+                    ids.update(field_postings.get(key, ()))
+            if 'remote' in (user_interests.get('locations') or {}):
+                ids.update(postings['remote'].get('remote', ()))
+
+        ids.update(job_id for job_id in extra_ids if job_id in self.entries)
+
+        entries = [self.entries[job_id] for job_id in ids]
+        entries.sort(key=attrgetter('seq'))
+        return entries
+
+
+def job_similarity(a: JobRecord, b: JobRecord) -> float:
+    """Similarity between two catalog entries, as used by get_similar_jobs."""
+    a_skills, b_skills = a.skills_lower_set, b.skills_lower_set
+    skill_overlap = len(a_skills & b_skills) / max(len(a_skills | b_skills), 1)
+    type_match = 1.0 if a.job_type == b.job_type else 0.0
+    location_match = 1.0 if a.location == b.location else 0.0
+    return skill_overlap * 0.6 + type_match * 0.2 + location_match * 0.2
+
+
+# Similarity of two jobs with no shared skills but equal type and location
+ZERO_OVERLAP_SCORE = round((0.0 * 0.6 + 1.0 * 0.2 + 1.0 * 0.2) * 100, 1)
+
+
+class SimilarJobsIndex:
+    """
+    Precomputed "similar jobs" neighbor table for a JobCatalog.
+
+    Stores the top `size` neighbors of catalog jobs, exactly as
+    get_similar_jobs would rank them, so repeat lookups are a dict read.
+    A job's list is computed on its first lookup (or by build()) from the
+    catalog's skill postings rather than a scan, so loading a catalog costs
+    nothing until similar jobs are asked for. Computed lists are patched
+    incrementally when a single job is added, edited or removed.
+    """
+
+    def __init__(self, catalog: JobCatalog, size: int = 20, stored: Optional['CatalogSnapshot'] = None):
+        """
+        stored, if given, is a CatalogSnapshot of the current catalog with
+        every job's list. Lists are read from it until the catalog changes,
+        when they are copied into self.neighbors to be maintained.
+        """
+        self.catalog = catalog
+        self.size = size
+        # job id -> [(score, seq, neighbor id), ...] best first, for the
+        # jobs whose list has been computed
+        self.neighbors: Dict = {}
+        # job id -> ids of the jobs whose neighbor lists contain it
+        self.reverse: Dict = defaultdict(set)
+        # (catalog version, cached id sets), see _ids_with()
+        self._id_sets: Tuple = (None, {})
+        self.stored = stored
+        catalog.listeners.append(self)
+
+    def neighbor_list(self, entry: JobRecord) -> List[Tuple[float, int, object]]:
+        """A catalog job's (score, seq, neighbor id) list, computing it if needed."""
+        neighbors = self.neighbors.get(entry.id)
+        if neighbors is not None:
+            return neighbors
+        if self.stored is not None:
+            # Unchanged since the snapshot was loaded, so its rows are the seqs
+            return self.stored.neighbor_list(entry.seq)
+        return self._compute(entry)
+
+    def _unstore(self):
+        """Copy the stored lists into self.neighbors before the catalog changes them."""
+        stored, self.stored = self.stored, None
+        if stored is None:
+            return
+        self.neighbors = {}
+        self.reverse = defaultdict(set)
+        for row, job_id in enumerate(stored.ids):
+            neighbors = self.neighbors[job_id] = stored.neighbor_list(row)
+            for _, _, neighbor_id in neighbors:
+                self.reverse[neighbor_id].add(job_id)
+
+    def get(self, job_id, limit: int) -> Optional[List[Dict]]:
+        """Similar jobs for a catalog job, or None if the table can't answer."""
+        if limit > self.size:
+            return None
+        entry = self.catalog.get(job_id)
+        if entry is None:
+            return None
+        entries = self.catalog.entries
+        return [
+            {**entries[neighbor_id].job, 'similarity_score': score}
+            for score, _, neighbor_id in self.neighbor_list(entry)[:limit]
+        ]
+
+    def _scored_candidates(self, entry: JobRecord, group_limit: Optional[int]) -> List[Tuple[float, int, object]]:
+        """
+        (score, -seq, id) of jobs above the similarity threshold.
+
+        Jobs sharing a skill come from the skill postings. Jobs sharing only
+        type and location all score ZERO_OVERLAP_SCORE; of those, just the
+        first group_limit by catalog order are returned (all if None).
+        """
+        target_id = entry.id
+        target_skills = entry.skills_lower_set
+        target_type, target_location = JobCatalog.group_key(entry)
+        entries = self.catalog.entries
+        postings = self.catalog.postings['skills_lower']
+
+        # Shared-skill counts give |A & B| directly; |A | B| follows from the sizes
+        overlapping = Counter()
+        for skill in target_skills:
+            overlapping.update(postings.get(skill, ()))
+        overlapping.pop(target_id, None)
+
+        scored = []
+        n_target = len(target_skills)
+        for job_id, shared in overlapping.items():
+            other = entries[job_id]
+            skill_overlap = shared / max(n_target + len(other.skills_lower_set) - shared, 1)
+            type_match = 1.0 if other.job_type == target_type else 0.0
+            location_match = 1.0 if other.location == target_location else 0.0
+            similarity = skill_overlap * 0.6 + type_match * 0.2 + location_match * 0.2
+            if similarity > 0.3:
+                scored.append((round(similarity * 100, 1), -other.seq, job_id))
+
+        for seq, job_id in self.catalog.first_in_group(entry, group_limit, overlapping):
+            scored.append((ZERO_OVERLAP_SCORE, -seq, job_id))
+        return scored
+
+    def _top_candidates(self, entry: JobRecord) -> List[Tuple[float, int, object]]:
+        """
+        The best `size` of _scored_candidates(entry, size), best first.
+
+        A job sharing c of the target's n skills scores at most 0.6 * c / n,
+        plus 0.2 for each of type and location it matches. Jobs of the
+        target's group (both match) are scored first, most shared skills
+        first, until that bound drops below the current size-th best score.
+        That score then sets the fewest shared skills c a job matching one
+        or neither field needs to rank; such a job appears in one of the
+        n - c + 1 rarest skill postings, so only those are searched, rather
+        than every job in the popular postings.
+        """
+        skill_postings = sorted(
+            (self.catalog.postings['skills_lower'].get(skill, set()) for skill in entry.skills_lower_set), key=len
+        )
+        n_skills = len(skill_postings)
+        group = self._ids_with('groups', JobCatalog.group_key(entry))
+
+        best = []
+        in_group = self._count_shared(skill_postings, group)
+        in_group.pop(entry.id, None)
+        for seq, job_id in self.catalog.first_in_group(entry, self.size, in_group):
+            self._push_best(best, (ZERO_OVERLAP_SCORE, -seq, job_id))
+        self._push_tier(best, entry, in_group, 0.4)
+
+        matches = None
+        for bonus in (0.2, 0.0):
+            min_shared = self._min_shared(best, n_skills, bonus)
+            if min_shared > n_skills:
+                break
+            pool = set().union(*skill_postings[:n_skills - min_shared + 1])
+            pool -= group
+            pool.discard(entry.id)
+            if matches is None:
+                matches = (self._ids_with('job_types', entry.job_type)
+                           | self._ids_with('locations', entry.location)) if bonus else set()
+            pool = pool & matches if bonus else pool - matches
+            self._push_tier(best, entry, self._count_shared(skill_postings, pool), bonus)
+
+        best.sort(reverse=True)
+        return best
+
+    def _ids_with(self, field: str, key) -> set:
+        """
+        Ids of catalog jobs with the given job type, location or (type,
+        location) group. Empty values are not in the postings, so these and
+        groups are collected once per catalog version.
+        """
+        if field != 'groups' and key:
+            return self.catalog.postings[field].get(key) or set()
+        version, sets = self._id_sets
+        if version != self.catalog.version:
+            sets = {}
+            self._id_sets = (self.catalog.version, sets)
+        if (field, key) not in sets:
+            if field == 'groups':
+                ids = {job_id for _, job_id in self.catalog.groups.get(key, ())}
+            else:
+                position = 0 if field == 'job_types' else 1
+                ids = {job_id for group_key, group in self.catalog.groups.items()
+                       if not group_key[position] for _, job_id in group}
+            sets[field, key] = ids
+        return sets[field, key]
+
+    @staticmethod
+    def _count_shared(skill_postings: List[set], job_ids: set) -> Counter:
+        """Skills each of job_ids shares with the target, for those sharing any."""
+        shared = Counter()
+        for posting in skill_postings:
+            shared.update(posting & job_ids)
+        return shared
+
+    def _min_shared(self, best: List, n_skills: int, bonus: float) -> int:
+        """Fewest shared skills with which a job earning bonus can still rank (n_skills + 1 if none)."""
+        if len(best) < self.size:
+            return 1
+        for shared in range(1, n_skills + 1):
+            if round((0.6 * shared / n_skills + bonus) * 100, 1) >= best[0][0]:
+                return shared
+        return n_skills + 1
+
+    def _push_best(self, best: List, item: Tuple[float, int, object]):
+        """Keep the `size` largest items in the min-heap best."""
+        if len(best) < self.size:
+            heapq.heappush(best, item)
+        elif item > best[0]:
+            heapq.heapreplace(best, item)
+
+    def _push_tier(self, best: List, entry: JobRecord, shared: Counter, bonus: float):
+        """Score the jobs in shared, most shared skills first, while they can still rank."""
+        entries = self.catalog.entries
+        n_skills = len(entry.skills_lower_set)
+        target_type, target_location = entry.job_type, entry.location
+        for job_id, count in shared.most_common():
+            if len(best) >= self.size and round((0.6 * count / n_skills + bonus) * 100, 1) < best[0][0]:
+                break
+            # As job_similarity, with |A & B| known
+            other = entries[job_id]
+            skill_overlap = count / max(n_skills + len(other.skills_lower_set) - count, 1)
+            type_match = 1.0 if other.job_type == target_type else 0.0
+            location_match = 1.0 if other.location == target_location else 0.0
+            similarity = skill_overlap * 0.6 + type_match * 0.2 + location_match * 0.2
+            if similarity > 0.3:
+                self._push_best(best, (round(similarity * 100, 1), -other.seq, job_id))
+
+    def _compute(self, entry: JobRecord) -> List[Tuple[float, int, object]]:
+        """(Re)compute one job's neighbor list from scratch and return it."""
+        job_id = entry.id
+        for _, _, old_id in self.neighbors.get(job_id, ()):
+            self.reverse[old_id].discard(job_id)
+        best = self._top_candidates(entry)
+        neighbors = self.neighbors[job_id] = [(score, -neg_seq, neighbor_id) for score, neg_seq, neighbor_id in best]
+        for _, _, neighbor_id in best:
+            self.reverse[neighbor_id].add(job_id)
+        return neighbors
+
+    def build(self, job_ids=None):
+        """Compute the lists of job_ids (every catalog job if None) not computed or stored yet."""
+        if self.stored is not None:
+            return
+        entries = self.catalog.entries
+        for job_id in (entries if job_ids is None else job_ids):
+            if job_id not in self.neighbors and job_id in entries:
+                self._compute(entries[job_id])
+
+    def _offer(self, job_id, score: float, seq: int, neighbor_id):
+        """Insert a neighbor into job_id's list if it ranks in the top `size`."""
+        neighbors = self.neighbors.get(job_id)
+        if neighbors is None:
+            return
+        key = (score, -seq)
+        if len(neighbors) >= self.size and key <= (neighbors[-1][0], -neighbors[-1][1]):
+            return
+        position = 0
+        while position < len(neighbors) and (neighbors[position][0], -neighbors[position][1]) > key:
+            position += 1
+        neighbors.insert(position, (score, seq, neighbor_id))
+        self.reverse[neighbor_id].add(job_id)
+        if len(neighbors) > self.size:
+            _, _, evicted_id = neighbors.pop()
+            self.reverse[evicted_id].discard(job_id)
+
+    def _detach(self, entry: JobRecord) -> set:
+        """
+        Drop a job from the table and from every list it appears in.
+
+        Returns the ids of jobs whose lists were full and lost an entry;
+        they may have a replacement and need recomputing.
+        """
+        job_id = entry.id
+        for _, _, neighbor_id in self.neighbors.pop(job_id, ()):
+            self.reverse[neighbor_id].discard(job_id)
+
+        stale = set()
+        for other_id in self.reverse.pop(job_id, ()):
+            neighbors = self.neighbors[other_id]
+            if len(neighbors) >= self.size:
+                stale.add(other_id)
+            neighbors[:] = [n for n in neighbors if n[2] != job_id]
+        return stale
+
+    def job_upserted(self, entry: JobRecord, old: Optional[JobRecord]):
+        self._unstore()
+        stale = self._detach(old) if old is not None else set()
+        if not self.neighbors:
+            return
+
+        # Similarity is symmetric: offer the job to every list it qualifies for
+        for score, _, other_id in self._scored_candidates(entry, None):
+            if other_id not in stale:
+                self._offer(other_id, score, entry.seq, entry.id)
+
+        # The job's own list waits for its first lookup
+        for other_id in stale:
+            self._compute(self.catalog.entries[other_id])
+
+    def job_removed(self, entry: JobRecord):
+        self._unstore()
+        for other_id in self._detach(entry):
+            self._compute(self.catalog.entries[other_id])
+
+    def catalog_loaded(self):
+        self.stored = None
+        self.neighbors = {}
+        self.reverse = defaultdict(set)
+
+
+class MinHashLSH:
+    """
+    Approximate similar-jobs lookup using MinHash signatures and LSH banding.
+
+    Each job's lowercase skill set gets a signature of bands * rows MinHash
+    values. Jobs whose signatures agree on every row of at least one band
+    share a bucket, and only those collisions (plus the earliest jobs with
+    the same type and location) are scored exactly. Two jobs with Jaccard
+    similarity s collide with probability 1 - (1 - s**rows)**bands; more
+    bands raise recall, more rows make buckets more selective.
+    """
+
+    # Mersenne prime for the (a * x + b) mod p hash family
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, catalog: JobCatalog, bands: int = 16, rows: int = 4, seed: int = 1):
+        self.catalog = catalog
+        self.bands = bands
+        self.rows = rows
+        rng = random.Random(seed)
+        self.hash_params = [
+            (rng.randrange(1, self.PRIME), rng.randrange(0, self.PRIME))
+            for _ in range(bands * rows)
+        ]
+        # (band, row values) -> job ids
+        self.buckets: Dict = defaultdict(set)
+        # job id -> band keys it was stored under
+        self.band_keys: Dict = {}
+        catalog.listeners.append(self)
+        self.catalog_loaded()
+
+    @property
+    def threshold(self) -> float:
+        """Jaccard similarity at which the collision probability is about one half."""
+        return (1.0 / self.bands) ** (1.0 / self.rows)
+
+    def signature(self, skills) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of a skill set, or None for an empty set."""
+        if not skills:
+            return None
+        # crc32 rather than hash() so signatures are stable across processes
+        values = [zlib.crc32(skill.encode('utf-8')) for skill in skills]
+        prime = self.PRIME
+        return tuple(min((a * x + b) % prime for x in values) for a, b in self.hash_params)
+
+    def _keys(self, entry: JobRecord) -> List[Tuple]:
+        signature = self.signature(entry.skills_lower_set)
+        if signature is None:
+            return []
+        rows = self.rows
+        return [(band, signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def candidates(self, entry: JobRecord) -> set:
+        """Ids of jobs sharing at least one LSH bucket with entry."""
+        keys = self.band_keys.get(entry.id)
+        if keys is None:
+            keys = self._keys(entry)
+        found = set()
+        for key in keys:
+            found.update(self.buckets.get(key, ()))
+        found.discard(entry.id)
+        return found
+
+    def query(self, entry: JobRecord, limit: int) -> List[Dict]:
+        """Approximate get_similar_jobs: exact scoring of bucket collisions only."""
+        entries = self.catalog.entries
+        colliding = self.candidates(entry)
+
+        top = []
+        for job_id in colliding:
+            other = entries[job_id]
+            similarity = job_similarity(entry, other)
+            if similarity > 0.3:
+                top.append((round(similarity * 100, 1), -other.seq, job_id))
+        for seq, job_id in self.catalog.first_in_group(entry, limit, colliding):
+            top.append((ZERO_OVERLAP_SCORE, -seq, job_id))
+
+        return [
+            {**entries[job_id].job, 'similarity_score': score}
+            for score, _, job_id in heapq.nlargest(limit, top)
+        ]
+
+    def _add(self, entry: JobRecord):
+        keys = self._keys(entry)
+        self.band_keys[entry.id] = keys
+        for key in keys:
+            self.buckets[key].add(entry.id)
+
+    def _discard(self, job_id):
+        for key in self.band_keys.pop(job_id, ()):
+            bucket = self.buckets.get(key)
+            if bucket is not None:
+                bucket.discard(job_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def job_upserted(self, entry: JobRecord, old: Optional[JobRecord]):
+        self._discard(entry.id)
+        self._add(entry)
+
+    def job_removed(self, entry: JobRecord):
+        self._discard(entry.id)
+
+    def catalog_loaded(self):
+        self.buckets = defaultdict(set)
+        self.band_keys = {}
+        for entry in self.catalog:
+            self._add(entry)
+
+
+def job_text(job: Dict) -> str:
+    """Text used for description similarity: title plus description."""
+    return ' '.join(filter(None, (job.get('title'), job.get('description'))))
+
+
+class TextSimilarityIndex:
+    """
+    Incrementally maintained TF-IDF vectors for catalog job descriptions.
+
+    Keeps document frequencies and a TF-IDF vector with its L2 norm for
+    every catalog job, updated as jobs are upserted or removed, so scoring
+    never re-tokenizes the catalog. IDF weights are snapshotted: adding,
+    editing or removing a document only re-weights that document, and all
+    vectors are refreshed once the documents changed since the last
+    snapshot exceed refresh_ratio of it.
+
+    With a path, term frequencies are persisted keyed by a hash of each
+    job's text, so a restarted engine only tokenizes jobs that changed.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, catalog: JobCatalog, text_processor: TextProcessor,
+                 path: Optional[str] = None, refresh_ratio: float = 0.05,
+                 stored: Optional['CatalogSnapshot'] = None):
+        """
+        stored, if given, is a CatalogSnapshot of the current catalog with
+        its text index. Documents, vectors and the CSR matrix are read from
+        it until the catalog changes, instead of tokenizing the catalog.
+        """
+        self.catalog = catalog
+        self.text_processor = text_processor
+        self.path = path
+        self.refresh_ratio = refresh_ratio
+        # job id -> (text hash, term frequencies)
+        self.docs: Dict = {}
+        self.df: Counter = Counter()
+        # job id -> (TF-IDF vector, L2 norm) under the current IDF snapshot
+        self.vectors: Dict = {}
+        self.idf: Dict[str, float] = {}
+        self._snapshot_docs = 0
+        # Documents added, edited or removed since the IDF snapshot
+        self._changes = 0
+        # Bumped whenever a vector changes, see matrix()
+        self.version = 0
+        self._matrix: Optional['SparseTfidfMatrix'] = None
+        # Term frequencies by text hash restored from disk or kept across reloads
+        self._persisted: Dict = {}
+        # Snapshot docs and vectors are read from, see _unstore()
+        self.stored: Optional['CatalogSnapshot'] = None
+        if path:
+            self._read(path)
+        catalog.listeners.append(self)
+        if stored is None:
+            self.catalog_loaded()
+            return
+        self.stored = stored
+        terms, sections = stored.text_terms(), stored.sections
+        self.df = Counter(dict(zip(terms, sections['text_df'])))
+        self.idf = {term: idf for term, idf in zip(terms, sections['text_idf']) if not math.isnan(idf)}
+        self._snapshot_docs = stored.text_idf_docs
+        self._changes = stored.text_idf_changes
+        self.docs = SnapshotRows(stored, stored.text_document)
+        self.vectors = SnapshotRows(stored, stored.text_vector)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        if self.stored is not None:
+            # Views of the mapped file; rebuilt from the re-mapped snapshot
+            state['_matrix'] = None
+        return state
+
+    def _unstore(self):
+        """Copy the stored documents and vectors into dicts before they change."""
+        if self.stored is not None:
+            self.stored = None
+            self.docs = dict(self.docs)
+            self.vectors = dict(self.vectors)
+
+    text_hash = staticmethod(TextProcessor.text_hash)
+
+    def term_frequencies(self, text: str, digest: Optional[str] = None) -> Dict[str, float]:
+        return self.text_processor.text_tf(text, digest)
+
+    def _idf(self, term: str) -> float:
+        # Same smoothing as TextProcessor.compute_idf
+        n_docs = len(self.docs)
+        return math.log((n_docs + 1) / (self.df.get(term, 0) + 1)) + 1
+
+    def _vectorize(self, tf: Dict[str, float]) -> Tuple[Dict[str, float], float]:
+        idf, df = self.idf, self.df
+        vector = {}
+        for term, tf_val in tf.items():
+            weight = idf.get(term)
+            if weight is None:
+                weight = self._idf(term)
+                # Only catalog terms join the snapshot; a term no job has yet
+                # would keep its df=0 weight after jobs with it are added
+                if term in df:
+                    idf[term] = weight
+            vector[term] = tf_val * weight
+        return vector, math.sqrt(sum(v * v for v in vector.values()))
+
+    def refresh(self):
+        """Recompute the IDF snapshot and every vector."""
+        self._unstore()
+        self.idf = {term: self._idf(term) for term in self.df}
+        self._snapshot_docs = len(self.docs)
+        self._changes = 0
+        self.vectors = {job_id: self._vectorize(tf) for job_id, (_, tf) in self.docs.items()}
+        self.version += 1
+
+    def _maybe_refresh(self):
+        if self._changes > self.refresh_ratio * max(self._snapshot_docs, 1):
+            self.refresh()
+
+    def _add(self, entry: JobRecord):
+        text = job_text(entry.job)
+        digest = self.text_hash(text)
+        tf = self._persisted.get(digest)
+        if tf is None:
+            tf = self.term_frequencies(text, digest)
+        self.docs[entry.id] = (digest, tf)
+        self.df.update(tf.keys())
+
+    def _discard(self, job_id):
+        doc = self.docs.pop(job_id, None)
+        if doc is None:
+            return
+        self.df.subtract(doc[1].keys())
+        for term in doc[1]:
+            if self.df[term] <= 0:
+                del self.df[term]
+        self.vectors.pop(job_id, None)
+        self.version += 1
+
+    def job_upserted(self, entry: JobRecord, old: Optional[JobRecord]):
+        self._unstore()
+        old_doc = self.docs.get(entry.id)
+        if old_doc is not None and old_doc[0] == self.text_hash(job_text(entry.job)):
+            return
+        self._discard(entry.id)
+        self._add(entry)
+        self.vectors[entry.id] = self._vectorize(self.docs[entry.id][1])
+        self.version += 1
+        self._changes += 1
+        self._maybe_refresh()
+
+    def job_removed(self, entry: JobRecord):
+        self._unstore()
+        if entry.id in self.docs:
+            self._discard(entry.id)
+            self._changes += 1
+            self._maybe_refresh()
+
+    def catalog_loaded(self):
+        self._unstore()
+        # Reuse already tokenized texts across reloads
+        for digest, tf in self.docs.values():
+            self._persisted[digest] = tf
+        self.docs = {}
+        self.df = Counter()
+        for entry in self.catalog:
+            self._add(entry)
+        if self.docs:
+            # Drop texts no longer in the catalog; an empty catalog (the
+            # engine before its first load) leaves them for the real load
+            self._persisted = {digest: tf for digest, tf in self.docs.values()}
+        self.refresh()
+
+    def vector_for(self, entry: JobRecord) -> Tuple[Dict[str, float], float]:
+        """Vector of a catalog entry, or of a job outside the catalog."""
+        stored = self.vectors.get(entry.id)
+        if stored is not None and self.catalog.get(entry.id) is entry:
+            return stored
+        return self._vectorize(self.term_frequencies(job_text(entry.job)))
+
+    def user_vector(self, user_data: Dict) -> Tuple[Dict[str, float], float]:
+        """
+        Text profile of a user: weighted sum of the unit vectors of applied
+        and saved catalog jobs, plus the profile skills as a document.
+        """
+        profile = defaultdict(float)
+        sources = (
+            (user_data.get('applied_job_ids', []), 1.0),
+            (user_data.get('saved_job_ids', []), 0.7),
+        )
+        for job_ids, weight in sources:
+            for job_id in job_ids:
+                stored = self.vectors.get(job_id)
+                if stored is None or not stored[1]:
+                    continue
+                vector, norm = stored
+                for term, value in vector.items():
+                    profile[term] += weight * value / norm
+
+        skills_text = ' '.join(user_data.get('profile_skills', []))
+        if skills_text:
+            vector, norm = self._vectorize(self.term_frequencies(skills_text))
+            if norm:
+                for term, value in vector.items():
+                    profile[term] += 0.5 * value / norm
+
+        return dict(profile), math.sqrt(sum(v * v for v in profile.values()))
+
+    def matrix(self) -> 'SparseTfidfMatrix':
+        """CSR encoding of the catalog vectors, rebuilt when anything changed."""
+        version = (self.catalog.version, self.version)
+        if self._matrix is None or self._matrix.version != version:
+            self._matrix = SparseTfidfMatrix(self)
+        return self._matrix
+
+    @staticmethod
+    def cosine(a: Tuple[Dict[str, float], float], b: Tuple[Dict[str, float], float]) -> float:
+        """Cosine similarity of two (vector, norm) pairs using the cached norms."""
+        (vec_a, norm_a), (vec_b, norm_b) = a, b
+        if not norm_a or not norm_b:
+            return 0.0
+        if len(vec_a) > len(vec_b):
+            vec_a, vec_b = vec_b, vec_a
+        dot = sum(value * vec_b[term] for term, value in vec_a.items() if term in vec_b)
+        return dot / (norm_a * norm_b)
+
+    def _read(self, path: str):
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != self.FORMAT_VERSION:
+            return
+        self._persisted = {digest: tf for digest, tf in data.get('documents', [])}
+
+    def save(self, path: Optional[str] = None):
+        """Persist term frequencies keyed by text hash (atomic replace)."""
+        path = path or self.path
+        if not path:
+            return
+        data = {
+            'version': self.FORMAT_VERSION,
+            'documents': [[digest, tf] for digest, tf in self.docs.values()],
+        }
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+class SparseTfidfMatrix:
+    """
+    Catalog TF-IDF vectors as a sparse matrix over interned term ids.
+
+    Rows follow catalog order. Weights are stored CSR-style (indptr,
+    indices and float32 data) with the L2 norm of every row cached, so the
+    similarity of one query vector to every job is a single sparse
+    matrix-vector product: scipy.sparse when installed, a NumPy bincount
+    otherwise, or a column-wise walk over stdlib arrays without NumPy.
+    """
+
+    def __init__(self, text_index: TextSimilarityIndex):
+        catalog = text_index.catalog
+        self.version = (catalog.version, text_index.version)
+        stored = text_index.stored
+        if stored is not None:
+            # Unchanged since the snapshot was loaded: view its arrays in place
+            self.term_ids = {term: column for column, term in enumerate(stored.text_terms())}
+            self.row_of = stored.row_of
+            sections = stored.sections
+            self._set_arrays(sections['tf_indptr'], sections['tf_columns'], sections['tfidf_data'],
+                             sections['tfidf_norms'])
+            return
+
+        self.term_ids: Dict[str, int] = {}
+        self.row_of: Dict = {}
+
+        indptr, indices, data, norms = array('q', [0]), array('i'), array('f'), array('d')
+        for row, entry in enumerate(catalog):
+            self.row_of[entry.id] = row
+            vector = text_index.vectors.get(entry.id, ({}, 0.0))[0]
+            start = len(data)
+            for term, value in vector.items():
+                indices.append(self.term_ids.setdefault(term, len(self.term_ids)))
+                data.append(value)
+            indptr.append(len(data))
+            # Norm of the stored float32 weights, so a row is a unit vector after division
+            norms.append(math.sqrt(sum(v * v for v in data[start:])))
+        self._set_arrays(indptr, indices, data, norms)
+
+    def _set_arrays(self, indptr, indices, data, norms):
+        """Set up the products from CSR arrays: stdlib arrays or snapshot views."""
+        self.n_rows = len(indptr) - 1
+        self.n_terms = len(self.term_ids)
+        self.norms = norms
+        if np is not None:
+            self.indptr = np.frombuffer(indptr, dtype=np.int64)
+            self.indices = np.frombuffer(indices, dtype=np.int32)
+            self.data = np.frombuffer(data, dtype=np.float32)
+            self.norms = np.frombuffer(norms, dtype=np.float64)
+            if sparse is not None:
+                self.csr = sparse.csr_matrix(
+                    (self.data, self.indices, self.indptr), shape=(self.n_rows, self.n_terms)
+                )
+            else:
+                self.row_ids = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        else:
+            # Transpose to per-term columns so a query only touches its own terms
+            self.column_rows = [array('i') for _ in range(self.n_terms)]
+            self.column_data = [array('f') for _ in range(self.n_terms)]
+            for row in range(self.n_rows):
+                for k in range(indptr[row], indptr[row + 1]):
+                    self.column_rows[indices[k]].append(row)
+                    self.column_data[indices[k]].append(data[k])
+
+    def similarities(self, query: Tuple[Dict[str, float], float]):
+        """Cosine similarity of a (vector, norm) query to every row."""
+        vector, query_norm = query
+        terms = [(self.term_ids[t], v) for t, v in vector.items() if t in self.term_ids]
+
+        if np is not None:
+            if not terms or not query_norm:
+                return np.zeros(self.n_rows)
+            dense = np.zeros(self.n_terms)
+            term_ids, values = zip(*terms)
+            dense[list(term_ids)] = values
+            if sparse is not None:
+                dots = self.csr.dot(dense)
+            else:
+                dots = np.bincount(self.row_ids, weights=self.data * dense[self.indices], minlength=self.n_rows)
+            return np.divide(dots, self.norms * query_norm, out=np.zeros(self.n_rows), where=self.norms > 0)
+
+        dots = [0.0] * self.n_rows
+        if not query_norm:
+            return dots
+        for term_id, value in terms:
+            for row, weight in zip(self.column_rows[term_id], self.column_data[term_id]):
+                dots[row] += weight * value
+        norms = self.norms
+        return [dot / (norms[row] * query_norm) if norms[row] else 0.0 for row, dot in enumerate(dots)]
+
+
+class VectorizedScorer:
+    """
+    NumPy encoding of a JobCatalog for batched scoring.
+
+    Skills are stored CSR-style (one row per job) over interned skill ids,
+    and type/location/experience level as integer codes, so that one user
+    is scored against every job with a handful of array operations. The
+    arithmetic mirrors JobRecommendationEngine._score_entry term by term so
+    the raw scores are identical.
+    """
+
+    def __init__(self, catalog: JobCatalog):
+        self.version = catalog.version
+        self.entries = list(catalog)
+        self.row_of = {entry.id: row for row, entry in enumerate(self.entries)}
+        n_jobs = len(self.entries)
+        skill_to_category = catalog.skill_matcher.skill_to_category
+
+        self.skill_vocab: Dict[str, int] = {}
+        self.skill_lower_vocab: Dict[str, int] = {}
+        self.category_vocab = {c: i for i, c in enumerate(SkillMatcher.SKILL_CATEGORIES)}
+        self.type_vocab: Dict[str, int] = {'': 0}
+        self.location_vocab: Dict[str, int] = {'': 0}
+        self.level_vocab: Dict[str, int] = {'': 0}
+
+        skill_rows, skill_ids = [], []
+        lower_rows, lower_ids = [], []
+        type_codes, location_codes, level_codes = [], [], []
+        salary_min, salary_max, recency, is_remote = [], [], [], []
+
+        for row, entry in enumerate(self.entries):
+            for skill in entry.skills_normalized:
+                skill_rows.append(row)
+                skill_ids.append(self.skill_vocab.setdefault(skill, len(self.skill_vocab)))
+            for skill in entry.skills_lower:
+                lower_rows.append(row)
+                lower_ids.append(self.skill_lower_vocab.setdefault(skill, len(self.skill_lower_vocab)))
+            type_codes.append(self.type_vocab.setdefault(entry.job_type, len(self.type_vocab)))
+            location_codes.append(self.location_vocab.setdefault(entry.location, len(self.location_vocab)))
+            level_codes.append(self.level_vocab.setdefault(entry.experience_level, len(self.level_vocab)))
+            salary_min.append(entry.salary_min if entry.salary_min is not None else np.nan)
+            salary_max.append(entry.salary_max if entry.salary_max is not None else np.nan)
+            recency.append(0.8 if entry.has_created_at else 1.0)
+            is_remote.append('remote' in entry.location)
+
+        self.n_jobs = n_jobs
+        self.skill_rows = np.array(skill_rows, dtype=np.int64)
+        self.skill_ids = np.array(skill_ids, dtype=np.int64)
+        self.skill_count = np.bincount(self.skill_rows, minlength=n_jobs).astype(np.float64)
+        self.skill_category = np.array(
+            [self.category_vocab.get(skill_to_category.get(skill), -1) for skill in self.skill_vocab],
+            dtype=np.int64
+        )
+        self.lower_rows = np.array(lower_rows, dtype=np.int64)
+        self.lower_ids = np.array(lower_ids, dtype=np.int64)
+        self.lower_count = np.bincount(self.lower_rows, minlength=n_jobs).astype(np.float64)
+        self.type_codes = np.array(type_codes, dtype=np.int64)
+        self.location_codes = np.array(location_codes, dtype=np.int64)
+        self.level_codes = np.array(level_codes, dtype=np.int64)
+        self.salary_min = np.array(salary_min, dtype=np.float64)
+        self.salary_max = np.array(salary_max, dtype=np.float64)
+        self.has_salary = ~np.isnan(self.salary_min) & ~np.isnan(self.salary_max)
+        self.recency = np.array(recency, dtype=np.float64)
+        self.is_remote = np.array(is_remote, dtype=bool)
+
+    @staticmethod
+    def _lookup(vocab: Dict[str, int], weights: Optional[Dict]) -> 'np.ndarray':
+        """Dense weight array over a vocabulary from a sparse interest dict."""
+        table = np.zeros(len(vocab), dtype=np.float64)
+        for key, value in (weights or {}).items():
+            code = vocab.get(key)
+            if code is not None:
+                table[code] = value
+        return table
+
+    def _row_mask(self, job_ids) -> 'np.ndarray':
+        mask = np.zeros(self.n_jobs, dtype=bool)
+        rows = [self.row_of[job_id] for job_id in job_ids if job_id in self.row_of]
+        mask[rows] = True
+        return mask
+
+    def score(self, user_context: Dict) -> 'np.ndarray':
+        """Unrounded total score (0-1) of every job for one user."""
+        n_jobs = self.n_jobs
+        user_interests = user_context['interests']
+
+        # 1. Skill match: direct hits and same-category hits per job
+        user_mask = np.zeros(len(self.skill_vocab), dtype=bool)
+        for skill in user_context['skills_normalized']:
+            skill_id = self.skill_vocab.get(skill)
+            if skill_id is not None:
+                user_mask[skill_id] = True
+        user_categories = [self.category_vocab[c] for c in user_context['categories']]
+        related_mask = np.isin(self.skill_category, user_categories) & ~user_mask
+
+        direct = np.bincount(self.skill_rows, weights=user_mask[self.skill_ids], minlength=n_jobs)
+        related = np.bincount(self.skill_rows, weights=related_mask[self.skill_ids], minlength=n_jobs)
+        has_skills = self.skill_count > 0
+        direct_score = np.divide(direct, self.skill_count, out=np.zeros(n_jobs), where=has_skills)
+        related_score = np.divide(related * 0.5, self.skill_count, out=np.zeros(n_jobs), where=has_skills)
+        skill_score = np.minimum(1.0, (direct_score * 0.7) + (related_score * 0.3))
+
+        # 2. Interest match
+        interest_score = np.zeros(n_jobs)
+        if user_interests:
+            skill_interest_score = np.zeros(n_jobs)
+            if user_interests.get('skills'):
+                skill_weights = self._lookup(self.skill_lower_vocab, user_interests['skills'])
+                # bincount of an empty catalog skill list is int64; keep float for the divide
+                skill_interest_score = np.bincount(
+                    self.lower_rows, weights=skill_weights[self.lower_ids], minlength=n_jobs
+                ).astype(np.float64, copy=False)
+                skill_interest_score = np.divide(
+                    skill_interest_score, self.lower_count,
+                    out=skill_interest_score, where=self.lower_count > 0
+                )
+
+            locations = user_interests.get('locations', {})
+            type_score = self._lookup(self.type_vocab, user_interests.get('job_types', {}))[self.type_codes]
+            location_score = self._lookup(self.location_vocab, locations)[self.location_codes]
+            location_score = np.where(
+                self.is_remote, np.maximum(location_score, locations.get('remote', 0)), location_score
+            )
+            exp_score = self._lookup(self.level_vocab, user_interests.get('experience_levels', {}))[self.level_codes]
+
+            interest_score = (
+                skill_interest_score * 0.4 +
+                type_score * 0.2 +
+                location_score * 0.2 +
+                exp_score * 0.2
+            )
+
+        # 3. Saved job boost
+        saved_boost = self._row_mask(user_context['saved_job_ids']).astype(np.float64)
+
+        # 5. Salary match
+        salary_score = np.full(n_jobs, 0.5)
+        if user_interests and user_interests.get('salary_range'):
+            user_min = user_interests['salary_range'].get('min')
+            user_max = user_interests['salary_range'].get('max')
+            if user_min or user_max:
+                salary_score[self.has_salary] = 0.8
+                above = self.has_salary & (self.salary_min > user_max) if user_max else np.zeros(n_jobs, dtype=bool)
+                below = self.has_salary & ~above & (self.salary_max < user_min) if user_min else np.zeros(n_jobs, dtype=bool)
+                salary_score[above] = 0.2
+                salary_score[below] = 0.1
+
+        total_score = (
+            skill_score * 0.40 +
+            interest_score * 0.30 +
+            saved_boost * 0.10 +
+            self.recency * 0.10 +
+            salary_score * 0.10
+        )
+
+        # 6. Description similarity, precomputed for every catalog row
+        if user_context['text_scores'] is not None:
+            text_weight = user_context['text_weight']
+            total_score = total_score * (1 - text_weight) + np.asarray(user_context['text_scores']) * text_weight
+        return total_score
+
+    def rank(self, user_context: Dict, excluded_ids, threshold: float, limit: int) -> List[JobRecord]:
+        """
+        Top entries whose rounded score exceeds the threshold, best first.
+
+        Ties keep catalog order, matching the stable sort of the pure-Python
+        path. Rounding uses Python's round() on the survivors only.
+        """
+        if not self.n_jobs:
+            return []
+        scores = self.score(user_context) * 100
+        eligible = scores > threshold
+        eligible &= ~self._row_mask(excluded_ids)
+        rows = np.flatnonzero(eligible)
+        rounded = [round(value, 1) for value in scores[rows].tolist()]
+        ranked = heapq.nsmallest(
+            limit,
+            (r for r in zip(rounded, rows.tolist()) if r[0] > threshold),
+            key=lambda r: (-r[0], r[1])
+        )
+        return [self.entries[row] for _, row in ranked]
+
+
+class SnapshotJobRecord(JobRecord):
+    """JobRecord restored from a CatalogSnapshot; the raw job is decoded from the mapped file on access."""
+
+    __slots__ = ('snapshot', 'row')
+
+    @property
+    def job(self) -> Dict:
+        return self.snapshot.job(self.row)
+
+    def __reduce__(self):
+        # Rebuilt from the snapshot, which re-maps its file when unpickled
+        return self.snapshot.record, (self.row,)
+
+
+class SnapshotRows(Mapping):
+    """Read-only job id -> value mapping decoded from a CatalogSnapshot row on access."""
+
+    def __init__(self, snapshot: 'CatalogSnapshot', decode):
+        self.snapshot = snapshot
+        self.decode = decode
+
+    def __getitem__(self, job_id):
+        return self.decode(self.snapshot.row_of[job_id])
+
+    def __iter__(self):
+        return iter(self.snapshot.ids)
+
+    def __len__(self) -> int:
+        return len(self.snapshot.ids)
+
+
+class CatalogSnapshot:
+    """
+    Versioned binary snapshot of a JobCatalog and its derived indexes.
+
+    The file holds a JSON header (job ids, options and a section table)
+    followed by 8-byte aligned arrays: a table of every distinct string,
+    per-job columns of string ids for type, location, level and skills,
+    salary bounds and flags, the raw jobs as JSON, and optionally the
+    similar-jobs neighbor lists and the TF-IDF index (document
+    frequencies, IDF weights, and CSR term frequencies, weights and norms).
+    The file is read through mmap and viewed in place, so loading skips
+    JSON parsing, skill normalization, neighbor search, tokenization and
+    IDF weighting, and processes sharing a snapshot share its pages.
+
+    Neighbor lists, text vectors and the TF-IDF matrix are read from the
+    mapped arrays until the catalog first changes. Catalog records and
+    their postings are still built as Python objects on load, so a load
+    remains linear in the number of jobs. Raw jobs are only decoded when
+    a result echoes them.
+    """
+
+    MAGIC = b'JRSNAP\x00\x00'
+    FORMAT_VERSION = 2
+    HEADER_LENGTH = struct.Struct('<Q')
+
+    def __init__(self, path: str):
+        self.path = path
+        self._open()
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header_start = len(self.MAGIC) + self.HEADER_LENGTH.size
+        if self.mapped[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError(f'Not a catalog snapshot: {self.path}')
+        (header_length,) = self.HEADER_LENGTH.unpack_from(self.mapped, len(self.MAGIC))
+        header = json_loads(self.mapped[header_start:header_start + header_length])
+        if header.get('version') != self.FORMAT_VERSION:
+            raise ValueError(f'Unsupported catalog snapshot version: {header.get("version")}')
+        if header.get('byteorder') != sys.byteorder:
+            raise ValueError('Catalog snapshot was written with a different byte order')
+
+        self.ids = header['ids']
+        self.row_of = {job_id: row for row, job_id in enumerate(self.ids)}
+        self.similar_size = header.get('similar_size')
+        self.text_weight = header.get('text_weight')
+        self.text_idf_docs = header.get('text_idf_docs')
+        self.text_idf_changes = header.get('text_idf_changes')
+        view = memoryview(self.mapped)
+        self.sections = {
+            name: view[offset:offset + length].cast(typecode)
+            for name, (offset, length, typecode) in header['sections'].items()
+        }
+        self._jobs_offset = header['sections']['jobs'][0]
+        offsets, blob = self.sections['string_offsets'], self.sections['strings']
+        self.strings = [
+            sys.intern(str(blob[offsets[i]:offsets[i + 1]], 'utf-8')) for i in range(len(offsets) - 1)
+        ]
+
+    def __getstate__(self) -> Dict:
+        return {'path': self.path}
+
+    def __setstate__(self, state: Dict):
+        self.path = state['path']
+        self._open()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def job(self, row: int) -> Dict:
+        """Raw job dict of a row, decoded from the mapped file."""
+        offsets = self.sections['job_offsets']
+        return json_loads(self.mapped[self._jobs_offset + offsets[row]:self._jobs_offset + offsets[row + 1]])
+
+    def _string_rows(self, name: str, row: int) -> List[str]:
+        indptr, values, strings = self.sections[name + '_indptr'], self.sections[name], self.strings
+        return [strings[i] for i in values[indptr[row]:indptr[row + 1]]]
+
+    def record(self, row: int) -> SnapshotJobRecord:
+        """The catalog record of a row, with seq set to the row."""
+        sections, strings = self.sections, self.strings
+        record = SnapshotJobRecord.__new__(SnapshotJobRecord)
+        record.snapshot = self
+        record.row = row
+        record.id = self.ids[row]
+        record.skills_lower = tuple(self._string_rows('skills_lower', row))
+        record.skills_lower_set = frozenset(record.skills_lower)
+        skills_normalized = frozenset(self._string_rows('skills_normalized', row))
+        if skills_normalized == record.skills_lower_set:
+            skills_normalized = record.skills_lower_set
+        record.skills_normalized = skills_normalized
+        record.job_type = strings[sections['job_type'][row]]
+        record.location = strings[sections['location'][row]]
+        record.experience_level = strings[sections['experience_level'][row]]
+        salary_min, salary_max = sections['salary_min'][row], sections['salary_max'][row]
+        record.salary_min = None if math.isnan(salary_min) else salary_min
+        record.salary_max = None if math.isnan(salary_max) else salary_max
+        record.has_created_at = bool(sections['has_created_at'][row])
+        record.seq = row
+        return record
+
+    def records(self) -> Iterator[SnapshotJobRecord]:
+        return (self.record(row) for row in range(len(self.ids)))
+
+    def neighbor_list(self, row: int) -> List[Tuple[float, int, object]]:
+        """Similar-jobs list of a row in SimilarJobsIndex format, assuming seq == row."""
+        ids, sections = self.ids, self.sections
+        indptr, rows, scores = sections['neighbor_indptr'], sections['neighbor_rows'], sections['neighbor_scores']
+        return [(scores[k], rows[k], ids[rows[k]]) for k in range(indptr[row], indptr[row + 1])]
+
+    def text_terms(self) -> List[str]:
+        """Terms of the text index, in column order."""
+        return [self.strings[i] for i in self.sections['text_terms']]
+
+    def text_document(self, row: int) -> Tuple[str, Dict[str, float]]:
+        """Text index document of a row: (text hash, term frequencies)."""
+        return self.strings[self.sections['text_digest'][row]], self._text_row('tf_values', row)
+
+    def text_vector(self, row: int) -> Tuple[Dict[str, float], float]:
+        """TF-IDF vector of a row and its L2 norm."""
+        return self._text_row('tfidf_values', row), self.sections['text_norms'][row]
+
+    def _text_row(self, name: str, row: int) -> Dict[str, float]:
+        sections, strings = self.sections, self.strings
+        indptr, columns, terms, values = (
+            sections['tf_indptr'], sections['tf_columns'], sections['text_terms'], sections[name]
+        )
+        return {strings[terms[columns[k]]]: values[k] for k in range(indptr[row], indptr[row + 1])}
+
+    @classmethod
+    def write(cls, path: str, catalog: JobCatalog, similar_index: Optional[SimilarJobsIndex] = None,
+              text_index: Optional[TextSimilarityIndex] = None, text_weight: float = 0.0):
+        """Write a snapshot of catalog and the given indexes (atomic replace)."""
+        string_ids: Dict[str, int] = {}
+
+        def string_id(value: str) -> int:
+            return string_ids.setdefault(value, len(string_ids))
+
+        entries = list(catalog)
+        row_of = {entry.id: row for row, entry in enumerate(entries)}
+        sections = {
+            'job_type': array('i'), 'location': array('i'), 'experience_level': array('i'),
+            'salary_min': array('d'), 'salary_max': array('d'), 'has_created_at': array('B'),
+            'skills_lower_indptr': array('q', [0]), 'skills_lower': array('i'),
+            'skills_normalized_indptr': array('q', [0]), 'skills_normalized': array('i'),
+            'job_offsets': array('q', [0]), 'jobs': bytearray(),
+        }
+        for entry in entries:
+            sections['job_type'].append(string_id(entry.job_type))
+            sections['location'].append(string_id(entry.location))
+            sections['experience_level'].append(string_id(entry.experience_level))
+            sections['salary_min'].append(math.nan if entry.salary_min is None else entry.salary_min)
+            sections['salary_max'].append(math.nan if entry.salary_max is None else entry.salary_max)
+            sections['has_created_at'].append(entry.has_created_at)
+            # In job order, so record() rebuilds the sets with the same iteration order
+            sections['skills_lower'].extend(string_id(skill) for skill in entry.skills_lower)
+            sections['skills_normalized'].extend(
+                string_id(catalog.skill_matcher.normalize_skill(skill)) for skill in entry.skills_lower
+            )
+            for name in ('skills_lower', 'skills_normalized'):
+                sections[name + '_indptr'].append(len(sections[name]))
+            sections['jobs'] += json_dumps(entry.job).encode('utf-8')
+            sections['job_offsets'].append(len(sections['jobs']))
+
+        if similar_index is not None:
+            similar_index.build()
+            indptr, rows, scores = array('q', [0]), array('i'), array('d')
+            for entry in entries:
+                for score, _, neighbor_id in similar_index.neighbor_list(entry):
+                    rows.append(row_of[neighbor_id])
+                    scores.append(score)
+                indptr.append(len(rows))
+            sections.update(neighbor_indptr=indptr, neighbor_rows=rows, neighbor_scores=scores)
+
+        if text_index is not None:
+            # One column per term. Term frequencies (for later edits) and
+            # TF-IDF weights share the CSR layout, since a vector has the
+            # terms of its document; the float32 copy and its row norms are
+            # SparseTfidfMatrix's arrays.
+            terms = list(text_index.df)
+            column_of = {term: column for column, term in enumerate(terms)}
+            digests, indptr, columns = array('i'), array('q', [0]), array('i')
+            tf_values, tfidf_values, tfidf_data = array('d'), array('d'), array('f')
+            text_norms, tfidf_norms = array('d'), array('d')
+            for entry in entries:
+                digest, tf = text_index.docs[entry.id]
+                vector, norm = text_index.vectors[entry.id]
+                digests.append(string_id(digest))
+                start = len(tfidf_data)
+                for term, value in tf.items():
+                    columns.append(column_of[term])
+                    tf_values.append(value)
+                    tfidf_values.append(vector[term])
+                    tfidf_data.append(vector[term])
+                indptr.append(len(columns))
+                text_norms.append(norm)
+                tfidf_norms.append(math.sqrt(sum(v * v for v in tfidf_data[start:])))
+            sections.update(
+                text_terms=array('i', map(string_id, terms)),
+                text_df=array('q', (text_index.df[term] for term in terms)),
+                text_idf=array('d', (text_index.idf.get(term, math.nan) for term in terms)),
+                text_digest=digests, tf_indptr=indptr, tf_columns=columns, tf_values=tf_values,
+                tfidf_values=tfidf_values, tfidf_data=tfidf_data, text_norms=text_norms, tfidf_norms=tfidf_norms,
+            )
+
+        encoded = [value.encode('utf-8') for value in string_ids]
+        string_offsets = array('q', [0])
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+        sections.update(string_offsets=string_offsets, strings=b''.join(encoded))
+
+        # Lay the sections out after the header, each 8-byte aligned; the
+        # header's size depends on the offsets, so grow it until it fits
+        blobs = {
+            name: (bytes(data) if isinstance(data, (bytes, bytearray)) else data.tobytes(),
+                   getattr(data, 'typecode', 'B'))
+            for name, data in sections.items()
+        }
+        reserved = 0
+        while True:
+            offset = -(-(len(cls.MAGIC) + cls.HEADER_LENGTH.size + reserved) // 8) * 8
+            table = {}
+            for name, (blob, typecode) in blobs.items():
+                table[name] = [offset, len(blob), typecode]
+                offset = -(-(offset + len(blob)) // 8) * 8
+            header = json_dumps({
+                'version': cls.FORMAT_VERSION,
+                'byteorder': sys.byteorder,
+                'ids': [entry.id for entry in entries],
+                'similar_size': similar_index.size if similar_index is not None else None,
+                'text_weight': text_weight if text_index is not None else None,
+                'text_idf_docs': text_index._snapshot_docs if text_index is not None else None,
+                'text_idf_changes': text_index._changes if text_index is not None else None,
+                'sections': table,
+            }).encode('utf-8')
+            if len(header) <= reserved:
+                break
+            reserved = len(header) + 64
+
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.MAGIC + cls.HEADER_LENGTH.pack(len(header)) + header)
+            for name, (blob, _) in blobs.items():
+                f.seek(table[name][0])
+                f.write(blob)
+        os.replace(tmp_path, path)
+
+
+def extract_job_interests(job: Dict, interests: Dict, weight: float):
+    """Extract interest signals from a job."""
+    # Skills
+    for skill in job.get('skills_required', []) or job.get('skillsRequired', []) or []:
+        interests['skills'][skill.lower()] += weight
+
+    # Job type
+    job_type = job.get('job_type') or job.get('jobType')
+    if job_type:
+        interests['job_types'][job_type.lower()] += weight
+
+    # Location
+    location = job.get('location')
+    if location:
+        interests['locations'][location.lower()] += weight
+
+    # Experience level
+    exp_level = job.get('experience_level') or job.get('experienceLevel')
+    if exp_level:
+        interests['experience_levels'][exp_level.lower()] += weight
+
+    # Industry (from company if available)
+    industry = job.get('industry')
+    if industry:
+        interests['industries'][industry.lower()] += weight
+
+    # Salary range
+    salary_min = job.get('salary_min') or job.get('salaryMin')
+    salary_max = job.get('salary_max') or job.get('salaryMax')
+    if salary_min:
+        if interests['salary_range']['min'] is None:
+            interests['salary_range']['min'] = salary_min
+        else:
+            interests['salary_range']['min'] = min(interests['salary_range']['min'], salary_min)
+    if salary_max:
+        if interests['salary_range']['max'] is None:
+            interests['salary_range']['max'] = salary_max
+        else:
+            interests['salary_range']['max'] = max(interests['salary_range']['max'], salary_max)
+
+
+# Interest weight of each kind of user event
+INTEREST_EVENT_WEIGHTS = {
+    'applied': 1.0,      # Highest weight - user took action
+    'saved': 0.7,        # High weight - user showed interest
+    'viewed': 0.3,       # Lower weight - just browsed
+    'profile': 0.5       # Medium weight - self-declared
+}
+
+INTEREST_CATEGORIES = ('skills', 'industries', 'job_types', 'locations', 'experience_levels')
+
+
+def _as_timestamp(value) -> float:
+    """Epoch seconds from None (now), a number, or an ISO 8601 string."""
+    if value is None:
+        return time.time()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    return float(value)
+
+
+class InterestProfile:
+    """
+    Raw, un-normalized interest weights of one user, updated per event.
+
+    Applying an apply/save/view event costs time proportional to the job's
+    fields; the max-normalized view that scoring uses is computed lazily on
+    read and cached until the next event.
+
+    With half_life_days, older events count for less. Instead of decaying
+    every stored weight, each new weight is inflated by 2^(age/half-life)
+    relative to a reference time; max-normalization cancels the common
+    factor, and weights are rebased before the factor can overflow.
+    """
+
+    # Rebase once new weights would be inflated by more than 2^this
+    MAX_DECAY_EXPONENT = 256
+
+    def __init__(self, half_life_days: Optional[float] = None):
+        self.weights = {category: defaultdict(float) for category in INTEREST_CATEGORIES}
+        self.salary_range = {'min': None, 'max': None}
+        self.profile_skills: List[str] = []
+        # Inflation the profile skills were added with, to take them back out
+        self.profile_scale = 1.0
+        self.total_interactions = 0
+        self.half_life_days = half_life_days
+        self.reference_time: Optional[float] = None
+        self._normalized: Optional[Dict] = None
+
+    def _scale(self, timestamp=None) -> float:
+        if not self.half_life_days:
+            return 1.0
+        timestamp = _as_timestamp(timestamp)
+        if self.reference_time is None:
+            self.reference_time = timestamp
+        exponent = (timestamp - self.reference_time) / (self.half_life_days * 86400)
+        if exponent > self.MAX_DECAY_EXPONENT:
+            self._rebase(exponent)
+            self.reference_time = timestamp
+            exponent = 0.0
+        return 2.0 ** exponent
+
+    def _rebase(self, exponent: float):
+        factor = 2.0 ** -exponent
+        for weights in self.weights.values():
+            for key in list(weights):
+                weights[key] *= factor
+                if not weights[key]:
+                    # Decayed below float range; forget it
+                    del weights[key]
+        self.profile_scale *= factor
+
+    def set_profile_skills(self, skills: List[str], timestamp=None):
+        """Replace the user's self-declared skills."""
+        skill_weights = self.weights['skills']
+        weight = INTEREST_EVENT_WEIGHTS['profile']
+        for skill in self.profile_skills:
+            key = skill.lower()
+            skill_weights[key] -= weight * self.profile_scale
+            if skill_weights[key] <= 1e-12:
+                del skill_weights[key]
+
+        scale = self._scale(timestamp)
+        for skill in skills:
+            skill_weights[skill.lower()] += weight * scale
+        self.profile_skills = list(skills)
+        self.profile_scale = scale
+        self._normalized = None
+
+    def add_event(self, event: str, job: Dict, timestamp=None):
+        """Apply one 'applied', 'saved' or 'viewed' event for job."""
+        if event not in INTEREST_EVENT_WEIGHTS or event == 'profile':
+            raise ValueError(f'Unknown interest event: {event}')
+        weight = INTEREST_EVENT_WEIGHTS[event] * self._scale(timestamp)
+        interests = dict(self.weights, salary_range=self.salary_range)
+        extract_job_interests(job, interests, weight)
+        self.total_interactions += 1
+        self._normalized = None
+
+    def normalized(self) -> Dict:
+        """Interests scaled so the top key of each category is 1.0; do not mutate."""
+        if self._normalized is None:
+            interests = {}
+            for category in INTEREST_CATEGORIES:
+                weights = self.weights[category]
+                max_val = max(weights.values()) if weights else 0
+                if max_val > 0:
+                    interests[category] = {k: v / max_val for k, v in weights.items()}
+                else:
+                    interests[category] = dict(weights)
+            interests['salary_range'] = dict(self.salary_range)
+            self._normalized = interests
+        return self._normalized
+
+    def to_dict(self) -> Dict:
+        """Raw state for storage, restored by from_dict()."""
+        return {
+            'weights': {category: dict(weights) for category, weights in self.weights.items()},
+            'salary_range': dict(self.salary_range),
+            'profile_skills': list(self.profile_skills),
+            'profile_scale': self.profile_scale,
+            'total_interactions': self.total_interactions,
+            'half_life_days': self.half_life_days,
+            'reference_time': self.reference_time,
+        }
+
+    def set_half_life(self, half_life_days: Optional[float], timestamp=None):
+        """
+        Decay later events with half_life_days instead. Earlier events keep
+        the weight they have decayed to by timestamp under the old half-life.
+        """
+        if half_life_days == self.half_life_days:
+            return
+        if self.half_life_days and self.reference_time is not None:
+            timestamp = _as_timestamp(timestamp)
+            exponent = (timestamp - self.reference_time) / (self.half_life_days * 86400)
+            if exponent > 0:
+                self._rebase(exponent)
+            self.reference_time = timestamp
+        self.half_life_days = half_life_days
+        self._normalized = None
+
+    @classmethod
+    def from_dict(cls, state: Dict, half_life_days: Optional[float] = None,
+                  timestamp=None) -> 'InterestProfile':
+        """
+        Restore a to_dict() state that decays with half_life_days. A state
+        stored under another half-life is switched over at timestamp (now
+        by default), see set_half_life().
+        """
+        profile = cls(state.get('half_life_days'))
+        for category in INTEREST_CATEGORIES:
+            profile.weights[category].update((state.get('weights') or {}).get(category) or {})
+        profile.salary_range.update(state.get('salary_range') or {})
+        profile.profile_skills = list(state.get('profile_skills') or [])
+        profile.profile_scale = state.get('profile_scale', 1.0)
+        profile.total_interactions = state.get('total_interactions', 0)
+        profile.reference_time = state.get('reference_time')
+        profile.set_half_life(half_life_days, timestamp)
+        return profile
+
+
 class JobRecommendationEngine:
     """Main recommendation engine combining multiple algorithms."""
 
-    def __init__(self):
+    def __init__(self, use_numpy: Optional[bool] = None):
         self.text_processor = TextProcessor()
         self.skill_matcher = SkillMatcher()
+        self.catalog = JobCatalog(self.skill_matcher)
+        # Vectorized catalog scoring; defaults to on when numpy is installed
+        self.use_numpy = np is not None if use_numpy is None else bool(use_numpy and np is not None)
+        self._vectorized: Optional[VectorizedScorer] = None
+        # Precomputed similar-jobs table, see enable_similar_index()
+        self.similar_index: Optional[SimilarJobsIndex] = None
+        # Approximate similar-jobs lookup, see enable_approximate_similar()
+        self.lsh_index: Optional[MinHashLSH] = None
+        # Description similarity term, see enable_text_similarity()
+        self.text_index: Optional[TextSimilarityIndex] = None
+        self.text_weight = 0.0
+        # Incrementally updated interest profiles by user id, least recently
+        # used first, see interest_profile()
+        self.profiles: OrderedDict = OrderedDict()
+        self.max_profiles = 10000
+        self.interest_half_life_days: Optional[float] = None
+
+    def enable_similar_index(self, size: int = 20) -> SimilarJobsIndex:
+        """
+        Keep the top `size` similar jobs per catalog job, computed on a job's
+        first lookup and maintained across catalog changes.
+        """
+        if self.similar_index is not None:
+            self.catalog.listeners.remove(self.similar_index)
+        self.similar_index = SimilarJobsIndex(self.catalog, size)
+        return self.similar_index
+
+    def enable_text_similarity(self, weight: float = 0.15, path: Optional[str] = None) -> TextSimilarityIndex:
+        """
+        Blend TF-IDF description similarity into recommendation and
+        similar-job scores with the given weight.
+
+        While enabled, catalog searches score every job (NumPy ranking still
+        applies): the candidate index only bounds the skill/interest terms,
+        precomputed similar-job tables are bypassed, and approximate
+        similar-job search is rejected since LSH buckets ignore descriptions.
+        """
+        if self.text_index is not None:
+            self.catalog.listeners.remove(self.text_index)
+        self.text_index = TextSimilarityIndex(self.catalog, self.text_processor, path)
+        self.text_weight = weight
+        return self.text_index
+
+    def export_snapshot(self, path: str):
+        """Write the catalog and its similar-jobs and text indexes to a CatalogSnapshot file."""
+        CatalogSnapshot.write(path, self.catalog, self.similar_index, self.text_index, self.text_weight)
+
+    def load_snapshot(self, path: str) -> CatalogSnapshot:
+        """
+        Replace the catalog with a snapshot written by export_snapshot.
+
+        A similar-jobs table or text index stored in the snapshot is
+        restored, and enabled if it was not, rather than recomputed. An
+        enabled similar-jobs table of a different size is rebuilt.
+        """
+        snapshot = CatalogSnapshot(path)
+        similar, text = self.similar_index, self.text_index
+        restore_similar = bool(snapshot.similar_size) and (similar is None or similar.size == snapshot.similar_size)
+        restore_text = snapshot.text_weight is not None
+        if restore_similar and similar is not None:
+            self.catalog.listeners.remove(similar)
+        if restore_text and text is not None:
+            self.catalog.listeners.remove(text)
+
+        self.catalog.load_records(snapshot.records())
+
+        if restore_similar:
+            self.similar_index = SimilarJobsIndex(self.catalog, snapshot.similar_size, snapshot)
+        if restore_text:
+            self.text_index = TextSimilarityIndex(
+                self.catalog, self.text_processor, text.path if text is not None else None,
+                stored=snapshot
+            )
+            if text is None:
+                self.text_weight = snapshot.text_weight
+        return snapshot
+
+    def enable_approximate_similar(self, bands: int = 16, rows: int = 4, seed: int = 1) -> MinHashLSH:
+        """Build the MinHash/LSH index used by get_similar_jobs(approximate=True)."""
+        if self.lsh_index is not None:
+            self.catalog.listeners.remove(self.lsh_index)
+        self.lsh_index = MinHashLSH(self.catalog, bands, rows, seed)
+        return self.lsh_index
+
+    def measure_similar_recall(self, sample_size: int = 200, limit: int = 5, seed: int = 0) -> Dict:
+        """
+        Compare approximate similar jobs with the exact scan on a sample.
+
+        Recall is the share of exact top-`limit` neighbors that the
+        approximate lookup also returns.
+        """
+        if self.lsh_index is None:
+            self.enable_approximate_similar()
+        lsh = self.lsh_index
+
+        job_ids = [entry.id for entry in self.catalog]
+        sample = random.Random(seed).sample(job_ids, min(sample_size, len(job_ids)))
+
+        expected = found = candidates = 0
+        for job_id in sample:
+            entry = self.catalog.get(job_id)
+            exact = {job['id'] for job in self._scan_similar(entry, None, limit)}
+            approximate = {job['id'] for job in lsh.query(entry, limit)}
+            expected += len(exact)
+            found += len(exact & approximate)
+            candidates += len(lsh.candidates(entry))
+
+        return {
+            'recall': round(found / expected, 4) if expected else 1.0,
+            'sampled_jobs': len(sample),
+            'avg_candidates': round(candidates / len(sample), 1) if sample else 0.0,
+            'catalog_size': len(job_ids),
+            'bands': lsh.bands,
+            'rows': lsh.rows,
+            'jaccard_threshold': round(lsh.threshold, 3),
+        }
 
     def cosine_similarity(self, vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -184,6 +2056,9 @@ class JobRecommendationEngine:
         """
         Learn user interests from their behavior.
 
+        Replays the whole history; see InterestProfile for applying events
+        one at a time.
+
         Args:
             user_data: {
                 'profile_skills': [...],
@@ -195,83 +2070,83 @@ class JobRecommendationEngine:
         Returns:
             Interest profile with weighted scores
         """
-        interests = {
-            'skills': defaultdict(float),
-            'industries': defaultdict(float),
-            'job_types': defaultdict(float),
-            'locations': defaultdict(float),
-            'experience_levels': defaultdict(float),
-            'salary_range': {'min': None, 'max': None}
-        }
-
-        # Weight different sources
-        weights = {
-            'applied': 1.0,      # Highest weight - user took action
-            'saved': 0.7,        # High weight - user showed interest
-            'viewed': 0.3,       # Lower weight - just browsed
-            'profile': 0.5       # Medium weight - self-declared
-        }
-
-        # Process profile skills
-        for skill in user_data.get('profile_skills', []):
-            interests['skills'][skill.lower()] += weights['profile']
+        profile = InterestProfile()
+        profile.set_profile_skills(user_data.get('profile_skills', []))
 
         # Process applied jobs
         for job in user_data.get('applied_jobs', []):
-            self._extract_job_interests(job, interests, weights['applied'])
+            profile.add_event('applied', job)
 
         # Process saved jobs
         for job in user_data.get('saved_jobs', []):
-            self._extract_job_interests(job, interests, weights['saved'])
+            profile.add_event('saved', job)
 
-        # Normalize scores
-        for category in ['skills', 'industries', 'job_types', 'locations', 'experience_levels']:
-            if interests[category]:
-                max_val = max(interests[category].values())
-                if max_val > 0:
-                    interests[category] = {k: v / max_val for k, v in interests[category].items()}
+        return profile.normalized()
 
-        return dict(interests)
+    def interest_profile(self, user_id=None, state: Optional[Dict] = None) -> 'InterestProfile':
+        """
+        Interest profile of a user: restored from a stored state, the resident
+        profile kept for user_id, or a new empty one. Profiles for a user_id
+        stay resident so later events and recommendations reuse them, up to
+        max_profiles; the least recently used are dropped past that.
+        """
+        if state is None:
+            profile = self._resident_profile(user_id)
+            if profile is not None:
+                return profile
+            profile = InterestProfile(self.interest_half_life_days)
+        else:
+            profile = InterestProfile.from_dict(state, self.interest_half_life_days)
+        if user_id is not None:
+            profiles = self.profiles
+            profiles[user_id] = profile
+            profiles.move_to_end(user_id)
+            while len(profiles) > self.max_profiles:
+                profiles.popitem(last=False)
+        return profile
+
+    def _resident_profile(self, user_id) -> Optional['InterestProfile']:
+        profile = self.profiles.get(user_id)
+        if profile is not None:
+            self.profiles.move_to_end(user_id)
+            profile.set_half_life(self.interest_half_life_days)
+        return profile
+
+    def record_interest_event(self, profile: 'InterestProfile', event: str, job: Optional[Dict] = None,
+                              job_id=None, timestamp=None) -> 'InterestProfile':
+        """
+        Apply one apply/save/view event to profile, looking job_id up in the
+        catalog when the job itself is not given. 'profile' events replace
+        the self-declared skills with job['skills'].
+        """
+        if event == 'profile':
+            profile.set_profile_skills((job or {}).get('skills', []), timestamp)
+            return profile
+        if job is None:
+            entry = self.catalog.get(job_id)
+            if entry is None:
+                raise ValueError(f'Job not found: {job_id}')
+            job = entry.job
+        profile.add_event(event, job, timestamp)
+        return profile
+
+    def _user_interests(self, user_data: Dict) -> Dict:
+        """
+        Normalized interests for a recommendation request: from a stored
+        profile state or the user's resident profile when available, so
+        the history is only replayed for users without one.
+        """
+        state = user_data.get('interest_profile')
+        if state is not None:
+            return InterestProfile.from_dict(state, self.interest_half_life_days).normalized()
+        profile = self._resident_profile(user_data.get('user_id'))
+        if profile is not None:
+            return profile.normalized()
+        return self.learn_user_interests(user_data)
 
     def _extract_job_interests(self, job: Dict, interests: Dict, weight: float):
         """Extract interest signals from a job."""
-        # Skills
-        for skill in job.get('skills_required', []) or job.get('skillsRequired', []) or []:
-            interests['skills'][skill.lower()] += weight
-
-        # Job type
-        job_type = job.get('job_type') or job.get('jobType')
-        if job_type:
-            interests['job_types'][job_type.lower()] += weight
-
-        # Location
-        location = job.get('location')
-        if location:
-            interests['locations'][location.lower()] += weight
-
-        # Experience level
-        exp_level = job.get('experience_level') or job.get('experienceLevel')
-        if exp_level:
-            interests['experience_levels'][exp_level.lower()] += weight
-
-        # Industry (from company if available)
-        industry = job.get('industry')
-        if industry:
-            interests['industries'][industry.lower()] += weight
-
-        # Salary range
-        salary_min = job.get('salary_min') or job.get('salaryMin')
-        salary_max = job.get('salary_max') or job.get('salaryMax')
-        if salary_min:
-            if interests['salary_range']['min'] is None:
-                interests['salary_range']['min'] = salary_min
-            else:
-                interests['salary_range']['min'] = min(interests['salary_range']['min'], salary_min)
-        if salary_max:
-            if interests['salary_range']['max'] is None:
-                interests['salary_range']['max'] = salary_max
-            else:
-                interests['salary_range']['max'] = max(interests['salary_range']['max'], salary_max)
+        extract_job_interests(job, interests, weight)
 
     def calculate_job_score(
         self,
@@ -286,19 +2161,77 @@ class JobRecommendationEngine:
 
         Returns score breakdown and total score.
         """
-        job_id = job.get('id')
-
         # Skip already applied jobs
-        if applied_job_ids and job_id in applied_job_ids:
+        if applied_job_ids and job.get('id') in applied_job_ids:
             return None
 
-        job_skills = job.get('skills_required', []) or job.get('skillsRequired', []) or []
+        user_context = self._build_user_context(user_skills, user_interests, saved_job_ids)
+        return self._score_entry(self.catalog.build_entry(job), user_context)
+
+    def _build_user_context(
+        self,
+        user_skills: List[str],
+        user_interests: Optional[Dict],
+        saved_job_ids: Optional[set]
+    ) -> Dict:
+        """Precompute the per-user inputs shared by every job score."""
+        user_normalized = set(self.skill_matcher.normalize_skill(s) for s in user_skills or [])
+        return {
+            'skills_normalized': user_normalized,
+            'categories': self.skill_matcher.categories_for(user_normalized),
+            'interests': user_interests,
+            'saved_job_ids': saved_job_ids or set(),
+            # Text profile of the user when text similarity is on: its
+            # (vector, norm), cosine to every catalog row and the row ids
+            'text_vector': None,
+            'text_scores': None,
+            'text_rows': {},
+            'text_weight': self.text_weight,
+        }
+
+    def _score_entry(self, entry: JobRecord, user_context: Dict, min_score: Optional[float] = None) -> Optional[Dict]:
+        """
+        Score one catalog entry against a prepared user context.
+
+        If min_score is given, returns None as soon as the job's best possible
+        rounded total cannot exceed it, skipping the interest and salary work.
+        """
+        job_id = entry.id
+        job_skills = entry.skills_lower
+        user_interests = user_context['interests']
 
         # 1. Skill Match Score (40% weight)
-        skill_score, matching_skills, related_skills = self.skill_matcher.calculate_skill_match(
-            user_skills, job_skills
+        skill_score, matching_skills, related_skills = self.skill_matcher.match_normalized(
+            user_context['skills_normalized'], user_context['categories'], entry.skills_normalized
         )
 
+        # 3. Saved Job Boost (10% weight)
+        saved_boost = 0.0
+        if job_id in user_context['saved_job_ids']:
+            saved_boost = 1.0
+
+        # 4. Recency Score (10% weight)
+        recency_score = 1.0  # Default to max if no date
+        if entry.has_created_at:
+            # Jobs posted in last 7 days get full score, decays after
+            # This would need proper date parsing in production
+            recency_score = 0.8  # Simplified for now
+
+        text_vector = user_context['text_vector']
+        if min_score is not None:
+            # Interest scores are normalized to at most 1.0, salary to at most 0.8
+            best_case = (
+                skill_score * 0.40 +
+                (1.0 if user_interests else 0.0) * 0.30 +
+                saved_boost * 0.10 +
+                recency_score * 0.10 +
+                0.8 * 0.10
+            )
+            if text_vector is not None:
+                best_case = best_case * (1 - self.text_weight) + 1.0 * self.text_weight
+            if round(best_case * 100, 1) <= min_score:
+                return None
+
         # 2. Interest Match Score (30% weight)
         interest_score = 0.0
         interest_breakdown = {}
@@ -307,28 +2240,27 @@ class JobRecommendationEngine:
             # Skill interest alignment
             skill_interest_score = 0.0
             if user_interests.get('skills'):
+                skill_interests = user_interests['skills']
                 for skill in job_skills:
-                    skill_interest_score += user_interests['skills'].get(skill.lower(), 0)
+                    skill_interest_score += skill_interests.get(skill, 0)
                 if job_skills:
                     skill_interest_score /= len(job_skills)
             interest_breakdown['skills'] = skill_interest_score
 
             # Job type alignment
-            job_type = (job.get('job_type') or job.get('jobType', '')).lower()
-            type_score = user_interests.get('job_types', {}).get(job_type, 0)
+            type_score = user_interests.get('job_types', {}).get(entry.job_type, 0)
             interest_breakdown['job_type'] = type_score
 
             # Location alignment
-            location = (job.get('location') or '').lower()
+            location = entry.location
             location_score = user_interests.get('locations', {}).get(location, 0)
             # Boost remote jobs if user has shown interest
-            if 'remote' in location.lower():
+            if 'remote' in location:
                 location_score = max(location_score, user_interests.get('locations', {}).get('remote', 0))
             interest_breakdown['location'] = location_score
 
             # Experience level alignment
-            exp_level = (job.get('experience_level') or job.get('experienceLevel', '')).lower()
-            exp_score = user_interests.get('experience_levels', {}).get(exp_level, 0)
+            exp_score = user_interests.get('experience_levels', {}).get(entry.experience_level, 0)
             interest_breakdown['experience'] = exp_score
 
             # Combined interest score
@@ -339,26 +2271,13 @@ class JobRecommendationEngine:
                 exp_score * 0.2
             )
 
-        # 3. Saved Job Boost (10% weight)
-        saved_boost = 0.0
-        if saved_job_ids and job_id in saved_job_ids:
-            saved_boost = 1.0
-
-        # 4. Recency Score (10% weight)
-        recency_score = 1.0  # Default to max if no date
-        created_at = job.get('created_at') or job.get('createdAt')
-        if created_at:
-            # Jobs posted in last 7 days get full score, decays after
-            # This would need proper date parsing in production
-            recency_score = 0.8  # Simplified for now
-
         # 5. Salary Match Score (10% weight)
         salary_score = 0.5  # Neutral default
         if user_interests and user_interests.get('salary_range'):
             user_min = user_interests['salary_range'].get('min')
             user_max = user_interests['salary_range'].get('max')
-            job_min = job.get('salary_min') or job.get('salaryMin')
-            job_max = job.get('salary_max') or job.get('salaryMax')
+            job_min = entry.salary_min
+            job_max = entry.salary_max
 
             if job_min and job_max and (user_min or user_max):
                 # Check overlap
@@ -378,9 +2297,8 @@ class JobRecommendationEngine:
             salary_score * 0.10
         )
 
-        return {
+        result = {
             'job_id': job_id,
-            'total_score': round(total_score * 100, 1),
             'skill_score': round(skill_score * 100, 1),
             'interest_score': round(interest_score * 100, 1),
             'matching_skills': matching_skills,
@@ -389,10 +2307,35 @@ class JobRecommendationEngine:
             'is_saved': saved_boost > 0
         }
 
+        # 6. Description similarity, blended in when enabled
+        if text_vector is not None:
+            row = user_context['text_rows'].get(job_id)
+            if row is not None and self.catalog.get(job_id) is entry:
+                text_score = float(user_context['text_scores'][row])
+            else:
+                text_score = self.text_index.cosine(text_vector, self.text_index.vector_for(entry))
+            total_score = total_score * (1 - self.text_weight) + text_score * self.text_weight
+            result['text_score'] = round(text_score * 100, 1)
+
+        result['total_score'] = round(total_score * 100, 1)
+        return result
+
+    def _vectorized_scorer(self) -> 'VectorizedScorer':
+        """NumPy encoding of the catalog, rebuilt when the catalog changes."""
+        if self._vectorized is None or self._vectorized.version != self.catalog.version:
+            self._vectorized = VectorizedScorer(self.catalog)
+        return self._vectorized
+
+    def _entries_for(self, all_jobs: Optional[List[Dict]]):
+        """Catalog entries to score: the resident catalog, or a one-off job list."""
+        if all_jobs is None:
+            return self.catalog
+        return [self.catalog.build_entry(job) for job in all_jobs]
+
     def get_recommendations(
         self,
         user_data: Dict,
-        all_jobs: List[Dict],
+        all_jobs: Optional[List[Dict]] = None,
         limit: int = 20
     ) -> List[Dict]:
         """
@@ -400,121 +2343,677 @@ class JobRecommendationEngine:
 
         Args:
             user_data: User profile and behavior data
-            all_jobs: List of all available jobs
+            all_jobs: List of all available jobs, or None to use the resident catalog
             limit: Maximum number of recommendations
 
         Returns:
             List of recommended jobs with scores
         """
+        if limit <= 0:
+            return []
+
         user_skills = user_data.get('profile_skills', [])
         applied_job_ids = set(user_data.get('applied_job_ids', []))
         saved_job_ids = set(user_data.get('saved_job_ids', []))
 
         # Learn user interests from behavior
-        user_interests = self.learn_user_interests(user_data)
-
-        # Score all jobs
-        scored_jobs = []
-        for job in all_jobs:
-            score_result = self.calculate_job_score(
-                job,
-                user_skills,
-                user_interests,
-                applied_job_ids,
-                saved_job_ids
+        user_interests = self._user_interests(user_data)
+        user_context = self._build_user_context(user_skills, user_interests, saved_job_ids)
+        if self.text_index is not None:
+            user_context['text_vector'] = self.text_index.user_vector(user_data)
+            if all_jobs is None:
+                matrix = self.text_index.matrix()
+                user_context['text_scores'] = matrix.similarities(user_context['text_vector'])
+                user_context['text_rows'] = matrix.row_of
+
+        if all_jobs is None and self.use_numpy:
+            # Rank the whole catalog in NumPy; only the top entries are rescored below
+            entries = self._vectorized_scorer().rank(user_context, applied_job_ids, 20, limit)
+        elif all_jobs is None and self.text_index is not None:
+            # The text term can lift any job over the threshold; score them all
+            entries = self.catalog
+        elif all_jobs is None:
+            # Only jobs that share a skill, category or interest key can pass the threshold
+            entries = self.catalog.candidates(
+                user_context['skills_normalized'], user_context['categories'],
+                user_interests, saved_job_ids
             )
+        else:
+            entries = self._entries_for(all_jobs)
+
+        # Keep only the best `limit` jobs in a min-heap keyed by (score, -position),
+        # which reproduces a stable descending sort; jobs that cannot beat the
+        # current K-th score are cut short inside _score_entry
+        top = []
+        for position, entry in enumerate(entries):
+            # Skip already applied jobs
+            if entry.id in applied_job_ids:
+                continue
 
-            if score_result and score_result['total_score'] > 20:  # Minimum threshold
-                job_with_score = {
-                    **job,
-                    'match_score': score_result['total_score'],
-                    'skill_match': score_result['skill_score'],
-                    'interest_match': score_result['interest_score'],
-                    'matching_skills': score_result['matching_skills'],
-                    'related_skills': score_result['related_skills'],
-                    'is_saved': score_result['is_saved']
-                }
-                scored_jobs.append(job_with_score)
+            min_score = top[0][0] if len(top) >= limit else 20  # Minimum threshold
+            score_result = self._score_entry(entry, user_context, min_score)
+            if score_result is None or score_result['total_score'] <= 20:
+                continue
 
-        # Sort by score and return top N
-        scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
-        return scored_jobs[:limit]
+            item = (score_result['total_score'], -position, entry, score_result)
+            if len(top) < limit:
+                heapq.heappush(top, item)
+            elif item[:2] > top[0][:2]:
+                heapq.heapreplace(top, item)
+
+        top.sort(key=lambda item: item[:2], reverse=True)
+        return [
+            {
+                **entry.job,
+                'match_score': score_result['total_score'],
+                'skill_match': score_result['skill_score'],
+                'interest_match': score_result['interest_score'],
+                'matching_skills': score_result['matching_skills'],
+                'related_skills': score_result['related_skills'],
+                'is_saved': score_result['is_saved'],
+                **({'text_match': score_result['text_score']} if 'text_score' in score_result else {})
+            }
+            for _, _, entry, score_result in top
+        ]
 
-    def get_similar_jobs(self, target_job: Dict, all_jobs: List[Dict], limit: int = 5) -> List[Dict]:
+    def get_similar_jobs(
+        self,
+        target_job: Dict,
+        all_jobs: Optional[List[Dict]] = None,
+        limit: int = 5,
+        approximate: bool = False
+    ) -> List[Dict]:
         """
         Find jobs similar to a given job.
         Useful for "You might also like" suggestions.
+
+        When all_jobs is None the resident catalog is searched, and a target
+        that is already in the catalog (it may be given by id alone) is taken
+        from there. With approximate=True the catalog search only scores
+        MinHash/LSH bucket collisions (see measure_similar_recall), which
+        does not support text similarity.
         """
-        if not target_job:
+        if approximate and self.text_index is not None:
+            raise ValueError('Approximate similar jobs do not support text similarity')
+        if not target_job or limit <= 0:
             return []
 
-        target_skills = set(s.lower() for s in (target_job.get('skills_required', []) or target_job.get('skillsRequired', []) or []))
-        target_type = (target_job.get('job_type') or target_job.get('jobType', '')).lower()
-        target_location = (target_job.get('location') or '').lower()
         target_id = target_job.get('id')
-
-        similar_jobs = []
-        for job in all_jobs:
-            if job.get('id') == target_id:
+        target = None
+        if all_jobs is None:
+            if approximate:
+                if self.lsh_index is None:
+                    self.enable_approximate_similar()
+                entry = self.catalog.get(target_id) or self.catalog.build_entry(target_job)
+                return self.lsh_index.query(entry, limit)
+            # The precomputed table ranks without the text term
+            if self.similar_index is not None and self.text_index is None:
+                similar = self.similar_index.get(target_id, limit)
+                if similar is not None:
+                    return similar
+            target = self.catalog.get(target_id)
+        if target is None:
+            target = self.catalog.build_entry(target_job)
+
+        return self._scan_similar(target, all_jobs, limit)
+
+    def _scan_similar(self, target: JobRecord, all_jobs: Optional[List[Dict]], limit: int) -> List[Dict]:
+        """Exact similar jobs by a linear scan of all_jobs or the catalog."""
+        target_id = target.id
+        target_skills = target.skills_lower_set
+        target_type = target.job_type
+        target_location = target.location
+        text_index, text_weight = self.text_index, self.text_weight
+        target_text = text_index.vector_for(target) if text_index is not None else None
+        text_scores, text_rows = None, {}
+        if target_text is not None and all_jobs is None:
+            matrix = text_index.matrix()
+            text_scores, text_rows = matrix.similarities(target_text), matrix.row_of
+
+        # Bounded min-heap of (rounded score, -position), as in get_recommendations
+        top = []
+        for position, entry in enumerate(self._entries_for(all_jobs)):
+            if entry.id == target_id:
                 continue
 
-            job_skills = set(s.lower() for s in (job.get('skills_required', []) or job.get('skillsRequired', []) or []))
+            job_skills = entry.skills_lower_set
+            type_match = 1.0 if entry.job_type == target_type else 0.0
+            location_match = 1.0 if entry.location == target_location else 0.0
+
+            if len(top) >= limit:
+                # Jaccard overlap is at most |smaller set| / |larger set|
+                larger = max(len(target_skills), len(job_skills))
+                best_overlap = min(len(target_skills), len(job_skills)) / larger if larger else 0.0
+                best_case = best_overlap * 0.6 + type_match * 0.2 + location_match * 0.2
+                if target_text is not None:
+                    best_case = best_case * (1 - text_weight) + 1.0 * text_weight
+                if round(best_case * 100, 1) <= top[0][0]:
+                    continue
 
             # Calculate similarity
             skill_overlap = len(target_skills & job_skills) / max(len(target_skills | job_skills), 1)
-            type_match = 1.0 if (job.get('job_type') or job.get('jobType', '')).lower() == target_type else 0.0
-            location_match = 1.0 if (job.get('location') or '').lower() == target_location else 0.0
-
             similarity = skill_overlap * 0.6 + type_match * 0.2 + location_match * 0.2
+            if target_text is not None:
+                row = text_rows.get(entry.id)
+                if row is not None:
+                    text_score = float(text_scores[row])
+                else:
+                    text_score = text_index.cosine(target_text, text_index.vector_for(entry))
+                similarity = similarity * (1 - text_weight) + text_score * text_weight
 
             if similarity > 0.3:
-                similar_jobs.append({
-                    **job,
-                    'similarity_score': round(similarity * 100, 1)
-                })
+                item = (round(similarity * 100, 1), -position, entry)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item[:2] > top[0][:2]:
+                    heapq.heapreplace(top, item)
+
+        top.sort(key=lambda item: item[:2], reverse=True)
+        return [{**entry.job, 'similarity_score': score} for score, _, entry in top]
+
+    def get_recommendations_batch(
+        self,
+        users: List[Dict],
+        all_jobs: Optional[List[Dict]] = None,
+        limit: int = 20,
+        workers: int = 1
+    ):
+        """
+        Get recommendations for many users against one catalog.
+
+        Args:
+            users: [{'user_id': ..., 'user_data': {...}}, ...]
+            all_jobs: Jobs to load into the resident catalog once before
+                scoring, or None to use the catalog as it is
+            limit: Maximum number of recommendations per user
+            workers: Number of worker processes to shard users across
+
+        Yields:
+            (user_id, recommendations) per user, in input order
+        """
+        if all_jobs is not None:
+            self.catalog.load(all_jobs)
+
+        if workers > 1:
+            chunks = [(users[i:i + BATCH_CHUNK_SIZE], limit) for i in range(0, len(users), BATCH_CHUNK_SIZE)]
+            yield from self._parallel_map(_recommend_chunk, chunks, workers)
+            return
+
+        for user in users:
+            user_data = user.get('user_data', user)
+            user_id = user.get('user_id', user_data.get('user_id'))
+            yield user_id, self.get_recommendations(user_data, None, limit)
 
-        similar_jobs.sort(key=lambda x: x['similarity_score'], reverse=True)
-        return similar_jobs[:limit]
+    def get_similar_jobs_batch(
+        self,
+        job_ids: Optional[List] = None,
+        all_jobs: Optional[List[Dict]] = None,
+        limit: int = 5,
+        workers: int = 1,
+        approximate: bool = False
+    ):
+        """
+        Get similar jobs for many catalog jobs.
+
+        Args:
+            job_ids: Target job ids, or None for every job in the catalog
+            all_jobs: Jobs to load into the resident catalog first, or None
+            limit: Maximum number of similar jobs per target
+            workers: Number of worker processes to shard targets across
+            approximate: Use the MinHash/LSH lookup instead of exact search
+
+        Yields:
+            (job_id, similar_jobs) per target, in input order
+        """
+        if approximate and self.text_index is not None:
+            raise ValueError('Approximate similar jobs do not support text similarity')
+        if all_jobs is not None:
+            self.catalog.load(all_jobs)
+        if job_ids is None:
+            job_ids = [entry.id for entry in self.catalog]
+        if approximate and self.lsh_index is None:
+            self.enable_approximate_similar()
+
+        if workers > 1:
+            chunks = [
+                (job_ids[i:i + BATCH_CHUNK_SIZE], limit, approximate)
+                for i in range(0, len(job_ids), BATCH_CHUNK_SIZE)
+            ]
+            # Lists the workers would read, see get_similar_jobs
+            similar = self.similar_index
+            similar_ids = job_ids if not approximate and similar is not None and limit <= similar.size else None
+            yield from self._parallel_map(_similar_chunk, chunks, workers, similar_ids)
+            return
+
+        for job_id in job_ids:
+            yield job_id, self.get_similar_jobs({'id': job_id}, None, limit, approximate)
+
+    def _parallel_map(self, func, chunks: List, workers: int, similar_ids: Optional[List] = None):
+        """
+        Run func over chunks in a process pool and yield results in order.
+
+        Structures built lazily on first use (the NumPy encoding, the TF-IDF
+        matrix and the similar-jobs lists of similar_ids) are built here
+        first, so workers don't each build their own. With the fork start
+        method the workers inherit this engine and those structures
+        copy-on-write instead of receiving a pickled copy; elsewhere the
+        engine is pickled once per worker, not per task.
+        """
+        global _worker_engine
+        if self.use_numpy:
+            self._vectorized_scorer()
+        if self.text_index is not None:
+            self.text_index.matrix()
+        elif similar_ids is not None:
+            self.similar_index.build(similar_ids)
+
+        previous = _worker_engine
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+            # Kept for the pool's lifetime, as replacement workers fork later too
+            _worker_engine = self
+            initializer, initargs = None, ()
+        else:
+            context = multiprocessing.get_context()
+            initializer, initargs = _set_worker_engine, (self,)
+
+        try:
+            with context.Pool(workers, initializer, initargs) as pool:
+                for results in pool.imap(func, chunks):
+                    yield from results
+        finally:
+            _worker_engine = previous
+
+
+# Users or target jobs per task sent to a batch worker process
+BATCH_CHUNK_SIZE = 64
+
+# Engine shared with batch worker processes, see JobRecommendationEngine._parallel_map
+_worker_engine: Optional[JobRecommendationEngine] = None
+
+
+def _set_worker_engine(engine: JobRecommendationEngine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _recommend_chunk(task) -> List[Tuple]:
+    users, limit = task
+    return list(_worker_engine.get_recommendations_batch(users, None, limit))
+
+
+def _similar_chunk(task) -> List[Tuple]:
+    job_ids, limit, approximate = task
+    return list(_worker_engine.get_similar_jobs_batch(job_ids, None, limit, approximate=approximate))
+
+
+def recommendation_reasons(recommendation: Dict) -> List[str]:
+    """Human-readable reasons for a recommendation, for user_recommendations.reasons."""
+    reasons = []
+    if recommendation.get('matching_skills'):
+        reasons.append('Matches your skills: ' + ', '.join(sorted(recommendation['matching_skills'])))
+    if recommendation.get('related_skills'):
+        reasons.append('Related to your skills: ' + ', '.join(sorted(recommendation['related_skills'])))
+    if recommendation.get('interest_match', 0) >= 50:
+        reasons.append('Similar to jobs you applied to or saved')
+    if recommendation.get('is_saved'):
+        reasons.append('You saved this job')
+    return reasons
+
+
+def recommendation_rows(user_id, recommendations: List[Dict]) -> List[Dict]:
+    """Rows for a bulk insert into user_recommendations."""
+    return [
+        {
+            'user_id': user_id,
+            'job_posting_id': rec.get('id'),
+            'score': rec['match_score'],
+            'reasons': recommendation_reasons(rec),
+        }
+        for rec in recommendations
+    ]
+
+
+def similar_job_rows(job_id, similar_jobs: List[Dict]) -> List[Dict]:
+    """One row per (job, similar job) pair."""
+    return [
+        {'job_id': job_id, 'similar_job_id': job.get('id'), 'score': job['similarity_score']}
+        for job in similar_jobs
+    ]
+
+
+# Keys kept by the ids_only output mode
+RESULT_SCORE_KEYS = ('id', 'match_score', 'skill_match', 'interest_match', 'text_match', 'similarity_score')
+
+
+def compact_results(results: List[Dict]) -> List[Dict]:
+    """Job results reduced to their id and scores, without echoing the job fields."""
+    return [{key: result[key] for key in RESULT_SCORE_KEYS if key in result} for result in results]
+
+
+class RecommendationWorker:
+    """
+    Long-lived worker that keeps one engine and its job catalog warm in memory.
+
+    Requests are line-delimited JSON objects:
+        {"id": 1, "action": "recommend", "input": {...}, "limit": 20}
+
+    Each request gets exactly one JSON line back, echoing the request id.
+    Requests that omit `jobs` are answered against the engine's resident
+    catalog, which is filled with `load_jobs` (from `jobs` or a JSON Lines
+    `jobs_file`) or `load_snapshot`, and kept current with `upsert_job` /
+    `remove_job` deltas; `export_snapshot` writes it to a snapshot file.
+    Likewise, `interest_event` keeps a resident interest profile per
+    user_id that `recommend` picks up. With `"ids_only": true` in the
+    input, job results carry only ids and scores.
+    """
+
+    ACTIONS = ('recommend', 'recommend_batch', 'similar', 'similar_batch', 'similar_recall', 'learn',
+               'interest_event', 'load_jobs', 'upsert_job', 'remove_job', 'export_snapshot',
+               'load_snapshot', 'ping')
+
+    def __init__(self, engine: Optional[JobRecommendationEngine] = None):
+        self.engine = engine or JobRecommendationEngine()
+
+    def handle(self, request: Dict) -> Dict:
+        """Handle a single request and return the response payload."""
+        request_id = request.get('id')
+        try:
+            action = request.get('action')
+            if action not in self.ACTIONS:
+                raise ValueError(f'Unknown action: {action}')
+            input_data = request.get('input')
+            if input_data is None:
+                input_data = request
+            limit = request.get('limit')
+
+            response = run_action(self.engine, action, input_data, limit)
+        except Exception as e:
+            response = {'success': False, 'error': str(e)}
+
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """Decode one request line and return the encoded response line."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            request = json_loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('Request must be a JSON object')
+        except ValueError as e:
+            return json_dumps({'success': False, 'error': f'Invalid request: {e}'})
+        return json_dumps(self.handle(request))
+
+    def serve_stream(self, in_stream, out_stream):
+        """Answer requests from a text stream until EOF."""
+        for line in in_stream:
+            response = self.handle_line(line)
+            if response is not None:
+                out_stream.write(response + '\n')
+                out_stream.flush()
+
+    def serve_socket(self, socket_path: str):
+        """Answer requests on a Unix domain socket, one connection at a time."""
+        import socketserver
+
+        worker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    response = worker.handle_line(raw.decode('utf-8'))
+                    if response is not None:
+                        self.wfile.write((response + '\n').encode('utf-8'))
+                        self.wfile.flush()
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        with socketserver.UnixStreamServer(socket_path, Handler) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+
+
+def run_action(engine: JobRecommendationEngine, action: str, input_data: Dict, limit: Optional[int] = None) -> Dict:
+    """Run a single engine action and return the JSON response payload."""
+    catalog = engine.catalog
+
+    if action == 'recommend':
+        user_data = input_data.get('user_data', {})
+        all_jobs = input_data.get('jobs')
+        recommendations = engine.get_recommendations(user_data, all_jobs, limit or 20)
+        if input_data.get('ids_only'):
+            recommendations = compact_results(recommendations)
+        return {'success': True, 'recommendations': recommendations}
+
+    elif action == 'recommend_batch':
+        rows = []
+        for user_id, recommendations in engine.get_recommendations_batch(
+            input_data.get('users', []), input_data.get('jobs'), limit or 20
+        ):
+            rows.extend(recommendation_rows(user_id, recommendations))
+        return {'success': True, 'rows': rows}
+
+    elif action == 'similar':
+        target_job = input_data.get('target_job') or {'id': input_data.get('target_job_id')}
+        all_jobs = input_data.get('jobs')
+        approximate = bool(input_data.get('approximate'))
+        if approximate and all_jobs is not None:
+            # The LSH index lives on the catalog
+            catalog.load(all_jobs)
+            all_jobs = None
+        similar = engine.get_similar_jobs(target_job, all_jobs, limit or 5, approximate)
+        if input_data.get('ids_only'):
+            similar = compact_results(similar)
+        return {'success': True, 'similar_jobs': similar}
+
+    elif action == 'similar_batch':
+        rows = []
+        for job_id, similar in engine.get_similar_jobs_batch(
+            input_data.get('job_ids'), input_data.get('jobs'), limit or 5,
+            approximate=bool(input_data.get('approximate'))
+        ):
+            rows.extend(similar_job_rows(job_id, similar))
+        return {'success': True, 'rows': rows}
+
+    elif action == 'similar_recall':
+        if input_data.get('jobs') is not None:
+            catalog.load(input_data['jobs'])
+        report = engine.measure_similar_recall(input_data.get('sample_size', 200), limit or 5)
+        return {'success': True, 'report': report}
+
+    elif action == 'learn':
+        user_data = input_data.get('user_data', {})
+        interests = engine.learn_user_interests(user_data)
+        return {'success': True, 'interests': interests}
+
+    elif action == 'interest_event':
+        # One event, or a list of them, applied to the stored or resident profile
+        profile = engine.interest_profile(input_data.get('user_id'), input_data.get('interest_profile'))
+        for event in input_data.get('events') or [input_data]:
+            engine.record_interest_event(
+                profile, event.get('event'), event.get('job'), event.get('job_id'), event.get('timestamp')
+            )
+        return {
+            'success': True,
+            'interests': profile.normalized(),
+            'interest_profile': profile.to_dict(),
+            'total_interactions': profile.total_interactions,
+        }
+
+    elif action == 'load_jobs':
+        if input_data.get('jobs_file'):
+            catalog.load(iter_jsonl(input_data['jobs_file']))
+        else:
+            catalog.load(input_data.get('jobs', []))
+        return {'success': True, 'jobs_loaded': len(catalog)}
+
+    elif action == 'export_snapshot':
+        if not input_data.get('path'):
+            raise ValueError('export_snapshot needs a path')
+        if input_data.get('jobs') is not None:
+            catalog.load(input_data['jobs'])
+        engine.export_snapshot(input_data['path'])
+        return {'success': True, 'path': input_data['path'], 'jobs_loaded': len(catalog)}
+
+    elif action == 'load_snapshot':
+        engine.load_snapshot(input_data['path'])
+        return {'success': True, 'jobs_loaded': len(catalog)}
+
+    elif action == 'upsert_job':
+        jobs = input_data.get('jobs') or [input_data.get('job', {})]
+        for job in jobs:
+            catalog.upsert_job(job)
+        return {'success': True, 'jobs_loaded': len(catalog)}
+
+    elif action == 'remove_job':
+        job_ids = input_data.get('job_ids') or [input_data.get('job_id')]
+        removed = sum(1 for job_id in job_ids if catalog.remove_job(job_id))
+        return {'success': True, 'removed': removed, 'jobs_loaded': len(catalog)}
+
+    elif action == 'ping':
+        return {'success': True, 'jobs_loaded': len(catalog)}
+
+    raise ValueError(f'Unknown action: {action}')
 
 
 def main():
     """Main entry point for CLI usage."""
     parser = argparse.ArgumentParser(description='Job Recommendation Engine')
-    parser.add_argument('--action', type=str, required=True,
-                        choices=['recommend', 'similar', 'learn'],
+    parser.add_argument('--action', type=str,
+                        choices=['recommend', 'recommend_batch', 'similar', 'similar_batch',
+                                 'similar_recall', 'learn', 'interest_event', 'export_snapshot'],
                         help='Action to perform')
-    parser.add_argument('--input', type=str, required=True,
+    parser.add_argument('--input', type=str,
                         help='JSON input file or stdin if -')
+    parser.add_argument('--jobs', type=str,
+                        help='JSON Lines file of jobs (stdin if -), streamed into the catalog '
+                             'instead of the input\'s "jobs" array')
+    parser.add_argument('--ids-only', action='store_true',
+                        help='Return only job ids and scores instead of full job objects')
     parser.add_argument('--limit', type=int, default=20,
                         help='Maximum number of results')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for recommend_batch / similar_batch')
+    parser.add_argument('--approximate', action='store_true',
+                        help='Use MinHash/LSH approximate search for similar / similar_batch')
+    parser.add_argument('--lsh-bands', type=int, default=16,
+                        help='LSH bands; more bands raise recall')
+    parser.add_argument('--lsh-rows', type=int, default=4,
+                        help='MinHash rows per LSH band; more rows make buckets more selective')
+    parser.add_argument('--text-weight', type=float, default=0.0,
+                        help='Weight of TF-IDF description similarity in scores (0 disables)')
+    parser.add_argument('--text-index', type=str,
+                        help='File to persist TF-IDF term frequencies in between runs')
+    parser.add_argument('--interest-half-life', type=float,
+                        help='Half-life in days of interest events (default: no decay)')
+    parser.add_argument('--max-profiles', type=int, default=10000,
+                        help='Interest profiles kept resident between requests, least recently used '
+                             'dropped first')
+    parser.add_argument('--no-numpy', action='store_true',
+                        help='Disable the vectorized NumPy scoring path')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a persistent worker answering line-delimited JSON requests')
+    parser.add_argument('--socket', type=str,
+                        help='Unix socket path to listen on in --serve mode (default: stdin/stdout)')
+    parser.add_argument('--similar-index', type=int, default=20,
+                        help='Neighbors to keep per job in --serve mode, computed on its first similar '
+                             'lookup; exported snapshots store every job\'s list (0 disables)')
+    parser.add_argument('--snapshot', type=str,
+                        help='Binary catalog snapshot: written by --action export_snapshot, '
+                             'loaded at startup otherwise')
 
     args = parser.parse_args()
+    if args.approximate and args.text_weight > 0:
+        parser.error('--approximate cannot be combined with --text-weight')
+
+    engine = JobRecommendationEngine(use_numpy=not args.no_numpy)
+    engine.interest_half_life_days = args.interest_half_life
+    engine.max_profiles = args.max_profiles
+    exporting = args.action == 'export_snapshot'
+    if args.snapshot and not exporting:
+        # Also restores the similar-jobs and text indexes stored with it
+        engine.load_snapshot(args.snapshot)
+    if args.text_weight > 0 and engine.text_index is None:
+        engine.enable_text_similarity(args.text_weight, args.text_index)
+    elif args.text_weight > 0:
+        engine.text_weight = args.text_weight
+    if exporting and args.similar_index > 0:
+        engine.enable_similar_index(args.similar_index)
+
+    if args.jobs and args.jobs == args.input == '-':
+        parser.error('--jobs and --input cannot both read stdin')
+
+    if args.serve:
+        if args.jobs:
+            engine.catalog.load(iter_jsonl(args.jobs))
+        similar_index = engine.similar_index
+        if args.similar_index > 0 and (similar_index is None or similar_index.size != args.similar_index):
+            engine.enable_similar_index(args.similar_index)
+        worker = RecommendationWorker(engine)
+        try:
+            if args.socket:
+                worker.serve_socket(args.socket)
+            else:
+                worker.serve_stream(sys.stdin, sys.stdout)
+        finally:
+            if engine.text_index is not None:
+                engine.text_index.save()
+        return
+
+    if not args.action or not (args.input or args.jobs):
+        parser.error('--action and --input (or --jobs) are required unless --serve is given')
 
     # Read input
-    if args.input == '-':
-        input_data = json.loads(sys.stdin.read())
+    if not args.input:
+        input_data = {}
+    elif args.input == '-':
+        input_data = json_loads(sys.stdin.buffer.read())
     else:
-        with open(args.input, 'r') as f:
-            input_data = json.load(f)
-
-    engine = JobRecommendationEngine()
-
-    if args.action == 'recommend':
-        user_data = input_data.get('user_data', {})
-        all_jobs = input_data.get('jobs', [])
-        recommendations = engine.get_recommendations(user_data, all_jobs, args.limit)
-        print(json.dumps({'success': True, 'recommendations': recommendations}))
-
-    elif args.action == 'similar':
-        target_job = input_data.get('target_job', {})
-        all_jobs = input_data.get('jobs', [])
-        similar = engine.get_similar_jobs(target_job, all_jobs, args.limit)
-        print(json.dumps({'success': True, 'similar_jobs': similar}))
-
-    elif args.action == 'learn':
-        user_data = input_data.get('user_data', {})
-        interests = engine.learn_user_interests(user_data)
-        print(json.dumps({'success': True, 'interests': interests}))
+        with open(args.input, 'rb') as f:
+            input_data = json_loads(f.read())
+    if exporting and args.snapshot:
+        input_data.setdefault('path', args.snapshot)
+    if args.ids_only:
+        input_data['ids_only'] = True
+
+    if args.approximate or args.action == 'similar_recall':
+        engine.enable_approximate_similar(args.lsh_bands, args.lsh_rows)
+        input_data.setdefault('approximate', args.approximate)
+    if args.jobs:
+        # Decode jobs one line at a time straight into the catalog
+        input_data.pop('jobs', None)
+        engine.catalog.load(iter_jsonl(args.jobs))
+        if engine.text_index is not None:
+            engine.text_index.save()
+    elif engine.text_index is not None and input_data.get('jobs') is not None:
+        # Score against the catalog so persisted term frequencies are reused
+        engine.catalog.load(input_data.pop('jobs'))
+        engine.text_index.save()
+
+    if args.action == 'recommend_batch':
+        # Stream one user_recommendations row per line as each user finishes
+        for user_id, recommendations in engine.get_recommendations_batch(
+            input_data.get('users', []), input_data.get('jobs'), args.limit, args.workers
+        ):
+            for row in recommendation_rows(user_id, recommendations):
+                sys.stdout.write(json_dumps(row) + '\n')
+        return
+
+    if args.action == 'similar_batch':
+        for job_id, similar in engine.get_similar_jobs_batch(
+            input_data.get('job_ids'), input_data.get('jobs'), args.limit, args.workers, args.approximate
+        ):
+            for row in similar_job_rows(job_id, similar):
+                sys.stdout.write(json_dumps(row) + '\n')
+        return
+
+    sys.stdout.write(json_dumps(run_action(engine, args.action, input_data, args.limit)) + '\n')
 
 
 if __name__ == '__main__':
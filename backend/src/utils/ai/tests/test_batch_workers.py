@@ -0,0 +1,58 @@
+"""Batch scoring across worker processes must match the serial batch."""
+
+import random
+
+import recommendation_engine
+from recommendation_engine import JobRecommendationEngine
+
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker']
+
+
+def make_engine(count=150, seed=11):
+    rng = random.Random(seed)
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.catalog.load([
+        {
+            'id': job_id,
+            'skills_required': rng.sample(SKILLS, rng.randint(1, 3)),
+            'job_type': rng.choice(['Full-time', 'Contract']),
+            'location': rng.choice(['NYC', 'Remote']),
+        }
+        for job_id in range(1, count + 1)
+    ])
+    return engine
+
+
+def make_users(count, seed=12):
+    rng = random.Random(seed)
+    return [{'user_id': i, 'user_data': {'profile_skills': rng.sample(SKILLS, 2)}} for i in range(count)]
+
+
+def test_parallel_batches_match_serial():
+    engine = make_engine()
+    users = make_users(150)
+    assert list(engine.get_recommendations_batch(users, workers=2)) == \
+        list(engine.get_recommendations_batch(users))
+    assert list(engine.get_similar_jobs_batch(workers=2)) == list(engine.get_similar_jobs_batch())
+    assert recommendation_engine._worker_engine is None
+
+
+def test_worker_engine_reset_when_batch_is_abandoned():
+    engine = make_engine()
+    batch = engine.get_recommendations_batch(make_users(150), workers=2)
+    next(batch)
+    batch.close()
+    assert recommendation_engine._worker_engine is None
+
+
+def test_lazy_structures_are_built_before_forking():
+    engine = make_engine()
+    engine.enable_similar_index(10)
+    job_ids = [entry.id for entry in engine.catalog][:80]
+    expected = list(make_engine().get_similar_jobs_batch(job_ids))
+    assert list(engine.get_similar_jobs_batch(job_ids, workers=2)) == expected
+    assert set(engine.similar_index.neighbors) == set(job_ids)
+
+    engine.enable_text_similarity(0.2)
+    list(engine.get_recommendations_batch(make_users(10), workers=2))
+    assert engine.text_index._matrix is not None
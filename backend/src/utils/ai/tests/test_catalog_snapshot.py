@@ -0,0 +1,128 @@
+"""Engines loaded from a CatalogSnapshot must answer like the JSON-built engine."""
+
+import pickle
+import random
+
+import pytest
+
+from recommendation_engine import CatalogSnapshot, JobRecommendationEngine
+
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker', 'Node-JS', 'React Native', 'c_sharp']
+WORDS = ['backend', 'platform', 'payments', 'frontend', 'design', 'data', 'pipelines', 'mobile']
+
+
+def make_jobs(count, rng):
+    return [
+        {
+            'id': job_id,
+            'title': f'{rng.choice(WORDS)} engineer',
+            'description': ' '.join(rng.choices(WORDS, k=8)),
+            'skills_required': rng.sample(SKILLS, rng.randint(0, 4)),
+            'job_type': rng.choice(['Full-time', 'Contract']),
+            'location': rng.choice(['NYC', 'Remote', 'Austin']),
+            'experience_level': rng.choice(['mid', 'senior', None]),
+            'salary_min': rng.choice([None, 60000]),
+            'salary_max': rng.choice([None, 120000]),
+            'created_at': rng.choice([None, '2026-01-01T00:00:00Z']),
+        }
+        for job_id in range(1, count + 1)
+    ]
+
+
+def make_users(jobs, rng, count=10):
+    return [
+        {
+            'profile_skills': rng.sample(SKILLS, 3),
+            'applied_jobs': rng.sample(jobs, 2),
+            'saved_job_ids': [rng.choice(jobs)['id']],
+        }
+        for _ in range(count)
+    ]
+
+
+def build(jobs, text):
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.enable_similar_index(10)
+    if text:
+        engine.enable_text_similarity(0.2)
+    engine.catalog.load(jobs)
+    return engine
+
+
+def assert_same_answers(expected, engine, jobs, users):
+    for user in users:
+        assert engine.get_recommendations(user, None, 10) == expected.get_recommendations(user, None, 10)
+    for job in jobs[::9]:
+        for limit in (5, 15):
+            assert engine.get_similar_jobs({'id': job['id']}, None, limit) == \
+                expected.get_similar_jobs({'id': job['id']}, None, limit)
+
+
+@pytest.fixture(params=[False, True], ids=['plain', 'text'])
+def engines(request, tmp_path):
+    rng = random.Random(4)
+    jobs = make_jobs(150, rng)
+    expected = build(jobs, request.param)
+    path = str(tmp_path / 'catalog.snap')
+    expected.export_snapshot(path)
+    loaded = JobRecommendationEngine(use_numpy=False)
+    loaded.load_snapshot(path)
+    return expected, loaded, jobs, make_users(jobs, rng)
+
+
+def test_snapshot_round_trip(engines):
+    expected, loaded, jobs, users = engines
+    assert (loaded.text_index is None) == (expected.text_index is None)
+    # Served from the snapshot, not recomputed
+    assert loaded.similar_index.neighbors == {}
+    assert [loaded.similar_index.neighbor_list(entry) for entry in loaded.catalog] == \
+        [expected.similar_index.neighbor_list(entry) for entry in expected.catalog]
+    if expected.text_index is not None:
+        assert loaded.text_index.stored is not None
+        assert loaded.text_index.idf == expected.text_index.idf
+        assert loaded.text_index.vectors == expected.text_index.vectors
+    assert [entry.job for entry in loaded.catalog] == jobs
+    assert_same_answers(expected, loaded, jobs, users)
+
+
+def test_snapshot_round_trip_with_numpy(engines):
+    pytest.importorskip('numpy')
+    expected, loaded, jobs, users = engines
+    expected.use_numpy = loaded.use_numpy = True
+    assert_same_answers(expected, loaded, jobs, users)
+
+
+def test_upserts_after_load(engines):
+    expected, loaded, jobs, users = engines
+    rng = random.Random(9)
+    for job in make_jobs(20, rng):
+        job = {**job, 'id': rng.randint(1, 200)}
+        removed = rng.choice(jobs)['id']
+        for engine in (expected, loaded):
+            engine.catalog.upsert_job(job)
+            engine.catalog.remove_job(removed)
+    assert_same_answers(expected, loaded, jobs, users)
+
+
+def test_pickled_engine_remaps_snapshot(engines):
+    expected, loaded, jobs, users = engines
+    assert_same_answers(expected, pickle.loads(pickle.dumps(loaded)), jobs, users)
+    assert list(loaded.get_recommendations_batch(users, workers=2)) == \
+        list(expected.get_recommendations_batch(users))
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'jobs.json'
+    path.write_bytes(b'[{"id": 1}]' + b' ' * 64)
+    with pytest.raises(ValueError):
+        CatalogSnapshot(str(path))
+    with pytest.raises(OSError):
+        CatalogSnapshot(str(tmp_path / 'missing.snap'))
+
+
+def test_rejects_other_format_versions(tmp_path, monkeypatch):
+    path = str(tmp_path / 'catalog.snap')
+    build(make_jobs(5, random.Random(1)), False).export_snapshot(path)
+    monkeypatch.setattr(CatalogSnapshot, 'FORMAT_VERSION', CatalogSnapshot.FORMAT_VERSION + 1)
+    with pytest.raises(ValueError):
+        JobRecommendationEngine().load_snapshot(path)
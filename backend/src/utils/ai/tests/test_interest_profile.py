@@ -0,0 +1,108 @@
+"""Incremental interest profiles against the replayed history."""
+
+import random
+
+import pytest
+
+from recommendation_engine import InterestProfile, JobRecommendationEngine
+
+DAY = 86400
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker']
+
+
+def make_job(job_id, rng):
+    return {
+        'id': job_id,
+        'skills_required': rng.sample(SKILLS, 3),
+        'job_type': rng.choice(['Full-time', 'Contract']),
+        'location': rng.choice(['NYC', 'Remote']),
+        'experience_level': 'mid',
+        'industry': rng.choice(['tech', 'finance', None]),
+        'salary_min': rng.choice([None, 50000, 70000]),
+        'salary_max': rng.choice([None, 90000, 120000]),
+    }
+
+
+def rounded(interests):
+    return {
+        category: values if category == 'salary_range' else {k: round(v, 9) for k, v in values.items()}
+        for category, values in interests.items()
+    }
+
+
+def skill_profile(half_life_days, events):
+    """Profile with one applied event per (skill, day)."""
+    profile = InterestProfile(half_life_days)
+    for skill, day in events:
+        profile.add_event('applied', {'skills_required': [skill]}, day * DAY)
+    return profile
+
+
+def test_events_match_replayed_history():
+    rng = random.Random(5)
+    engine = JobRecommendationEngine(use_numpy=False)
+    for _ in range(50):
+        user_data = {
+            'profile_skills': rng.sample(SKILLS, rng.randint(0, 3)),
+            'applied_jobs': [make_job(i, rng) for i in range(rng.randint(0, 4))],
+            'saved_jobs': [make_job(i, rng) for i in range(rng.randint(0, 4))],
+        }
+        profile = InterestProfile()
+        profile.set_profile_skills(user_data['profile_skills'])
+        for event in ('applied', 'saved'):
+            for job in user_data[f'{event}_jobs']:
+                profile.add_event(event, job)
+        restored = InterestProfile.from_dict(profile.to_dict())
+        expected = rounded(engine.learn_user_interests(user_data))
+        assert rounded(profile.normalized()) == expected == rounded(restored.normalized())
+
+
+def test_restore_with_same_half_life_is_unchanged():
+    profile = skill_profile(1, [('old', 0), ('new', 1)])
+    restored = InterestProfile.from_dict(profile.to_dict(), 1, timestamp=5 * DAY)
+    assert restored.to_dict() == profile.to_dict()
+
+
+def test_restore_switches_to_engine_half_life():
+    state = skill_profile(1, [('old', 0), ('new', 1)]).to_dict()
+    profile = InterestProfile.from_dict(state, 10, timestamp=DAY)
+    profile.add_event('applied', {'skills_required': ['later']}, 2 * DAY)
+
+    skills = profile.normalized()['skills']
+    assert profile.half_life_days == 10
+    # Decayed under the stored half-life up to the switch, the new one after
+    assert skills['old'] / skills['new'] == pytest.approx(0.5)
+    assert skills['new'] == pytest.approx(2 ** -0.1)
+    assert skills['later'] == 1.0
+
+
+def test_restore_without_decay_keeps_decayed_weights():
+    state = skill_profile(1, [('old', 0), ('new', 1)]).to_dict()
+    profile = InterestProfile.from_dict(state, None, timestamp=DAY)
+    profile.add_event('applied', {'skills_required': ['later']}, 30 * DAY)
+
+    skills = profile.normalized()['skills']
+    assert skills == pytest.approx({'old': 0.5, 'new': 1.0, 'later': 1.0})
+
+
+def test_resident_profiles_are_least_recently_used():
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.max_profiles = 2
+    first = engine.interest_profile(1)
+    engine.interest_profile(2)
+    assert engine.interest_profile(1) is first
+    engine.interest_profile(3)
+    assert list(engine.profiles) == [1, 3]
+
+    engine._user_interests({'user_id': 1})
+    engine.interest_profile(4, InterestProfile().to_dict())
+    assert list(engine.profiles) == [1, 4]
+
+
+def test_resident_profile_follows_engine_half_life():
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.interest_half_life_days = 1
+    profile = engine.interest_profile(1)
+    engine.interest_half_life_days = 7
+    assert engine.interest_profile(1) is profile
+    assert profile.half_life_days == 7
@@ -0,0 +1,57 @@
+"""Lazily computed similar-jobs lists must match the catalog scan."""
+
+import random
+
+from recommendation_engine import JobRecommendationEngine
+
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker', 'go', 'rust', 'kotlin', 'swift']
+
+
+def make_jobs(count, rng, first_id=1):
+    return [
+        {
+            'id': job_id,
+            'skills_required': rng.sample(SKILLS, rng.randint(0, 5)),
+            'job_type': rng.choice(['Full-time', 'Contract', '']),
+            'location': rng.choice(['NYC', 'Remote', '']),
+        }
+        for job_id in range(first_id, first_id + count)
+    ]
+
+
+def make_engine(jobs, size=None):
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.catalog.load(jobs)
+    if size is not None:
+        engine.enable_similar_index(size)
+    return engine
+
+
+def assert_matches_scan(indexed, job_ids, limit):
+    scan = make_engine([entry.job for entry in indexed.catalog])
+    for job_id in job_ids:
+        assert indexed.get_similar_jobs({'id': job_id}, None, limit) == \
+            scan.get_similar_jobs({'id': job_id}, None, limit)
+
+
+def test_lists_are_computed_on_first_lookup():
+    jobs = make_jobs(300, random.Random(2))
+    engine = make_engine(jobs, 10)
+    engine.catalog.load(jobs)
+    assert engine.similar_index.neighbors == {}
+
+    engine.get_similar_jobs({'id': 7}, None, 10)
+    assert list(engine.similar_index.neighbors) == [7]
+    assert_matches_scan(engine, [job['id'] for job in jobs], 10)
+
+
+def test_changes_with_partly_computed_lists():
+    rng = random.Random(6)
+    jobs = make_jobs(200, rng)
+    engine = make_engine(jobs, 8)
+    engine.similar_index.build([job['id'] for job in jobs[::3]])
+    for job in make_jobs(40, rng, first_id=150):
+        engine.catalog.upsert_job(job)
+        engine.catalog.remove_job(rng.randint(1, 260))
+    assert_matches_scan(engine, list(engine.similar_index.neighbors), 8)
+    assert_matches_scan(engine, [entry.id for entry in engine.catalog], 5)
@@ -0,0 +1,144 @@
+"""Tokenization, persisted TF-IDF term frequencies and text-weighted similar jobs."""
+
+import random
+import re
+
+import pytest
+
+from recommendation_engine import JobRecommendationEngine, TextProcessor
+
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker']
+WORDS = ['backend', 'platform', 'payments', 'frontend', 'design', 'data', 'pipelines', 'mobile',
+         'infrastructure', 'analytics', 'search', 'ranking', 'security', 'billing']
+
+
+def make_jobs(count, seed=3):
+    rng = random.Random(seed)
+    return [
+        {
+            'id': job_id,
+            'title': f'{rng.choice(WORDS)} engineer',
+            'description': ' '.join(rng.choices(WORDS, k=12)),
+            'skills_required': rng.sample(SKILLS, rng.randint(1, 3)),
+            'job_type': rng.choice(['Full-time', 'Contract']),
+            'location': rng.choice(['NYC', 'Remote']),
+        }
+        for job_id in range(1, count + 1)
+    ]
+
+
+def test_iter_tokens_matches_findall():
+    processor = TextProcessor()
+    text = ' '.join(job_text for job in make_jobs(30) for job_text in (job['title'], job['description']))
+    text += " The C++ and Node.js devs can't be 2x faster; it's AWS/GCP in-house!"
+    expected = [word for word in re.findall(r'\b[a-z]+\b', text.lower())
+                if len(word) > 2 and word not in processor.stop_words]
+    tokens = processor.iter_tokens(text)
+    assert next(tokens) == expected[0]
+    assert [expected[0], *tokens] == expected == processor.tokenize(text)
+
+
+def text_engine(jobs, path=None):
+    # Text similarity first, as the CLI does, so the catalog load is what
+    # consumes the persisted term frequencies
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.enable_text_similarity(0.3, path)
+    engine.catalog.load(jobs)
+    return engine
+
+
+@pytest.fixture
+def tokenized(monkeypatch):
+    """Texts tokenized by any TextProcessor while the test runs."""
+    texts = []
+    iter_tokens = TextProcessor.iter_tokens
+
+    def counting(self, text):
+        texts.append(text)
+        return iter_tokens(self, text)
+
+    monkeypatch.setattr(TextProcessor, 'iter_tokens', counting)
+    return texts
+
+
+def test_second_run_skips_tokenization(tmp_path, tokenized):
+    path = str(tmp_path / 'tf.json')
+    jobs = make_jobs(50)
+    first = text_engine(jobs, path)
+    first.text_index.save()
+    assert len(tokenized) == 50
+
+    tokenized.clear()
+    second = text_engine(jobs, path)
+    assert tokenized == []
+    assert second.text_index.vectors == first.text_index.vectors
+
+
+def test_changed_jobs_are_retokenized(tmp_path, tokenized):
+    path = str(tmp_path / 'tf.json')
+    jobs = make_jobs(20)
+    text_engine(jobs, path).text_index.save()
+
+    jobs[0] = {**jobs[0], 'description': 'completely new description text'}
+    tokenized.clear()
+    engine = text_engine(jobs, path)
+    assert len(tokenized) == 1
+
+    # Stale texts are dropped once the catalog is loaded
+    index = engine.text_index
+    assert set(index._persisted) == {digest for digest, _ in index.docs.values()}
+    assert index.vectors == text_engine(jobs).text_index.vectors
+
+
+def test_missing_or_corrupt_file_tokenizes_everything(tmp_path, tokenized):
+    path = tmp_path / 'tf.json'
+    path.write_text('{not json')
+    jobs = make_jobs(10)
+    engine = text_engine(jobs, str(path))
+    assert len(tokenized) == 10
+    assert engine.text_index.vectors == text_engine(jobs).text_index.vectors
+
+
+def test_edits_and_new_terms_match_fresh_index():
+    jobs = make_jobs(40)
+    engine = text_engine(jobs)
+    index = engine.text_index
+    index.refresh_ratio = 0
+
+    # A term no job has yet is weighted for the query but not snapshotted
+    assert index.user_vector({'profile_skills': ['kubernetes']})[1]
+    assert 'kubernetes' not in index.idf
+
+    for position in (0, 7):
+        jobs[position] = {**jobs[position], 'description': 'kubernetes operators for kubernetes'}
+        engine.catalog.upsert_job(jobs[position])
+    assert index.idf == text_engine(jobs).text_index.idf
+    assert index.vectors == text_engine(jobs).text_index.vectors
+
+
+def test_similar_index_is_bypassed_with_text_similarity():
+    jobs = make_jobs(80)
+    plain = text_engine(jobs)
+    indexed = text_engine(jobs)
+    indexed.enable_similar_index(20)
+    for job in jobs[:20]:
+        assert indexed.get_similar_jobs({'id': job['id']}) == plain.get_similar_jobs({'id': job['id']})
+
+
+def test_approximate_search_with_similar_index():
+    jobs = make_jobs(80)
+    engine = JobRecommendationEngine(use_numpy=False)
+    engine.catalog.load(jobs)
+    engine.enable_similar_index(20)
+    engine.enable_approximate_similar()
+    for job in jobs[:20]:
+        entry = engine.catalog.get(job['id'])
+        assert engine.get_similar_jobs({'id': job['id']}, approximate=True) == engine.lsh_index.query(entry, 5)
+
+
+def test_approximate_search_rejects_text_similarity():
+    engine = text_engine(make_jobs(10))
+    with pytest.raises(ValueError):
+        engine.get_similar_jobs({'id': 1}, approximate=True)
+    with pytest.raises(ValueError):
+        list(engine.get_similar_jobs_batch([1, 2], approximate=True))
@@ -0,0 +1,61 @@
+"""NumPy catalog scoring must match the pure-Python scorer."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from recommendation_engine import JobRecommendationEngine  # noqa: E402
+
+SKILLS = ['python', 'java', 'react', 'sql', 'aws', 'docker', 'figma', 'go']
+
+
+def make_jobs(count, rng, with_skills=True):
+    return [
+        {
+            'id': job_id,
+            'title': f'Job {job_id}',
+            'skills_required': rng.sample(SKILLS, rng.randint(1, 4)) if with_skills else [],
+            'job_type': rng.choice(['Full-time', 'Contract']),
+            'location': rng.choice(['NYC', 'Remote', 'Austin']),
+            'experience_level': rng.choice(['mid', 'senior']),
+            'salary_min': rng.choice([None, 60000]),
+            'salary_max': rng.choice([None, 120000]),
+        }
+        for job_id in range(1, count + 1)
+    ]
+
+
+def make_user(jobs, rng):
+    return {
+        'profile_skills': rng.sample(SKILLS, 3),
+        'applied_jobs': rng.sample(jobs, 2),
+        'saved_jobs': rng.sample(jobs, 2),
+        'saved_job_ids': [jobs[0]['id']],
+    }
+
+
+def recommendations(jobs, user, use_numpy):
+    engine = JobRecommendationEngine(use_numpy=use_numpy)
+    engine.catalog.load(jobs)
+    return engine.get_recommendations(user, None, 20)
+
+
+@pytest.mark.parametrize('with_skills', [True, False])
+def test_numpy_matches_pure_python(with_skills):
+    rng = random.Random(7)
+    jobs = make_jobs(200, rng, with_skills)
+    for _ in range(10):
+        user = make_user(jobs, rng)
+        assert recommendations(jobs, user, True) == recommendations(jobs, user, False)
+
+
+def test_catalog_without_skills_scores_with_skill_interests():
+    # Interests include skills, but no catalog job lists any
+    rng = random.Random(1)
+    jobs = make_jobs(20, rng, with_skills=False)
+    user = {'profile_skills': ['python'], 'applied_jobs': make_jobs(2, rng)}
+    result = recommendations(jobs, user, True)
+    assert result == recommendations(jobs, user, False)
+    assert result
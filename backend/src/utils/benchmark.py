@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the job recommendation engine and the resume parser.
+
+Generates a synthetic catalog, users and PDF/DOCX resumes, times the main
+operations across catalog sizes and writes per-operation latency
+percentiles and peak memory as JSON, so runs on different commits can be
+compared:
+
+    python benchmark.py --sizes 1000,10000 --output before.json
+    python benchmark.py --sizes 1000,10000 --output after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from typing import Callable, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ai'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parser'))
+
+import recommendation_engine  # noqa: E402
+from recommendation_engine import JobRecommendationEngine, SkillMatcher  # noqa: E402
+from resume_parser import ResumeParser  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# Neighbors per job in the similar_index_* cases, as the --serve default
+SIMILAR_SIZE = 20
+
+JOB_TYPES = ['Full-time', 'Part-time', 'Contract', 'Internship', 'Remote']
+LOCATIONS = ['New York, NY', 'San Francisco, CA', 'Austin, TX', 'Seattle, WA', 'Chicago, IL',
+             'Boston, MA', 'Denver, CO', 'Remote']
+EXPERIENCE_LEVELS = ['entry', 'mid', 'senior', 'lead']
+INDUSTRIES = ['technology', 'finance', 'healthcare', 'retail', 'education', 'media']
+TITLES = ['Software Engineer', 'Data Scientist', 'Frontend Developer', 'Backend Developer',
+          'DevOps Engineer', 'Mobile Developer', 'Product Designer', 'Data Engineer']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries']
+FILLER_WORDS = ('build scalable services with cross functional teams and ship reliable features '
+                'for customers while improving performance monitoring testing and deployment '
+                'pipelines across cloud platforms and distributed systems').split()
+
+
+class SyntheticData:
+    """
+    Reproducible jobs, users and resumes with skewed skill popularity.
+
+    Skills come from SkillMatcher.SKILL_CATEGORIES and the parser's
+    common_skills. Each job draws most of its skills from one category and
+    the rest from the whole pool, weighted by a Zipf-like popularity, so a
+    few skills are very common and most are rare, as in real postings.
+    """
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.categories = {category: list(skills) for category, skills in SkillMatcher.SKILL_CATEGORIES.items()}
+        pool = {skill for skills in self.categories.values() for skill in skills}
+        pool.update(skill.lower() for skill in ResumeParser().common_skills)
+        self.skills = sorted(pool)
+        self.rng.shuffle(self.skills)
+        self.skill_weights = [1.0 / (rank + 1) for rank in range(len(self.skills))]
+
+    def _skills(self, count: int) -> List[str]:
+        category = self.rng.choice(list(self.categories.values()))
+        chosen = set(self.rng.sample(category, min(len(category), max(1, count * 2 // 3))))
+        while len(chosen) < count:
+            chosen.add(self.rng.choices(self.skills, self.skill_weights)[0])
+        return sorted(chosen)
+
+    def _sentence(self, words: int) -> str:
+        return ' '.join(self.rng.choice(FILLER_WORDS) for _ in range(words))
+
+    def job(self, job_id: int) -> Dict:
+        rng = self.rng
+        salary_min = rng.choice([None, rng.randrange(40, 150) * 1000])
+        return {
+            'id': job_id,
+            'title': f'{rng.choice(TITLES)} {job_id}',
+            'description': self._sentence(rng.randint(30, 120)),
+            'skills_required': self._skills(rng.randint(3, 10)),
+            'job_type': rng.choice(JOB_TYPES),
+            'location': rng.choice(LOCATIONS),
+            'experience_level': rng.choice(EXPERIENCE_LEVELS),
+            'industry': rng.choice(INDUSTRIES),
+            'salary_min': salary_min,
+            'salary_max': salary_min + rng.randrange(10, 60) * 1000 if salary_min else None,
+            'created_at': rng.choice([None, '2026-01-15T00:00:00Z']),
+        }
+
+    def jobs(self, count: int) -> List[Dict]:
+        return [self.job(job_id) for job_id in range(1, count + 1)]
+
+    def users(self, count: int, jobs: List[Dict]) -> List[Dict]:
+        """user_data dicts with profile skills and applied/saved history drawn from jobs."""
+        users = []
+        for user_id in range(1, count + 1):
+            applied = self.rng.sample(jobs, min(len(jobs), self.rng.randint(0, 8)))
+            saved = self.rng.sample(jobs, min(len(jobs), self.rng.randint(0, 8)))
+            users.append({
+                'user_id': user_id,
+                'profile_skills': self._skills(self.rng.randint(2, 12)),
+                'applied_jobs': applied,
+                'applied_job_ids': [job['id'] for job in applied],
+                'saved_jobs': saved,
+                'saved_job_ids': [job['id'] for job in saved],
+            })
+        return users
+
+    def resume_lines(self, positions: int) -> List[str]:
+        """Plain-text resume with the given number of experience entries."""
+        rng = self.rng
+        lines = [
+            'Jordan Example',
+            'jordan.example@example.com | (555) 123-4567 | linkedin.com/in/jordan-example',
+            '',
+            'Experience',
+        ]
+        for position in range(positions):
+            start = 2024 - 2 * (position + 1)
+            lines.append(f'{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({start} - {start + 2})')
+            for _ in range(rng.randint(2, 5)):
+                lines.append('- ' + self._sentence(rng.randint(8, 16)))
+        lines += [
+            '',
+            'Education',
+            f'B.S. Computer Science, State University, {2024 - 2 * positions - 4}',
+            '',
+            'Skills',
+            ', '.join(self._skills(rng.randint(6, 20))),
+        ]
+        return lines
+
+
+def write_docx(path: str, lines: List[str]):
+    """Minimal Word document with one paragraph per line."""
+    body = ''.join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in lines
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>'
+        ))
+        archive.writestr('_rels/.rels', (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>'
+        ))
+        archive.writestr('word/document.xml', (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+            f'<w:body>{body}</w:body></w:document>'
+        ))
+
+
+def write_pdf(path: str, lines: List[str], lines_per_page: int = 50):
+    """Minimal uncompressed PDF with Helvetica text, lines_per_page lines per page."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [None, None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page_lines in pages:
+        text = ' T* '.join(
+            '(' + line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ') Tj'
+            for line in page_lines
+        )
+        stream = f'BT /F1 10 Tf 13 TL 50 760 Td {text} ET'.encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects)
+        )
+        page_ids.append(len(objects))
+    objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids)
+    )
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Linear-interpolated percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def measure(name: str, func: Callable, inputs: List, warmup: int = 1, **labels) -> Dict:
+    """
+    Time func on every input and summarize the per-call latencies.
+
+    Peak memory is traced in a second pass, so tracemalloc overhead does
+    not inflate the timings; it is the peak allocated during one pass
+    over the inputs, above what was allocated before it.
+    """
+    for item in inputs[:warmup]:
+        func(item)
+
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for item in inputs:
+        func(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    total = sum(latencies)
+    result = {
+        'name': name,
+        **labels,
+        'count': len(latencies),
+        'mean_ms': total / len(latencies) * 1000 if latencies else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p90_ms': percentile(latencies, 0.90) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'ops_per_sec': len(latencies) / total if total else 0.0,
+        'peak_memory_kb': (peak - baseline) // 1024,
+    }
+    label = labels.get('size', labels.get('format', ''))
+    print(f"{name:<28} {str(label):>7}  p50 {result['p50_ms']:9.3f} ms  "
+          f"p99 {result['p99_ms']:9.3f} ms  peak {result['peak_memory_kb']:>8} KiB", file=sys.stderr)
+    return result
+
+
+def bench_engine(data: SyntheticData, size: int, users: int, targets: int, use_numpy: Optional[bool]) -> List[Dict]:
+    """
+    Catalog load, recommendations, similar jobs and interest learning for
+    one catalog size.
+
+    Engines without a resident catalog (before JobCatalog) are given the
+    job list on every call, and cases for features the engine lacks (the
+    similar-jobs table, MinHash/LSH search) are skipped, so a checkout of
+    any commit can produce a baseline to compare against.
+    """
+    jobs = data.jobs(size)
+    user_data = data.users(users, jobs)
+    target_jobs = data.rng.sample(jobs, min(targets, size))
+    try:
+        engine = JobRecommendationEngine(use_numpy=use_numpy)
+    except TypeError:
+        engine = JobRecommendationEngine()
+
+    results = []
+    if hasattr(engine, 'catalog'):
+        results.append(measure('catalog_load', engine.catalog.load, [jobs], warmup=0, size=size))
+        all_jobs = None
+    else:
+        all_jobs = jobs
+
+    results += [
+        measure('get_recommendations', lambda user: engine.get_recommendations(user, all_jobs, 20),
+                user_data, size=size),
+        # Exact scan: the similar-jobs table is not enabled yet
+        measure('get_similar_jobs', lambda job: engine.get_similar_jobs(job, all_jobs, 5),
+                target_jobs, size=size),
+        measure('learn_user_interests', engine.learn_user_interests, user_data, size=size),
+    ]
+
+    if hasattr(engine, 'enable_similar_index'):
+        # A fresh table each call, so both measuring passes compute every list
+        results.append(measure('similar_index_build', lambda _: engine.enable_similar_index(SIMILAR_SIZE).build(),
+                               [None], warmup=0, size=size))
+        results.append(measure('similar_index_lookup', lambda job: engine.get_similar_jobs(job, None, 5),
+                               target_jobs, size=size))
+
+    if hasattr(engine, 'enable_approximate_similar'):
+        results.append(measure('lsh_index_build', lambda _: engine.enable_approximate_similar(),
+                               [None], warmup=0, size=size))
+        results.append(measure('get_similar_jobs_approximate',
+                               lambda job: engine.get_similar_jobs(job, None, 5, approximate=True),
+                               target_jobs, size=size))
+    return results
+
+
+def bench_parser(data: SyntheticData, resumes: int, directory: str) -> List[Dict]:
+    """ResumeParser.parse on generated PDF and DOCX resumes of increasing length."""
+    parser = ResumeParser()
+    files = {'pdf': [], 'docx': []}
+    for index in range(resumes):
+        lines = data.resume_lines(positions=1 + index % 12)
+        pdf_path = os.path.join(directory, f'resume_{index}.pdf')
+        docx_path = os.path.join(directory, f'resume_{index}.docx')
+        write_pdf(pdf_path, lines)
+        write_docx(docx_path, lines)
+        files['pdf'].append(pdf_path)
+        files['docx'].append(docx_path)
+
+    results = []
+    for kind, paths in files.items():
+        failed = [path for path in paths[:1] if not parser.parse(path).get('success')]
+        if failed:
+            print(f'Skipping {kind} resumes: {parser.parse(failed[0]).get("error")}', file=sys.stderr)
+            continue
+        results.append(measure('ResumeParser.parse', parser.parse, paths, format=kind))
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def result_key(result: Dict):
+    return result['name'], result.get('size'), result.get('format')
+
+
+def compare(results: List[Dict], baseline_path: str):
+    """Print p50/p99 latency and peak memory of results relative to a saved run."""
+    with open(baseline_path, 'r') as f:
+        baseline = {result_key(result): result for result in json.load(f)['results']}
+    print(f'\n{"benchmark":<36} {"p50":>9} {"p99":>9} {"memory":>9}  (new / baseline)', file=sys.stderr)
+    for result in results:
+        old = baseline.get(result_key(result))
+        if old is None:
+            continue
+        label = ' '.join(str(part) for part in result_key(result) if part is not None)
+        ratios = [
+            result[field] / old[field] if old[field] else float('nan')
+            for field in ('p50_ms', 'p99_ms', 'peak_memory_kb')
+        ]
+        print(f'{label:<36} ' + ' '.join(f'{ratio:8.2f}x' for ratio in ratios), file=sys.stderr)
+
+
+def main():
+    """Main entry point for CLI usage."""
+    parser = argparse.ArgumentParser(description='Recommendation engine and resume parser benchmarks')
+    parser.add_argument('--sizes', type=str, default='1000,5000,20000',
+                        help='Comma-separated catalog sizes')
+    parser.add_argument('--users', type=int, default=200,
+                        help='Users to recommend for and learn interests of, per catalog size')
+    parser.add_argument('--targets', type=int, default=200,
+                        help='Target jobs for the similar-job lookups, per catalog size')
+    parser.add_argument('--resumes', type=int, default=24,
+                        help='Generated resumes per format (0 skips the parser benchmarks)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed for the synthetic data')
+    parser.add_argument('--no-numpy', action='store_true',
+                        help='Benchmark the pure-Python scoring path')
+    parser.add_argument('--output', type=str,
+                        help='Write results as JSON to this file (default: stdout)')
+    parser.add_argument('--compare', type=str,
+                        help='Earlier results file to print relative latency and memory against')
+
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+
+    data = SyntheticData(args.seed)
+    results = []
+    for size in sizes:
+        results.extend(bench_engine(data, size, args.users, args.targets, False if args.no_numpy else None))
+    if args.resumes > 0:
+        with tempfile.TemporaryDirectory() as directory:
+            results.extend(bench_parser(data, args.resumes, directory))
+
+    report = {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': getattr(recommendation_engine, 'np', None) is not None and not args.no_numpy,
+        'params': {
+            'sizes': sizes, 'users': args.users, 'targets': args.targets,
+            'resumes': args.resumes, 'seed': args.seed,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
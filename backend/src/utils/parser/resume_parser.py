@@ -1,72 +1,793 @@
 #!/usr/bin/env python3
 """
 Resume Parser - Extracts structured information from PDF and DOCX resumes
-Uses pdfplumber for PDFs and python-docx for Word documents
+Uses pdfplumber for PDFs and reads the XML of Word documents directly
 """
 
+import argparse
 import sys
 import json
 import re
 import os
+import datetime
+import math
+import glob
+import hashlib
+import signal
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
+from xml.etree import ElementTree
 
-# PDF parsing
+# Resource limits for untrusted documents (POSIX only)
 try:
-    import pdfplumber
+    import resource
 except ImportError:
-    pdfplumber = None
+    resource = None
 
-# DOCX parsing
-try:
-    from docx import Document
-except ImportError:
-    Document = None
+# The PDF library is heavy to import, so it is only imported the first time
+# a PDF is parsed.
+pdfplumber = None
+
+
+def _import_pdfplumber():
+    """PDF parsing"""
+    global pdfplumber
+    if pdfplumber is None:
+        try:
+            import pdfplumber as module
+        except ImportError:
+            raise ImportError("pdfplumber is not installed")
+        pdfplumber = module
+    return pdfplumber
+
+
+class ResourceLimitExceeded(BaseException):
+    """
+    Raised when a document blows one of its parse budgets.
+
+    reason names the budget ('memory', 'cpu', 'pages', 'decompressed_size'
+    or 'timeout'). Derives from BaseException so the broad exception
+    handlers in the PDF library do not swallow it.
+    """
+
+    def __init__(self, reason, message):
+        super().__init__(message)
+        self.reason = reason
+
+    def __reduce__(self):
+        # Raised in page workers and pickled back to the parser
+        return ResourceLimitExceeded, (self.reason, str(self))
+
+
+class ParseTimeout(ResourceLimitExceeded):
+    """Raised when parsing a single file exceeds its time budget."""
+
+    def __init__(self, message):
+        super().__init__('timeout', message)
+
+    def __reduce__(self):
+        return ParseTimeout, (str(self),)
+
+
+def limit_error(error):
+    """Structured parse result for a blown budget."""
+    return {
+        'success': False,
+        'error': str(error),
+        'reason': error.reason
+    }
+
+
+class ResourceLimits:
+    """
+    Per-document budgets for parsing untrusted uploads; None disables one.
+
+    memory_mb caps the address space (RLIMIT_AS) of the parsing process and
+    cpu_seconds the CPU time spent on one document (RLIMIT_CPU). PDFs with
+    more than max_pages pages are rejected before any page is read, as are
+    DOCX files whose XML parts inflate past max_decompressed_mb in total.
+    Decompression inside PDFs is bounded by the memory limit.
+    """
+
+    def __init__(self, memory_mb=None, cpu_seconds=None, max_pages=None, max_decompressed_mb=None):
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self.max_pages = max_pages
+        self.max_decompressed_mb = max_decompressed_mb
+
+    @property
+    def max_decompressed_bytes(self):
+        if self.max_decompressed_mb is None:
+            return None
+        return int(self.max_decompressed_mb * 1024 * 1024)
+
+
+@contextmanager
+def resource_limits(limits):
+    """
+    Apply the memory and CPU budgets of limits to this process for the block.
+
+    Only soft limits are lowered, so they are restored afterwards and the
+    process can go on to parse the next document. Exceeding either raises
+    ResourceLimitExceeded. Needs the POSIX resource module; the CPU budget
+    also needs the main thread for its SIGXCPU handler.
+    """
+    if limits is None or resource is None:
+        yield
+        return
+
+    restore = []
+    try:
+        if limits.memory_mb is not None:
+            soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+            budget = int(limits.memory_mb * 1024 * 1024)
+            if hard != resource.RLIM_INFINITY:
+                budget = min(budget, hard)
+            resource.setrlimit(resource.RLIMIT_AS, (budget, hard))
+            restore.append((resource.RLIMIT_AS, (soft, hard)))
+
+        if (limits.cpu_seconds is not None and hasattr(signal, 'SIGXCPU')
+                and threading.current_thread() is threading.main_thread()):
+            def on_cpu_limit(signum, frame):
+                raise ResourceLimitExceeded('cpu', f'CPU time limit of {limits.cpu_seconds:g}s exceeded')
+
+            previous_handler = signal.signal(signal.SIGXCPU, on_cpu_limit)
+            restore.append((None, previous_handler))
+            # RLIMIT_CPU counts the whole process, so budget from what is used now
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            budget = math.ceil(usage.ru_utime + usage.ru_stime + limits.cpu_seconds)
+            if hard != resource.RLIM_INFINITY:
+                budget = min(budget, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (budget, hard))
+            restore.append((resource.RLIMIT_CPU, (soft, hard)))
+
+        yield
+    except MemoryError:
+        raise ResourceLimitExceeded('memory', f'Memory limit of {limits.memory_mb:g} MB exceeded') from None
+    finally:
+        for limit, value in reversed(restore):
+            if limit is None:
+                signal.signal(signal.SIGXCPU, value)
+            else:
+                resource.setrlimit(limit, value)
+
+
+@contextmanager
+def time_limit(seconds):
+    """
+    Raise ParseTimeout in the block after seconds of wall time.
+
+    Uses SIGALRM, so it only applies in the main thread on platforms that
+    have it; elsewhere the block runs unbounded.
+    """
+    if (not seconds or not hasattr(signal, 'SIGALRM')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise ParseTimeout(f'Timed out after {seconds:g}s')
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+# DOCX parsing: WordprocessingML elements read by extract_docx_text
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_TBL = _W + 'tbl'
+_W_TR = _W + 'tr'
+_W_TC = _W + 'tc'
+_W_R = _W + 'r'
+_W_HYPERLINK = _W + 'hyperlink'
+_W_T = _W + 't'
+_W_BR = _W + 'br'
+# Run children with a fixed text equivalent, as python-docx renders them
+_W_RUN_SYMBOLS = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+_OFFICE_DOCUMENT_REL = '/officeDocument'
+
+
+def _run_text(run):
+    parts = []
+    for child in run:
+        if child.tag == _W_T:
+            parts.append(child.text or '')
+        elif child.tag == _W_BR:
+            # Page and column breaks have no text
+            if child.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_W_RUN_SYMBOLS.get(child.tag, ''))
+    return ''.join(parts)
+
+
+def _paragraph_text(paragraph):
+    parts = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _W_R)
+    return ''.join(parts)
+
+
+def _is_merge_continuation(cell):
+    """True for cells covered by a merge started in an earlier cell."""
+    properties = cell.find(_W + 'tcPr')
+    if properties is None:
+        return False
+    for tag in ('vMerge', 'hMerge'):
+        merge = properties.find(_W + tag)
+        if merge is not None and merge.get(_W + 'val', 'continue') == 'continue':
+            return True
+    return False
+
+
+def _docx_document_part(archive, max_decompressed_bytes=None):
+    """
+    Name of the main document part (normally word/document.xml) and the
+    number of bytes inflated from the package relationships to find it,
+    which count against max_decompressed_bytes.
+    """
+    try:
+        rels = _open_limited(archive, '_rels/.rels', max_decompressed_bytes)
+    except KeyError:
+        return 'word/document.xml', 0
+    with rels:
+        for _, rel in ElementTree.iterparse(rels):
+            if rel.get('Type', '').endswith(_OFFICE_DOCUMENT_REL):
+                return rel.get('Target', '').lstrip('/'), rels.total
+            rel.clear()
+        return 'word/document.xml', rels.total
+
+
+class _LimitedReader:
+    """File wrapper that fails once more than limit bytes (None: no limit) have been read."""
+
+    def __init__(self, raw, limit):
+        self.raw = raw
+        self.limit = limit
+        self.total = 0
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.total += len(data)
+        if self.limit is not None and self.total > self.limit:
+            self.exceeded()
+        return data
+
+    def exceeded(self):
+        raise ResourceLimitExceeded(
+            'decompressed_size',
+            f'Document XML exceeds the decompressed size limit of {self.limit // (1024 * 1024)} MB')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.raw.close()
+
+
+def _open_limited(archive, name, limit, used=0):
+    """
+    Open an archive member for reading while at most limit bytes, used
+    of them already spent on other members, are inflated in total.
+
+    Members declaring a larger size are refused before inflating
+    anything; the reader enforces the limit whatever the zip declares.
+    """
+    reader = _LimitedReader(archive.open(name), limit)
+    reader.total = used
+    if limit is not None and used + archive.getinfo(name).file_size > limit:
+        reader.raw.close()
+        reader.exceeded()
+    return reader
+
+
+def extract_docx_text(file_path, max_decompressed_bytes=None):
+    """
+    Text of a DOCX file: body paragraphs, then the cells of body tables.
+
+    Streams the document XML out of the zip with an incremental parser and
+    drops each top-level block once it is read, so memory stays bounded by
+    the largest paragraph or table rather than the whole document. Every
+    real table cell is emitted once; cells continuing a horizontal or
+    vertical merge are skipped.
+
+    With max_decompressed_bytes, inflating more XML than that (package
+    relationships and document together) raises ResourceLimitExceeded,
+    whatever sizes the zip declares.
+    """
+    paragraphs = []
+    cells = []
+    with zipfile.ZipFile(file_path) as archive:
+        part, rels_bytes = _docx_document_part(archive, max_decompressed_bytes)
+        with _open_limited(archive, part, max_decompressed_bytes, rels_bytes) as document:
+            stack = []
+            for event, element in ElementTree.iterparse(document, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(element)
+                    continue
+
+                stack.pop()
+                parent = stack[-1] if stack else None
+                if parent is None:
+                    continue
+                if element.tag == _W_P and parent.tag == _W_BODY:
+                    paragraphs.append(_paragraph_text(element) + "\n")
+                elif (element.tag == _W_TC and len(stack) >= 3 and parent.tag == _W_TR
+                      and stack[-2].tag == _W_TBL and stack[-3].tag == _W_BODY):
+                    if not _is_merge_continuation(element):
+                        cell_text = '\n'.join(_paragraph_text(p) for p in element if p.tag == _W_P)
+                        cells.append(cell_text + "\n")
+
+                if parent.tag == _W_BODY:
+                    parent.remove(element)
+
+    return ''.join(paragraphs) + ''.join(cells)
+
+
+# Common skills to look for
+COMMON_SKILLS = [
+    # Programming Languages
+    'JavaScript', 'Python', 'Java', 'C++', 'C#', 'Ruby', 'PHP', 'Swift',
+    'Kotlin', 'Go', 'Rust', 'TypeScript', 'Scala', 'R', 'MATLAB', 'Perl',
+
+    # Web Technologies
+    'React', 'Angular', 'Vue', 'Vue.js', 'Node.js', 'Express', 'Django',
+    'Flask', 'Spring', 'Laravel', 'Rails', 'ASP.NET', 'Next.js', 'Nuxt.js',
+
+    # Frontend
+    'HTML', 'CSS', 'SASS', 'SCSS', 'Less', 'Bootstrap', 'Tailwind',
+    'jQuery', 'Redux', 'GraphQL', 'REST', 'RESTful',
+
+    # Databases
+    'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle',
+    'SQLite', 'Cassandra', 'DynamoDB', 'Firebase', 'Elasticsearch',
+
+    # Cloud & DevOps
+    'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes',
+    'Jenkins', 'CI/CD', 'Terraform', 'Ansible', 'Linux', 'Unix',
+    'Git', 'GitHub', 'GitLab', 'Bitbucket',
+
+    # Data Science & ML
+    'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch',
+    'Keras', 'Scikit-learn', 'Pandas', 'NumPy', 'Data Analysis',
+    'Data Science', 'NLP', 'Computer Vision', 'AI', 'Statistics',
+
+    # Mobile
+    'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin',
+
+    # Tools & Others
+    'Jira', 'Confluence', 'Trello', 'Slack', 'Figma', 'Photoshop',
+    'Illustrator', 'Sketch', 'Adobe XD', 'InVision',
+
+    # Methodologies
+    'Agile', 'Scrum', 'Kanban', 'Waterfall', 'TDD', 'BDD',
+
+    # Soft Skills
+    'Leadership', 'Communication', 'Team Management', 'Problem Solving',
+    'Project Management', 'Critical Thinking', 'Analytical Skills',
+]
+
+# Word boundary test with the same semantics as \b in the term pattern
+_BOUNDARY = re.compile(r'\b')
+
+
+def _trie_regex(node):
+    """Regex alternation for a character trie, longest alternatives first."""
+    branches = [re.escape(char) + _trie_regex(child)
+                for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        body = '(?:' + body + ')?'
+    return body
+
+
+class TermFinder:
+    """
+    Finds every occurrence of a fixed set of lowercase terms in one pass.
+
+    The terms are compiled once into a trie-shaped alternation regex inside
+    a zero-width lookahead, so scanning a text costs about the same for a
+    hundred terms as for thousands and overlapping hits are all seen. With
+    whole_words, a term only counts where a separate \\b<term>\\b search
+    would find it; otherwise any substring occurrence counts.
+    """
+
+    def __init__(self, terms, whole_words=True):
+        self.terms = list(dict.fromkeys(terms))
+        self.whole_words = whole_words
+
+        trie = {}
+        for term in self.terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = True
+        boundary = r'\b' if whole_words else ''
+        self.pattern = (re.compile(r'(?=' + boundary + '(' + _trie_regex(trie) + ')' + boundary + ')')
+                        if trie else None)
+
+        # Shorter terms that can match at the same position as a longer one
+        self.prefixes = {}
+        for term in self.terms:
+            node = trie
+            prefixes = []
+            for i, char in enumerate(term[:-1], 1):
+                node = node[char]
+                if '' in node:
+                    prefixes.append(term[:i])
+            self.prefixes[term] = prefixes
+
+    def find(self, text_lower):
+        """Map of each term occurring in already lowercased text to its first offset."""
+        found = {}
+        if self.pattern is None:
+            return found
+        prefixes = self.prefixes
+        whole_words = self.whole_words
+        for match in self.pattern.finditer(text_lower):
+            term = match.group(1)
+            start = match.start()
+            found.setdefault(term, start)
+            for other in prefixes[term]:
+                if other not in found and (not whole_words
+                                           or _BOUNDARY.match(text_lower, start + len(other))):
+                    found[other] = start
+        return found
+
+
+class SkillExtractor(TermFinder):
+    """
+    Finds whole-word occurrences of a skill dictionary in a single pass.
+
+    Every skill that a separate \\b<skill>\\b search would find is
+    reported, including skills nested at the start of a longer one (React
+    inside React Native).
+    """
+
+    def __init__(self, skills):
+        self.skills = list(skills)
+        # lowercase form -> first skill spelled that way, in dictionary order
+        self.canonical = {}
+        for skill in self.skills:
+            self.canonical.setdefault(skill.lower(), skill)
+        super().__init__(self.canonical)
+
+    def select(self, found, limit=15):
+        """Skills whose lowercase form is in found, deduplicated, in dictionary order."""
+        unique_skills = [skill for term, skill in self.canonical.items() if term in found]
+        return unique_skills[:limit]
+
+    def extract(self, text, limit=15):
+        """Skills found in text, deduplicated, in dictionary order."""
+        return self.select(self.find(text.lower()), limit)
+
+
+DEFAULT_SKILL_EXTRACTOR = SkillExtractor(COMMON_SKILLS)
+
+
+def load_seed_skills(path):
+    """Read the skill names from the skills table seeder (001_skills.js)."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    match = re.search(r'const\s+skills\s*=\s*\[(.*?)\];', source, re.DOTALL)
+    if not match:
+        raise ValueError(f"No skills list found in {path}")
+    body = re.sub(r'//[^\n]*', '', match.group(1))
+    return [re.sub(r'\\(.)', r'\1', name) for name in re.findall(r"'((?:[^'\\]|\\.)*)'", body)]
+
+
+def merge_skills(*skill_lists):
+    """Concatenate skill lists, keeping the first spelling of each skill."""
+    seen = set()
+    merged = []
+    for skills in skill_lists:
+        for skill in skills:
+            if skill.lower() not in seen:
+                seen.add(skill.lower())
+                merged.append(skill)
+    return merged
+
+
+# Bump when text extraction changes, invalidating cached extracted text
+TEXT_EXTRACTION_VERSION = 2
+
+# Bump when field extraction from text changes, invalidating cached results
+PARSER_VERSION = 1
+
+# PDFs shorter than this are read in-process even with pdf_workers > 1
+PARALLEL_PDF_MIN_PAGES = 8
+
+# Consecutive PDF pages extracted per page worker task
+PDF_PAGES_PER_TASK = 4
+
+# Resume formats handled by ResumeParser.extract_text
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.doc')
+
+# Leading lines searched for the current job title
+TITLE_SCAN_LINES = 30
+
+TITLE_PATTERNS = [
+    re.compile(r'(?:current|present|latest)?\s*(?:position|title|role|designation)[\s:]+(.+)', re.IGNORECASE),
+    re.compile(r'^([\w\s]+(?:engineer|developer|manager|analyst|designer|director|specialist|consultant|architect|lead|senior|junior|associate|coordinator|administrator|executive))', re.IGNORECASE),
+]
+
+COMPANY_PATTERNS = [
+    re.compile(r'(?:current|present)?\s*(?:company|employer|organization)[\s:]+(.+)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'(?:working|worked)\s+(?:at|for|with)\s+([A-Z][\w\s&.,]+?)(?:\s+as|\s+from|\s+since|\.|\n)', re.IGNORECASE | re.MULTILINE),
+    re.compile(r'(?:employed|employment)\s+(?:at|with)\s+([A-Z][\w\s&.,]+?)(?:\s+as|\s+from|\.|,|\n)', re.IGNORECASE | re.MULTILINE),
+]
+
+UNIVERSITY_PATTERNS = [
+    re.compile(r'(?:university|college|institute|school)\s+(?:of\s+)?([A-Z][\w\s,]+)', re.MULTILINE),
+    re.compile(r'([A-Z][\w\s]+(?:University|College|Institute|School))', re.MULTILINE),
+    re.compile(r'(?:graduated|studied|degree)\s+(?:from|at)\s+([A-Z][\w\s,]+)', re.MULTILINE),
+]
+
+# Years in education context
+GRADUATION_PATTERNS = [
+    re.compile(r'(?:graduated?|class\s+of|batch\s+of|graduation)[\s:]+(\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{4})[\s-]+(?:present|current|now)', re.IGNORECASE),
+    re.compile(r'(\d{4})\s*[-–]\s*(\d{4})', re.IGNORECASE),
+]
+
+STANDALONE_YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class ResumeText:
+    """
+    Pre-processed view of a resume's text shared by the field extractors.
+
+    Each derived form (lowercased text, leading lines, skill and keyword
+    hits with their first offsets) is computed at most once, on first use,
+    so a full parse scans the text once per form instead of once per
+    extractor and keyword.
+    """
+
+    def __init__(self, text, skill_extractor, keyword_finder):
+        self.text = text
+        self.skill_extractor = skill_extractor
+        self.keyword_finder = keyword_finder
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def head_lines(self):
+        # Only split as far as the lines that are actually searched
+        return self.text.split('\n', TITLE_SCAN_LINES)[:TITLE_SCAN_LINES]
+
+    @cached_property
+    def skill_hits(self):
+        return self.skill_extractor.find(self.lower)
+
+    @cached_property
+    def keyword_hits(self):
+        return self.keyword_finder.find(self.lower)
+
+
+class ParseCache:
+    """
+    On-disk cache of parse results keyed by the SHA-256 of the file bytes.
+
+    Each entry stores the extracted text (tagged with the parser's text
+    key: extraction version and budget) and the structured result (tagged
+    with the parser's result key), so a repeat upload skips PDF/DOCX
+    extraction entirely and a parser upgrade only re-runs field extraction
+    on the cached text.
+
+    Entries are written to a temporary file and renamed into place, so
+    concurrent worker processes can share a directory: readers never see
+    a partial entry, and racing writers of the same entry are harmless.
+    Hits refresh the entry's mtime, and once the directory grows past
+    max_bytes the least recently used entries are removed.
+    """
+
+    # Share of max_bytes written by this process between eviction scans
+    EVICTION_INTERVAL = 0.1
+    # Temporary files older than this are leftovers of crashed writers
+    STALE_TEMP_SECONDS = 3600
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._written = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def file_digest(file_path):
+        sha = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.directory, digest[:2], digest + '.json')
+
+    def get(self, digest):
+        """Cached entry for a file digest, or None."""
+        path = self._path(digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, digest, entry):
+        path = self._path(digest)
+        data = json.dumps(entry).encode('utf-8')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._written += len(data)
+        if self._written >= self.max_bytes * self.EVICTION_INTERVAL:
+            self._written = 0
+            self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if name.startswith('.tmp-'):
+                    if now - stat.st_mtime > self.STALE_TEMP_SECONDS:
+                        self._remove(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        # Leave some headroom so eviction does not run on every write
+        target = self.max_bytes * (1 - self.EVICTION_INTERVAL)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        # Another process may have evicted it already
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+class _TextBudget:
+    """Accumulates page texts, newline-terminated, up to an optional character budget."""
+
+    def __init__(self, max_chars=None):
+        self.max_chars = max_chars
+        self.parts = []
+        self.length = 0
+
+    def add(self, page_text):
+        """Add one page's text; False once the budget is used up."""
+        if page_text:
+            self.parts.append(page_text + "\n")
+            self.length += len(page_text) + 1
+        return self.max_chars is None or self.length < self.max_chars
+
+    def text(self):
+        text = ''.join(self.parts)
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        return text
+
+
+def _check_page_limit(pdf, max_pages):
+    """Reject a PDF with more than max_pages pages, walking at most max_pages + 1."""
+    from pdfminer.pdfpage import PDFPage
+
+    page_count = sum(1 for _ in islice(PDFPage.create_pages(pdf.doc), max_pages + 1))
+    if page_count > max_pages:
+        raise ResourceLimitExceeded('pages', f'PDF has more than {max_pages} pages')
+
+
+def _extract_pdf_pages(file_path, page_numbers, limits=None):
+    """Text of the given 1-based pages of a PDF, run in a page worker process."""
+    with resource_limits(limits):
+        pdfplumber = _import_pdfplumber()
+        with pdfplumber.open(file_path, pages=page_numbers) as pdf:
+            page_texts = []
+            for page in pdf.pages:
+                page_texts.append(page.extract_text())
+                page.close()
+        return page_texts
+
+
+def _soft_limits():
+    """Current soft limits that resource_limits lowers, as (limit, value) pairs."""
+    if resource is None:
+        return []
+    return [(limit, resource.getrlimit(limit)[0]) for limit in (resource.RLIMIT_AS, resource.RLIMIT_CPU)]
+
+
+def _init_page_worker(soft_limits):
+    """
+    Undo the document budgets a page worker inherits when it is forked
+    while a document is being parsed. Each task applies its own budgets
+    instead, so a long-lived worker does not die of CPU time accumulated
+    over earlier documents.
+    """
+    if hasattr(signal, 'SIGXCPU'):
+        signal.signal(signal.SIGXCPU, signal.SIG_DFL)
+    for limit, soft in soft_limits:
+        resource.setrlimit(limit, (soft, resource.getrlimit(limit)[1]))
 
 
 class ResumeParser:
-    def __init__(self):
+    def __init__(self, skills=None, cache=None, max_pages=None, max_chars=None, pdf_workers=1,
+                 limits=None):
         # Common skills to look for
-        self.common_skills = [
-            # Programming Languages
-            'JavaScript', 'Python', 'Java', 'C++', 'C#', 'Ruby', 'PHP', 'Swift',
-            'Kotlin', 'Go', 'Rust', 'TypeScript', 'Scala', 'R', 'MATLAB', 'Perl',
-
-            # Web Technologies
-            'React', 'Angular', 'Vue', 'Vue.js', 'Node.js', 'Express', 'Django',
-            'Flask', 'Spring', 'Laravel', 'Rails', 'ASP.NET', 'Next.js', 'Nuxt.js',
-
-            # Frontend
-            'HTML', 'CSS', 'SASS', 'SCSS', 'Less', 'Bootstrap', 'Tailwind',
-            'jQuery', 'Redux', 'GraphQL', 'REST', 'RESTful',
-
-            # Databases
-            'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'Oracle',
-            'SQLite', 'Cassandra', 'DynamoDB', 'Firebase', 'Elasticsearch',
-
-            # Cloud & DevOps
-            'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes',
-            'Jenkins', 'CI/CD', 'Terraform', 'Ansible', 'Linux', 'Unix',
-            'Git', 'GitHub', 'GitLab', 'Bitbucket',
-
-            # Data Science & ML
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch',
-            'Keras', 'Scikit-learn', 'Pandas', 'NumPy', 'Data Analysis',
-            'Data Science', 'NLP', 'Computer Vision', 'AI', 'Statistics',
-
-            # Mobile
-            'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin',
-
-            # Tools & Others
-            'Jira', 'Confluence', 'Trello', 'Slack', 'Figma', 'Photoshop',
-            'Illustrator', 'Sketch', 'Adobe XD', 'InVision',
-
-            # Methodologies
-            'Agile', 'Scrum', 'Kanban', 'Waterfall', 'TDD', 'BDD',
-
-            # Soft Skills
-            'Leadership', 'Communication', 'Team Management', 'Problem Solving',
-            'Project Management', 'Critical Thinking', 'Analytical Skills',
-        ]
+        if skills is None:
+            self.common_skills = COMMON_SKILLS
+            self.skill_extractor = DEFAULT_SKILL_EXTRACTOR
+        else:
+            self.common_skills = list(skills)
+            self.skill_extractor = SkillExtractor(self.common_skills)
+
+        # Optional ResourceLimits applied to every document
+        self.limits = limits
+
+        # PDF extraction budget, and processes to spread long PDFs across
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.pdf_workers = pdf_workers
+        self._page_pool = None
+
+        # Optional ParseCache; text depends on the extraction budget and
+        # results also on the skill dictionary
+        self.cache = cache
+        self.text_key = f'{TEXT_EXTRACTION_VERSION}:{max_pages}:{max_chars}'
+        skills_hash = hashlib.sha256('\n'.join(self.common_skills).encode('utf-8')).hexdigest()
+        self.result_key = f'{PARSER_VERSION}:{skills_hash[:16]}:{self.text_key}'
 
         # Education keywords
         self.education_levels = {
@@ -93,43 +814,94 @@ class ResumeParser:
             'Engineering': ['engineering', 'mechanical', 'electrical', 'civil', 'chemical', 'structural', 'cad'],
         }
 
+        # Substring search for all education and category keywords at once
+        self.keyword_finder = TermFinder(
+            [keyword for keywords in self.education_levels.values() for keyword in keywords]
+            + [keyword for keywords in self.category_keywords.values() for keyword in keywords],
+            whole_words=False,
+        )
+
         # Experience level patterns
         self.experience_patterns = [
-            (r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)', 'years'),
-            (r'(?:experience|exp)[\s:]+(\d+)\+?\s*(?:years?|yrs?)', 'years'),
-            (r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+in)?', 'years'),
+            (re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+of)?\s+(?:experience|exp)', re.IGNORECASE), 'years'),
+            (re.compile(r'(?:experience|exp)[\s:]+(\d+)\+?\s*(?:years?|yrs?)', re.IGNORECASE), 'years'),
+            (re.compile(r'(\d+)\+?\s*(?:years?|yrs?)(?:\s+in)?', re.IGNORECASE), 'years'),
         ]
 
     def extract_text_from_pdf(self, file_path):
-        """Extract text from PDF file using pdfplumber"""
-        if pdfplumber is None:
-            raise ImportError("pdfplumber is not installed")
-
-        text = ""
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
+        """
+        Extract text from PDF file using pdfplumber
+
+        Stops once max_pages pages have been read or max_chars characters
+        collected, and with pdf_workers > 1 spreads the pages of long PDFs
+        across worker processes.
+        """
+        pdfplumber = _import_pdfplumber()
+
+        budget = _TextBudget(self.max_chars)
+        # pdfplumber skips building the pages outside the budget
+        limit = list(range(1, self.max_pages + 1)) if self.max_pages is not None else None
+        with pdfplumber.open(file_path, pages=limit) as pdf:
+            if self.limits is not None and self.limits.max_pages is not None:
+                _check_page_limit(pdf, self.limits.max_pages)
+            pages = pdf.pages
+
+            if self.pdf_workers > 1 and len(pages) >= PARALLEL_PDF_MIN_PAGES:
+                page_numbers = [page.page_number for page in pages]
+                for page_texts in self._map_pdf_pages(file_path, page_numbers):
+                    if not all(budget.add(page_text) for page_text in page_texts):
+                        break
+            else:
+                for page in pages:
+                    page_text = page.extract_text()
+                    # Release the page's parsed objects as soon as it is read
+                    page.close()
+                    if not budget.add(page_text):
+                        break
+        return budget.text()
+
+    def _new_page_pool(self):
+        return ProcessPoolExecutor(self.pdf_workers, initializer=_init_page_worker,
+                                   initargs=(_soft_limits(),))
+
+    def _map_pdf_pages(self, file_path, page_numbers):
+        """
+        Yield page text lists for consecutive page ranges, in page order.
+
+        Every task runs under the parser's budgets in its worker. A pool
+        that lost a worker is discarded, so the next document gets a new one.
+        """
+        if self._page_pool is None:
+            self._page_pool = self._new_page_pool()
+        chunks = [page_numbers[i:i + PDF_PAGES_PER_TASK]
+                  for i in range(0, len(page_numbers), PDF_PAGES_PER_TASK)]
+        # Only keep the workers busy, so an early exit leaves later pages unread
+        futures = deque()
+        try:
+            for chunk in chunks:
+                futures.append(self._page_pool.submit(_extract_pdf_pages, file_path, chunk, self.limits))
+                if len(futures) >= self.pdf_workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        except BrokenProcessPool:
+            self._page_pool.shutdown(wait=False, cancel_futures=True)
+            self._page_pool = None
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def __getstate__(self):
+        # Worker pools stay with the process that created them
+        state = self.__dict__.copy()
+        state['_page_pool'] = None
+        return state
 
     def extract_text_from_docx(self, file_path):
-        """Extract text from DOCX file using python-docx"""
-        if Document is None:
-            raise ImportError("python-docx is not installed")
-
-        doc = Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-
-        # Also extract from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    text += cell.text + "\n"
-
-        return text
+        """Extract text from DOCX file, paragraphs first and then table cells"""
+        limit = self.limits.max_decompressed_bytes if self.limits is not None else None
+        return extract_docx_text(file_path, limit)
 
     def extract_text(self, file_path):
         """Extract text based on file extension"""
@@ -143,48 +915,32 @@ class ResumeParser:
         else:
             raise ValueError(f"Unsupported file format: {extension}")
 
+    def preprocess(self, text):
+        """Shared view of text for the extractors; views are passed through."""
+        if isinstance(text, ResumeText):
+            return text
+        return ResumeText(text, self.skill_extractor, self.keyword_finder)
+
     def extract_skills(self, text):
         """Extract skills from resume text"""
-        found_skills = []
-        text_lower = text.lower()
-
-        for skill in self.common_skills:
-            # Create pattern that matches whole word
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_skills = []
-        for skill in found_skills:
-            if skill.lower() not in seen:
-                seen.add(skill.lower())
-                unique_skills.append(skill)
-
-        return unique_skills[:15]  # Return top 15 skills
+        view = self.preprocess(text)
+        return self.skill_extractor.select(view.skill_hits, limit=15)  # Return top 15 skills
 
     def extract_job_title(self, text):
         """Extract current/recent job title"""
-        lines = text.split('\n')
+        view = self.preprocess(text)
 
-        # Common job title patterns
-        title_patterns = [
-            r'(?:current|present|latest)?\s*(?:position|title|role|designation)[\s:]+(.+)',
-            r'^([\w\s]+(?:engineer|developer|manager|analyst|designer|director|specialist|consultant|architect|lead|senior|junior|associate|coordinator|administrator|executive))',
-        ]
-
-        for line in lines[:30]:  # Check first 30 lines
+        for line in view.head_lines:  # Check first 30 lines
             line = line.strip()
             if not line:
                 continue
 
-            for pattern in title_patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in TITLE_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     title = match.group(1).strip()
                     # Clean up the title
-                    title = re.sub(r'\s+', ' ', title)
+                    title = WHITESPACE_PATTERN.sub(' ', title)
                     if len(title) > 5 and len(title) < 100:
                         return title
 
@@ -192,18 +948,14 @@ class ResumeParser:
 
     def extract_company(self, text):
         """Extract current/recent company name"""
-        patterns = [
-            r'(?:current|present)?\s*(?:company|employer|organization)[\s:]+(.+)',
-            r'(?:working|worked)\s+(?:at|for|with)\s+([A-Z][\w\s&.,]+?)(?:\s+as|\s+from|\s+since|\.|\n)',
-            r'(?:employed|employment)\s+(?:at|with)\s+([A-Z][\w\s&.,]+?)(?:\s+as|\s+from|\.|,|\n)',
-        ]
+        view = self.preprocess(text)
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in COMPANY_PATTERNS:
+            match = pattern.search(view.text)
             if match:
                 company = match.group(1).strip()
                 # Clean up
-                company = re.sub(r'\s+', ' ', company)
+                company = WHITESPACE_PATTERN.sub(' ', company)
                 company = company.rstrip('.,')
                 if len(company) > 2 and len(company) < 100:
                     return company
@@ -212,8 +964,10 @@ class ResumeParser:
 
     def extract_experience_years(self, text):
         """Extract years of experience and return experience level"""
+        view = self.preprocess(text)
+
         for pattern, _ in self.experience_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+            match = pattern.search(view.text)
             if match:
                 try:
                     years = int(match.group(1))
@@ -232,30 +986,26 @@ class ResumeParser:
 
     def extract_education(self, text):
         """Extract education level"""
-        text_lower = text.lower()
+        hits = self.preprocess(text).keyword_hits
 
         # Check for each education level
         for level, keywords in self.education_levels.items():
             for keyword in keywords:
-                if keyword in text_lower:
+                if keyword in hits:
                     return level
 
         return ""
 
     def extract_university(self, text):
         """Extract university/institution name"""
-        patterns = [
-            r'(?:university|college|institute|school)\s+(?:of\s+)?([A-Z][\w\s,]+)',
-            r'([A-Z][\w\s]+(?:University|College|Institute|School))',
-            r'(?:graduated|studied|degree)\s+(?:from|at)\s+([A-Z][\w\s,]+)',
-        ]
+        view = self.preprocess(text)
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.MULTILINE)
+        for pattern in UNIVERSITY_PATTERNS:
+            match = pattern.search(view.text)
             if match:
                 university = match.group(1).strip() if match.group(1) else match.group(0).strip()
                 # Clean up
-                university = re.sub(r'\s+', ' ', university)
+                university = WHITESPACE_PATTERN.sub(' ', university)
                 university = university.rstrip('.,')
                 if len(university) > 3 and len(university) < 150:
                     return university
@@ -264,16 +1014,11 @@ class ResumeParser:
 
     def extract_graduation_year(self, text):
         """Extract graduation year"""
-        # Look for years in education context
-        patterns = [
-            r'(?:graduated?|class\s+of|batch\s+of|graduation)[\s:]+(\d{4})',
-            r'(\d{4})[\s-]+(?:present|current|now)',
-            r'(\d{4})\s*[-–]\s*(\d{4})',
-        ]
+        text = self.preprocess(text).text
 
         years = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in GRADUATION_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     for m in match:
@@ -288,7 +1033,7 @@ class ResumeParser:
                             years.append(year)
 
         # Also look for standalone 4-digit years
-        standalone_years = re.findall(r'\b(19\d{2}|20\d{2})\b', text)
+        standalone_years = STANDALONE_YEAR_PATTERN.findall(text)
         for y in standalone_years:
             year = int(y)
             if 1970 <= year <= 2030:
@@ -296,7 +1041,6 @@ class ResumeParser:
 
         if years:
             # Return the most recent year that's not in the future
-            import datetime
             current_year = datetime.datetime.now().year
             valid_years = [y for y in years if y <= current_year + 4]
             if valid_years:
@@ -307,56 +1051,78 @@ class ResumeParser:
     def extract_job_categories(self, text, skills):
         """Infer job categories from text and skills"""
         categories = []
-        text_lower = text.lower()
-        skills_lower = [s.lower() for s in skills]
+        hits = self.preprocess(text).keyword_hits
+        # Keywords may also hit the skill names, joined as one string
+        skill_hits = self.keyword_finder.find(' '.join(s.lower() for s in skills))
 
         for category, keywords in self.category_keywords.items():
             for keyword in keywords:
-                if keyword in text_lower or keyword in ' '.join(skills_lower):
+                if keyword in hits or keyword in skill_hits:
                     if category not in categories:
                         categories.append(category)
                         break
 
         return categories if categories else ['Other']
 
+    def parse_text(self, text):
+        """Parse already extracted resume text"""
+        if not text or len(text.strip()) < 50:
+            return {
+                'success': False,
+                'error': 'Could not extract sufficient text from the file'
+            }
+
+        # Every extractor works off the same pre-processed view
+        view = self.preprocess(text)
+
+        # Extract all components
+        skills = self.extract_skills(view)
+        job_title = self.extract_job_title(view)
+        company = self.extract_company(view)
+        experience = self.extract_experience_years(view)
+        education = self.extract_education(view)
+        university = self.extract_university(view)
+        graduation_year = self.extract_graduation_year(view)
+        job_categories = self.extract_job_categories(view, skills)
+
+        return {
+            'success': True,
+            'data': {
+                'currentJobTitle': job_title,
+                'experience': experience,
+                'currentCompany': company,
+                'expectedSalary': '',  # Not typically in resumes
+                'skills': skills,
+                'education': education,
+                'university': university,
+                'graduationYear': graduation_year,
+                'jobCategories': job_categories,
+                'bio': ''
+            }
+        }
+
     def parse(self, file_path):
         """Main parsing function"""
         try:
-            # Extract text from file
-            text = self.extract_text(file_path)
-
-            if not text or len(text.strip()) < 50:
-                return {
-                    'success': False,
-                    'error': 'Could not extract sufficient text from the file'
-                }
-
-            # Extract all components
-            skills = self.extract_skills(text)
-            job_title = self.extract_job_title(text)
-            company = self.extract_company(text)
-            experience = self.extract_experience_years(text)
-            education = self.extract_education(text)
-            university = self.extract_university(text)
-            graduation_year = self.extract_graduation_year(text)
-            job_categories = self.extract_job_categories(text, skills)
-
+            if self.pdf_workers > 1 and self._page_pool is None:
+                # Capture the unlowered limits for the workers, see _init_page_worker
+                self._page_pool = self._new_page_pool()
+            with resource_limits(self.limits):
+                if self.cache is not None:
+                    return self._parse_cached(file_path)
+
+                # Extract text from file
+                text = self.extract_text(file_path)
+                return self.parse_text(text)
+
+        except ResourceLimitExceeded as e:
+            return limit_error(e)
+        except MemoryError:
             return {
-                'success': True,
-                'data': {
-                    'currentJobTitle': job_title,
-                    'experience': experience,
-                    'currentCompany': company,
-                    'expectedSalary': '',  # Not typically in resumes
-                    'skills': skills,
-                    'education': education,
-                    'university': university,
-                    'graduationYear': graduation_year,
-                    'jobCategories': job_categories,
-                    'bio': ''
-                }
+                'success': False,
+                'error': 'Out of memory while parsing resume',
+                'reason': 'memory'
             }
-
         except ImportError as e:
             return {
                 'success': False,
@@ -368,16 +1134,329 @@ class ResumeParser:
                 'error': f'Error parsing resume: {str(e)}'
             }
 
+    def _parse_cached(self, file_path):
+        digest = self.cache.file_digest(file_path)
+        entry = self.cache.get(digest)
+        text = None
+        if entry is not None:
+            if entry.get('result_key') == self.result_key:
+                return entry['result']
+            if entry.get('text_key') == self.text_key:
+                text = entry['text']
+
+        if text is None:
+            text = self.extract_text(file_path)
+        result = self.parse_text(text)
+
+        self.cache.put(digest, {
+            'text_key': self.text_key,
+            'text': text,
+            'result_key': self.result_key,
+            'result': result,
+        })
+        return result
+
+
+def iter_batch_paths(sources, stdin=None):
+    """
+    Expand batch sources into resume paths.
+
+    A source is a directory (every supported file below it), a file, a
+    glob pattern, or '-' for newline-separated paths read from stdin.
+    Sources matching nothing are passed through so they report an error.
+    """
+    for source in sources:
+        if source == '-':
+            for line in stdin or sys.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                        yield os.path.join(root, name)
+        elif os.path.exists(source):
+            yield source
+        else:
+            matches = sorted(glob.glob(source, recursive=True))
+            yield from matches if matches else [source]
+
+
+# Files submitted per batch worker ahead of completed results
+BATCH_IN_FLIGHT_PER_WORKER = 4
+
+# Parser owned by each batch worker process, see _init_batch_worker
+_worker_parser = None
+
+
+def _init_batch_worker(parser):
+    global _worker_parser
+    # Files are already spread across processes, so pages are not
+    parser.pdf_workers = 1
+    _worker_parser = parser
+
+
+def parse_file(parser, file_path, timeout=None):
+    """Parse one file with parser, reporting missing files and timeouts as results."""
+    if not file_path or not os.path.exists(file_path):
+        return {
+            'success': False,
+            'error': f'File not found: {file_path}' if file_path else 'No file path provided'
+        }
+    try:
+        with time_limit(timeout):
+            return parser.parse(file_path)
+    except ParseTimeout as e:
+        return limit_error(e)
+
+
+def _parse_file_task(file_path, timeout):
+    return parse_file(_worker_parser, file_path, timeout)
+
+
+def parse_batch(paths, parser=None, workers=None, timeout=None, recycle_after=None):
+    """
+    Parse many resumes across a process pool.
+
+    Yields (file_path, result) pairs as files finish, not in input order.
+    Each worker receives a copy of parser (a default ResumeParser if None)
+    once and imports the PDF library on first use.
+    paths may be a lazy iterable; only a bounded number of files are
+    queued ahead of the workers. timeout bounds each file in seconds.
+
+    With recycle_after, the pool is replaced once it has been given that
+    many files per worker, so memory a worker accumulates is released.
+    If a worker dies (a hard resource limit, a crash in native code), every
+    file in flight on its pool fails with it. Each of those is retried once
+    alone in a fresh process, and only reported as crashed if that fails
+    too.
+    """
+    parser = parser or ResumeParser()
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * BATCH_IN_FLIGHT_PER_WORKER
+    paths = iter(paths)
+    # future -> (file path, attempt, pool it was submitted to)
+    pending = {}
+    retries = deque()
+    pool = None
+    submitted = 0
+
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                if retries:
+                    # Alone on its own worker, so another crash is this file's own
+                    file_path = retries.popleft()
+                    isolated = ProcessPoolExecutor(1, initializer=_init_batch_worker, initargs=(parser,))
+                    pending[isolated.submit(_parse_file_task, file_path, timeout)] = (file_path, 1, isolated)
+                    isolated.shutdown(wait=False)
+                    continue
+
+                file_path = next(paths, None)
+                if file_path is None:
+                    break
+                if pool is None or (recycle_after and submitted >= recycle_after * workers):
+                    if pool is not None:
+                        # Already queued files still finish on the old workers
+                        pool.shutdown(wait=False)
+                    pool = ProcessPoolExecutor(workers, initializer=_init_batch_worker, initargs=(parser,))
+                    submitted = 0
+                pending[pool.submit(_parse_file_task, file_path, timeout)] = (file_path, 0, pool)
+                submitted += 1
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path, attempt, future_pool = pending.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    if future_pool is pool:
+                        pool.shutdown(wait=False)
+                        pool = None
+                    if attempt == 0:
+                        retries.append(file_path)
+                        continue
+                    result = {
+                        'success': False,
+                        'error': 'Parser process crashed',
+                        'reason': 'crashed'
+                    }
+                except Exception as e:
+                    result = {
+                        'success': False,
+                        'error': f'Error parsing resume: {str(e)}'
+                    }
+                yield file_path, result
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+class ParserWorker:
+    """
+    Long-lived parser that keeps one ResumeParser warm between uploads.
+
+    Requests are line-delimited JSON objects:
+        {"id": 1, "action": "parse", "file": "/uploads/resume.pdf"}
+
+    Each request gets exactly one JSON line back, echoing the request id.
+    The PDF library is imported by the first PDF request and reused
+    afterwards.
+    """
+
+    ACTIONS = ('parse', 'ping')
+
+    def __init__(self, parser=None, timeout=None):
+        self.parser = parser or ResumeParser()
+        self.timeout = timeout
+
+    def handle(self, request):
+        """Handle a single request and return the response payload."""
+        request_id = request.get('id')
+        try:
+            action = request.get('action', 'parse')
+            if action not in self.ACTIONS:
+                raise ValueError(f'Unknown action: {action}')
+
+            if action == 'ping':
+                response = {'success': True}
+            else:
+                response = parse_file(self.parser, request.get('file'), self.timeout)
+        except Exception as e:
+            response = {'success': False, 'error': str(e)}
+
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    def handle_line(self, line):
+        """Decode one request line and return the encoded response line."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('Request must be a JSON object')
+        except ValueError as e:
+            return json.dumps({'success': False, 'error': f'Invalid request: {e}'})
+        return json.dumps(self.handle(request))
+
+    def serve_stream(self, in_stream, out_stream):
+        """Answer requests from a text stream until EOF."""
+        for line in in_stream:
+            response = self.handle_line(line)
+            if response is not None:
+                out_stream.write(response + '\n')
+                out_stream.flush()
+
+    def serve_socket(self, socket_path):
+        """Answer requests on a Unix domain socket, one connection at a time."""
+        import socketserver
+
+        worker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    response = worker.handle_line(raw.decode('utf-8'))
+                    if response is not None:
+                        self.wfile.write((response + '\n').encode('utf-8'))
+                        self.wfile.flush()
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        with socketserver.UnixStreamServer(socket_path, Handler) as server:
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+
+
+def run_batch(args, parser):
+    """Stream one JSON line per file as each finishes."""
+    paths = iter_batch_paths(args.batch)
+    for file_path, result in parse_batch(paths, parser, args.workers, args.timeout, args.recycle_after):
+        print(json.dumps({'file': file_path, **result}), flush=True)
+
 
 def main():
-    if len(sys.argv) < 2:
+    arg_parser = argparse.ArgumentParser(description='Resume Parser')
+    arg_parser.add_argument('file_path', nargs='?', help='Resume file (PDF or DOCX)')
+    arg_parser.add_argument('--batch', nargs='+', metavar='SOURCE',
+                            help="Parse many resumes: directories, files, glob patterns, "
+                                 "or '-' for paths on stdin; prints one JSON line per file")
+    arg_parser.add_argument('--serve', action='store_true',
+                            help='Run as a long-lived parser answering JSON line requests')
+    arg_parser.add_argument('--socket', type=str,
+                            help='Unix socket path to listen on in --serve mode (default: stdin/stdout)')
+    arg_parser.add_argument('--workers', type=int, default=None,
+                            help='Batch worker processes (default: CPU count)')
+    arg_parser.add_argument('--timeout', type=float, default=60.0,
+                            help='Per-file time limit in seconds for batch and serve modes (0 for none)')
+    arg_parser.add_argument('--skills-seed', default=os.environ.get('RESUME_SKILLS_SEED'),
+                            help='Skills seeder (001_skills.js) whose skills extend the built-in list')
+    arg_parser.add_argument('--max-pages', type=int, default=None,
+                            help='Read at most this many PDF pages')
+    arg_parser.add_argument('--max-chars', type=int, default=None,
+                            help='Stop reading a PDF once this many characters are extracted')
+    arg_parser.add_argument('--pdf-workers', type=int, default=1,
+                            help='Processes to spread the pages of long PDFs across (single and serve modes)')
+    arg_parser.add_argument('--memory-limit', type=float, default=None,
+                            help='Address space limit in MB for the process parsing a document')
+    arg_parser.add_argument('--cpu-limit', type=float, default=None,
+                            help='CPU seconds allowed per document')
+    arg_parser.add_argument('--page-limit', type=int, default=None,
+                            help='Reject PDFs with more pages than this')
+    arg_parser.add_argument('--decompressed-limit', type=float, default=None,
+                            help='Reject DOCX files whose document XML inflates past this many MB')
+    arg_parser.add_argument('--recycle-after', type=int, default=100,
+                            help='Replace batch workers after this many documents each (0 never)')
+    arg_parser.add_argument('--cache-dir', default=os.environ.get('RESUME_CACHE_DIR'),
+                            help='Directory for cached parse results keyed by file content')
+    arg_parser.add_argument('--cache-size', type=int, default=256,
+                            help='Cache size limit in MB (default: 256)')
+    args = arg_parser.parse_args()
+
+    skills = None
+    if args.skills_seed:
+        skills = merge_skills(COMMON_SKILLS, load_seed_skills(args.skills_seed))
+
+    cache = None
+    if args.cache_dir:
+        cache = ParseCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    limits = None
+    if any(value is not None for value in (args.memory_limit, args.cpu_limit,
+                                           args.page_limit, args.decompressed_limit)):
+        limits = ResourceLimits(args.memory_limit, args.cpu_limit, args.page_limit, args.decompressed_limit)
+
+    parser = ResumeParser(skills, cache, args.max_pages, args.max_chars, args.pdf_workers, limits)
+
+    if args.batch:
+        run_batch(args, parser)
+        return
+
+    if args.serve:
+        worker = ParserWorker(parser, args.timeout)
+        if args.socket:
+            worker.serve_socket(args.socket)
+        else:
+            worker.serve_stream(sys.stdin, sys.stdout)
+        return
+
+    if not args.file_path:
         print(json.dumps({
             'success': False,
             'error': 'No file path provided'
         }))
         sys.exit(1)
 
-    file_path = sys.argv[1]
+    file_path = args.file_path
 
     if not os.path.exists(file_path):
         print(json.dumps({
@@ -386,7 +1465,6 @@ def main():
         }))
         sys.exit(1)
 
-    parser = ResumeParser()
     result = parser.parse(file_path)
 
     print(json.dumps(result))
@@ -0,0 +1,65 @@
+"""Decompressed-size budget for DOCX archives."""
+
+import zipfile
+
+import pytest
+
+from resume_parser import ResourceLimitExceeded, ResourceLimits, ResumeParser, extract_docx_text
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+# Compresses to a few KB but inflates to 64 MB
+BOMB_PADDING = ' ' * (64 * 1024 * 1024)
+
+
+def document_xml(paragraphs):
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    return f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+
+
+def write_docx(path, rels=RELS, document=None):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('_rels/.rels', rels)
+        archive.writestr('word/document.xml', document or document_xml(['Jane Doe', 'Python developer']))
+    return str(path)
+
+
+@pytest.fixture
+def bombed_rels(tmp_path):
+    # Whitespace before the relationship keeps the part valid XML
+    return write_docx(tmp_path / 'bomb.docx', rels=RELS.replace('<Relationship ', BOMB_PADDING + '<Relationship '))
+
+
+def test_small_document_within_budget(tmp_path):
+    path = write_docx(tmp_path / 'ok.docx')
+    assert extract_docx_text(path, 1024 * 1024) == extract_docx_text(path) == 'Jane Doe\nPython developer\n'
+
+
+def test_bombed_rels_is_rejected(bombed_rels):
+    with pytest.raises(ResourceLimitExceeded) as info:
+        extract_docx_text(bombed_rels, 1024 * 1024)
+    assert info.value.reason == 'decompressed_size'
+
+
+def test_rels_and_document_share_one_budget(tmp_path):
+    padding = ' ' * (600 * 1024)
+    path = write_docx(
+        tmp_path / 'both.docx',
+        rels=RELS.replace('<Relationship ', padding + '<Relationship '),
+        document=document_xml(['x' * (600 * 1024)]),
+    )
+    assert extract_docx_text(path, 2 * 1024 * 1024)
+    with pytest.raises(ResourceLimitExceeded):
+        extract_docx_text(path, 1024 * 1024)
+
+
+def test_parser_reports_bombed_rels(bombed_rels):
+    result = ResumeParser(limits=ResourceLimits(max_decompressed_mb=1)).parse(bombed_rels)
+    assert result['success'] is False
+    assert result['reason'] == 'decompressed_size'
@@ -0,0 +1,101 @@
+"""ParseCache hits must match uncached parses and respect the cache keys."""
+
+import os
+import zipfile
+
+import pytest
+
+from resume_parser import ParseCache, ResumeParser
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+RELS = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+    'relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+PARAGRAPHS = [
+    'Jane Doe', 'jane.doe@example.com', '(555) 123-4567',
+    'Senior software engineer with Python, Django, Docker and AWS.',
+    'Experience', 'Staff Engineer at Acme 2019 - Present',
+    'Education', 'B.S. Computer Science, State University',
+]
+
+
+def write_docx(path, paragraphs=PARAGRAPHS):
+    body = ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    document = (f'<?xml version="1.0" encoding="UTF-8"?>'
+                f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('_rels/.rels', RELS)
+        archive.writestr('word/document.xml', document)
+    return str(path)
+
+
+@pytest.fixture
+def resume(tmp_path):
+    return write_docx(tmp_path / 'resume.docx')
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParseCache(str(tmp_path / 'cache'))
+
+
+def no_extraction(monkeypatch):
+    def extract_text(self, file_path):
+        raise AssertionError('text was extracted again')
+    monkeypatch.setattr(ResumeParser, 'extract_text', extract_text)
+
+
+def test_hit_matches_uncached_parse(resume, cache, monkeypatch):
+    expected = ResumeParser().parse(resume)
+    assert expected['success']
+    assert ResumeParser(cache=cache).parse(resume) == expected
+
+    no_extraction(monkeypatch)
+    assert ResumeParser(cache=cache).parse(resume) == expected
+
+
+def test_other_skills_reuse_cached_text(resume, cache, monkeypatch):
+    ResumeParser(cache=cache).parse(resume)
+    skills = ['Python', 'Kubernetes']
+    expected = ResumeParser(skills=skills).parse(resume)
+
+    no_extraction(monkeypatch)
+    assert ResumeParser(skills=skills, cache=cache).parse(resume) == expected
+
+
+def test_other_text_budget_extracts_again(resume, cache):
+    ResumeParser(cache=cache).parse(resume)
+    parser = ResumeParser(cache=cache, max_chars=20)
+    assert parser.parse(resume) == ResumeParser(max_chars=20).parse(resume)
+    assert cache.get(cache.file_digest(resume))['text_key'] == parser.text_key
+
+
+def test_corrupt_entry_is_a_miss(resume, cache):
+    expected = ResumeParser(cache=cache).parse(resume)
+    path = cache._path(cache.file_digest(resume))
+    with open(path, 'w') as f:
+        f.write('{truncated')
+    assert ResumeParser(cache=cache).parse(resume) == expected
+    assert cache.get(cache.file_digest(resume))['result'] == expected
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / 'cache'))
+    entry = {'text': 'x' * 900}
+    digests = [f'{i:064x}' for i in range(30)]
+    for i, digest in enumerate(digests):
+        cache.put(digest, entry)
+        # Distinct mtimes regardless of the filesystem's timestamp resolution
+        os.utime(cache._path(digest), (i, i))
+    os.utime(cache._path(digests[0]), (100, 100))
+    cache.max_bytes = 10_000
+    cache.evict()
+
+    kept = [digest for digest in digests if cache.get(digest) is not None]
+    assert digests[0] in kept
+    assert kept[1:] == digests[-len(kept) + 1:]
+    assert sum(os.path.getsize(cache._path(digest)) for digest in kept) <= cache.max_bytes
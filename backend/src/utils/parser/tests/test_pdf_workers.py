@@ -0,0 +1,106 @@
+"""Parallel PDF page extraction, alone and under the serve-mode CPU budget."""
+
+import json
+import os
+import signal
+
+import pytest
+
+pytest.importorskip('pdfplumber')
+resource = pytest.importorskip('resource')
+
+from resume_parser import ParserWorker, ResourceLimits, ResumeParser
+
+PAGES = 12
+LINES_PER_PAGE = 16
+# Enough documents for the page workers to use more CPU than one budget
+REQUESTS = 25
+
+
+def write_pdf(path, lines, lines_per_page=LINES_PER_PAGE):
+    """Minimal uncompressed PDF with Helvetica text."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+    objects = [None, None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page_lines in pages:
+        text = ' T* '.join(f'({line}) Tj' for line in page_lines)
+        stream = f'BT /F1 10 Tf 13 TL 50 760 Td {text} ET'.encode('latin-1')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects))
+        page_ids.append(len(objects))
+    objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+        b' '.join(b'%d 0 R' % page_id for page_id in page_ids), len(page_ids))
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return str(path)
+
+
+@pytest.fixture(scope='module')
+def long_pdf(tmp_path_factory):
+    lines = ['Jane Doe', 'jane.doe@example.com', 'Senior Python developer with Docker and AWS']
+    lines += [f'Line {i} of the work history using SQL and React' for i in range(PAGES * LINES_PER_PAGE)]
+    return write_pdf(tmp_path_factory.mktemp('pdf') / 'long.pdf', lines)
+
+
+@pytest.fixture
+def parser():
+    parser = ResumeParser(pdf_workers=2, limits=ResourceLimits(cpu_seconds=2))
+    yield parser
+    if parser._page_pool is not None:
+        parser._page_pool.shutdown()
+
+
+def worker_cpu_limits(parser):
+    """Soft RLIMIT_CPU of each page worker, read from a task run in it."""
+    futures = [parser._page_pool.submit(resource.getrlimit, resource.RLIMIT_CPU) for _ in range(8)]
+    return {future.result()[0] for future in futures}
+
+
+def test_parallel_text_matches_serial(long_pdf, parser):
+    serial = ResumeParser()
+    assert parser.extract_text(long_pdf) == serial.extract_text(long_pdf)
+    assert parser.parse(long_pdf) == serial.parse(long_pdf)
+
+
+def test_page_workers_keep_unlowered_limits(long_pdf, parser):
+    original = resource.getrlimit(resource.RLIMIT_CPU)[0]
+    assert parser.parse(long_pdf)['success']
+    assert resource.getrlimit(resource.RLIMIT_CPU)[0] == original
+    assert worker_cpu_limits(parser) == {original}
+
+
+def test_serve_mode_with_cpu_limit_and_page_workers(long_pdf, parser):
+    worker = ParserWorker(parser)
+    requests = [json.dumps({'id': i, 'file': long_pdf}) for i in range(REQUESTS)]
+    responses = [json.loads(worker.handle_line(line)) for line in requests]
+
+    assert [response['id'] for response in responses] == list(range(REQUESTS))
+    assert all(response['success'] for response in responses)
+
+
+def test_broken_page_pool_is_replaced(long_pdf, parser):
+    worker = ParserWorker(parser)
+    assert worker.handle({'id': 1, 'file': long_pdf})['success']
+
+    broken_pool = parser._page_pool
+    for pid in list(broken_pool._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    crashed = worker.handle({'id': 2, 'file': long_pdf})
+    assert not crashed['success']
+    assert parser._page_pool is not broken_pool
+
+    recovered = worker.handle({'id': 3, 'file': long_pdf})
+    assert recovered['success']
+    assert recovered['data'] == worker.handle({'id': 4, 'file': long_pdf})['data']